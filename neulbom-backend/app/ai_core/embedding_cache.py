@@ -0,0 +1,371 @@
+"""
+임베딩 캐시
+- 키: (provider, model, is_query, 정규화된 텍스트의 sha256)
+- 1차: 메모리 LRU (float32 배열로 보관, 조회 시 리스트로 변환)
+- 2차: 디스크 (VECTOR_DB_PATH 아래 SQLite 파일, float32 바이너리 저장, 최대 행 수 초과 시 오래된 항목부터 삭제)
+- 검색 쿼리 전용: 메모리 LRU + TTL, 같은 쿼리의 동시 요청은 한 번만 계산 (QueryEmbeddingCache)
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from collections import OrderedDict
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+from app.core.config import settings
+from app.utils.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_embedding_text(text: str) -> str:
+    """캐시 키 계산용 텍스트 정규화 (연속 공백/개행을 공백 하나로)"""
+    return " ".join(text.split())
+
+
+def normalize_query_text(text: str) -> str:
+    """
+    검색 쿼리 정규화 (거의 같은 쿼리가 같은 임베딩을 쓰도록)
+    - 연속 공백 정리, 대소문자 통일, 끝의 문장 부호 제거 ("월세 지원?" → "월세 지원")
+    """
+    return normalize_embedding_text(text).casefold().rstrip(" .?!~")
+
+
+def resolve_embedding_model(provider: Optional[str], is_query: bool) -> Tuple[str, str]:
+    """실제로 호출될 (provider, model) 조합 반환"""
+    provider = provider or settings.EMBEDDING_PROVIDER
+    if provider == "gemini":
+        return provider, settings.GEMINI_EMBEDDING_MODEL
+    model = settings.EMBEDDING_QUERY_MODEL if is_query else settings.EMBEDDING_MODEL
+    return provider, model
+
+
+class EmbeddingCache:
+    """메모리 LRU + 디스크 2단 임베딩 캐시"""
+
+    # 최대 행 수를 넘으면 이 비율만큼 더 지워서 정리 횟수를 줄임
+    DISK_PRUNE_SLACK = 0.1
+
+    def __init__(self, path: Optional[str] = None, memory_size: Optional[int] = None,
+                 disk_max_entries: Optional[int] = None):
+        """
+        path: 디스크 캐시 파일 경로 (None이면 VECTOR_DB_PATH/embedding_cache.sqlite)
+        memory_size: 메모리 LRU에 보관할 최대 항목 수
+        disk_max_entries: 디스크 캐시에 보관할 최대 행 수 (0이면 제한 없음)
+        """
+        self.path = path or settings.EMBEDDING_CACHE_PATH or os.path.join(
+            settings.VECTOR_DB_PATH, "embedding_cache.sqlite"
+        )
+        self.memory_size = memory_size if memory_size is not None else settings.EMBEDDING_CACHE_MEMORY_SIZE
+        self.disk_max_entries = (
+            disk_max_entries if disk_max_entries is not None else settings.EMBEDDING_CACHE_DISK_MAX_ENTRIES
+        )
+
+        # 리스트(원소마다 float 객체)보다 약 8배 작은 float32 배열로 보관
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "disk_evictions": 0,
+        }
+
+        # 디스크 캐시 초기화 (실패해도 메모리 캐시만으로 동작)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disk_rows = 0
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "key TEXT PRIMARY KEY, dimension INTEGER NOT NULL, vector BLOB NOT NULL)"
+            )
+            self._conn.commit()
+            self._disk_rows = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        except Exception as e:
+            logger.warning(f"디스크 임베딩 캐시를 열 수 없습니다 (메모리 캐시만 사용): {e}")
+            self._conn = None
+
+    @staticmethod
+    def make_key(text: str, is_query: bool = False, provider: Optional[str] = None) -> str:
+        """캐시 키 생성"""
+        provider, model = resolve_embedding_model(provider, is_query)
+        digest = hashlib.sha256(normalize_embedding_text(text).encode("utf-8")).hexdigest()
+        return f"{provider}:{model}:{int(is_query)}:{digest}"
+
+    def get(self, key: str) -> Optional[List[float]]:
+        """단건 조회 (메모리 → 디스크 순)"""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, List[float]]:
+        """여러 키 조회, 캐시에 있는 항목만 반환"""
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, List[float]] = {}
+
+        with self._lock:
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = vector.tolist()
+            self._stats["memory_hits"] += len(found)
+
+        remaining = [key for key in keys if key not in found]
+        if remaining and self._conn is not None:
+            disk_found = self._read_disk(remaining)
+            with self._lock:
+                for key, vector in disk_found.items():
+                    self._remember(key, vector)
+                self._stats["disk_hits"] += len(disk_found)
+            found.update((key, vector.tolist()) for key, vector in disk_found.items())
+
+        with self._lock:
+            self._stats["misses"] += len(keys) - len(found)
+
+        return found
+
+    def put(self, key: str, vector: List[float]):
+        """단건 저장"""
+        self.put_many([(key, vector)])
+
+    def put_many(self, items: Iterable[Tuple[str, List[float]]]):
+        """여러 항목 저장 (메모리와 디스크 모두)"""
+        items = list(items)
+        if not items:
+            return
+
+        arrays = [(key, np.asarray(vector, dtype=np.float32)) for key, vector in items]
+        with self._lock:
+            for key, array in arrays:
+                self._remember(key, array)
+            self._stats["writes"] += len(items)
+
+        if self._conn is None:
+            return
+
+        rows = [(key, len(array), array.tobytes()) for key, array in arrays]
+        try:
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, dimension, vector) VALUES (?, ?, ?)",
+                    rows
+                )
+                self._disk_rows += len(rows)
+                if self.disk_max_entries > 0 and self._disk_rows > self.disk_max_entries:
+                    self._prune_disk()
+                self._conn.commit()
+        except Exception as e:
+            logger.warning(f"디스크 임베딩 캐시 저장 실패: {e}")
+
+    def get_stats(self) -> Dict:
+        """캐시 적중/미스 통계"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+            stats["disk_entries"] = self._disk_rows
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["memory_hits"] + stats["disk_hits"]) / lookups, 4) if lookups else 0.0
+        stats["disk_enabled"] = self._conn is not None
+        return stats
+
+    def _remember(self, key: str, vector: np.ndarray):
+        """메모리 LRU에 저장 (호출 측에서 lock 보유)"""
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _prune_disk(self):
+        """
+        디스크 캐시가 최대 행 수를 넘으면 오래 전에 저장된 항목부터 삭제 (호출 측에서 lock 보유)
+        - INSERT OR REPLACE는 새 rowid를 받으므로 rowid 순서가 저장 순서
+        """
+        # _disk_rows는 교체된 키도 더해진 추정치이므로 실제 행 수로 다시 확인
+        self._disk_rows = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        excess = self._disk_rows - self.disk_max_entries
+        if excess <= 0:
+            return
+        excess += int(self.disk_max_entries * self.DISK_PRUNE_SLACK)
+        cursor = self._conn.execute(
+            "DELETE FROM embeddings WHERE rowid IN (SELECT rowid FROM embeddings ORDER BY rowid LIMIT ?)",
+            (excess,)
+        )
+        self._disk_rows -= cursor.rowcount
+        self._stats["disk_evictions"] += cursor.rowcount
+        logger.info(f"디스크 임베딩 캐시 정리: {cursor.rowcount}개 삭제 (남은 항목 {self._disk_rows}개)")
+
+    def _read_disk(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        """디스크 캐시에서 여러 키 조회 (float32 배열)"""
+        found: Dict[str, np.ndarray] = {}
+        try:
+            with self._lock:
+                # SQLite 바인딩 변수 개수 제한을 고려해 나누어 조회
+                for start in range(0, len(keys), 500):
+                    chunk = keys[start:start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor = self._conn.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                        chunk
+                    )
+                    for key, blob in cursor.fetchall():
+                        found[key] = np.frombuffer(blob, dtype=np.float32)
+        except Exception as e:
+            logger.warning(f"디스크 임베딩 캐시 조회 실패: {e}")
+        return found
+
+
+# 전역 임베딩 캐시 인스턴스
+_embedding_cache: Optional[EmbeddingCache] = None
+_embedding_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """임베딩 캐시 싱글톤 인스턴스를 반환합니다. (비활성화 시 None)"""
+    global _embedding_cache
+    if not settings.EMBEDDING_CACHE_ENABLED:
+        return None
+    if _embedding_cache is None:
+        with _embedding_cache_lock:
+            if _embedding_cache is None:
+                _embedding_cache = EmbeddingCache()
+    return _embedding_cache
+
+
+class QueryEmbeddingCache:
+    """
+    검색 쿼리 임베딩 메모리 LRU + TTL 캐시
+    - 인기 검색어/추천 검색어처럼 여러 사용자가 같은 쿼리를 보내도 API는 한 번만 호출
+    - 캐시에 없는 같은 쿼리가 동시에 들어오면 SingleFlight로 합쳐서 한 번만 계산
+    """
+
+    def __init__(self, max_size: Optional[int] = None, ttl_seconds: Optional[float] = None):
+        """
+        max_size: 보관할 최대 쿼리 수
+        ttl_seconds: 항목 유지 시간 (지나면 다시 계산)
+        """
+        self.max_size = max_size if max_size is not None else settings.QUERY_EMBEDDING_CACHE_SIZE
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.QUERY_EMBEDDING_CACHE_TTL_SECONDS
+
+        # {키: (저장 시각, float32 벡터)} (EmbeddingCache와 같이 리스트 대신 배열로 보관)
+        self._entries: "OrderedDict[str, Tuple[float, np.ndarray]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._flight = SingleFlight()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "expired": 0,
+            "batch_computed": 0,
+        }
+
+    @staticmethod
+    def make_key(query: str, provider: Optional[str] = None) -> str:
+        """캐시 키 생성 (정규화된 쿼리 그대로 사용)"""
+        provider, model = resolve_embedding_model(provider, is_query=True)
+        return f"{provider}:{model}:{normalize_query_text(query)}"
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], List[float]],
+        cacheable: Callable[[List[float]], bool] = bool
+    ) -> List[float]:
+        """
+        캐시에 있으면 반환, 없으면 compute()로 계산하여 저장
+        - 같은 키를 계산 중인 요청이 있으면 그 결과를 기다려 공유
+        - cacheable(벡터)가 False인 결과(API 실패 시 더미 벡터 등)는 저장하지 않음
+        """
+        vector = self._get(key)
+        if vector is not None:
+            return vector
+
+        def load() -> List[float]:
+            vector = compute()
+            if cacheable(vector):
+                self._put(key, vector)
+            return vector
+
+        return self._flight.do(key, load)
+
+    def get_many_or_compute(
+        self,
+        keys: List[str],
+        compute: Callable[[List[str]], List[Optional[List[float]]]],
+        cacheable: Callable[[List[float]], bool] = bool
+    ) -> List[Optional[List[float]]]:
+        """
+        여러 키를 한 번에 조회, 없는 키만 중복 없이 모아 compute(키 리스트)를 한 번 호출하여 저장
+        - compute는 받은 키 순서대로 벡터 리스트를 반환해야 함 (실패 항목은 None)
+        - 반환: 키 순서대로 벡터 리스트
+        """
+        found = {key: self._get(key) for key in dict.fromkeys(keys)}
+        missing = [key for key, vector in found.items() if vector is None]
+        if missing:
+            vectors = compute(missing)
+            with self._lock:
+                self._stats["batch_computed"] += len(missing)
+            for key, vector in zip(missing, vectors):
+                found[key] = vector
+                if cacheable(vector):
+                    self._put(key, vector)
+        return [found[key] for key in keys]
+
+    def get_stats(self) -> Dict:
+        """적중/미스/만료 수, API 계산 수(단건/묶음)와 합쳐진 동시 요청 수"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        flight = self._flight.get_stats()
+        stats["computed"] = flight["calls"]
+        stats["coalesced"] = flight["coalesced"]
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        return stats
+
+    def _get(self, key: str) -> Optional[List[float]]:
+        """유효한 항목 조회 (만료된 항목은 삭제)"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] >= self.ttl_seconds:
+                del self._entries[key]
+                self._stats["expired"] += 1
+                entry = None
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry[1].tolist()
+
+    def _put(self, key: str, vector: List[float]):
+        """항목 저장 (LRU 순서 갱신, 초과분 제거)"""
+        array = np.asarray(vector, dtype=np.float32)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), array)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+# 전역 쿼리 임베딩 캐시 인스턴스
+_query_embedding_cache: Optional[QueryEmbeddingCache] = None
+
+
+def get_query_embedding_cache() -> Optional[QueryEmbeddingCache]:
+    """쿼리 임베딩 캐시 싱글톤 인스턴스를 반환합니다. (QUERY_EMBEDDING_CACHE_SIZE가 0이면 None)"""
+    global _query_embedding_cache
+    if settings.QUERY_EMBEDDING_CACHE_SIZE <= 0:
+        return None
+    if _query_embedding_cache is None:
+        with _embedding_cache_lock:
+            if _query_embedding_cache is None:
+                _query_embedding_cache = QueryEmbeddingCache()
+    return _query_embedding_cache
@@ -0,0 +1,92 @@
+"""
+LLM/임베딩 API 호출용 공유 HTTP 클라이언트
+- httpx 연결 풀 재사용 (keep-alive): 호출마다 TCP/TLS 연결을 새로 맺지 않음
+- 동기 클라이언트(기존 호출 경로, 스레드 풀)와 비동기 클라이언트(await 경로)를 각각 프로세스당 하나씩 사용
+- 호출별 timeout 지정 (연결 수립 timeout은 공통 설정)
+"""
+
+from typing import Dict, Optional
+import asyncio
+import logging
+import threading
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _pool_limits() -> httpx.Limits:
+    """연결 풀 크기 설정"""
+    return httpx.Limits(
+        max_connections=settings.LLM_HTTP_POOL_SIZE,
+        max_keepalive_connections=settings.LLM_HTTP_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS
+    )
+
+
+def request_timeout(seconds: float) -> httpx.Timeout:
+    """
+    호출별 timeout
+    - seconds: 응답 읽기/쓰기/풀 대기 시간 (스트리밍은 조각 사이 대기 시간)
+    - 연결 수립은 LLM_HTTP_CONNECT_TIMEOUT_SECONDS (seconds보다 길지 않게)
+    """
+    return httpx.Timeout(seconds, connect=min(settings.LLM_HTTP_CONNECT_TIMEOUT_SECONDS, seconds))
+
+
+# 전역 클라이언트 인스턴스
+_http_client: Optional[httpx.Client] = None
+# 비동기 클라이언트는 만든 이벤트 루프에서만 사용할 수 있으므로 루프와 함께 보관
+_async_http_client: Optional[httpx.AsyncClient] = None
+_async_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """동기 HTTP 클라이언트 싱글톤 인스턴스를 반환합니다. (스레드 간 공유)"""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(limits=_pool_limits(), timeout=request_timeout(settings.LLM_CHAT_TIMEOUT_SECONDS))
+    return _http_client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    비동기 HTTP 클라이언트 싱글톤 인스턴스를 반환합니다. (실행 중인 이벤트 루프 안에서 호출)
+    - 다른 이벤트 루프에서 호출되면 그 루프용으로 새로 만듦 (이전 클라이언트는 버림)
+    """
+    global _async_http_client, _async_http_client_loop
+    loop = asyncio.get_running_loop()
+    if _async_http_client is None or _async_http_client_loop is not loop:
+        with _http_client_lock:
+            if _async_http_client is None or _async_http_client_loop is not loop:
+                if _async_http_client is not None:
+                    logger.warning("이벤트 루프가 바뀌어 비동기 HTTP 클라이언트를 새로 만듭니다.")
+                _async_http_client = httpx.AsyncClient(limits=_pool_limits(), timeout=request_timeout(settings.LLM_CHAT_TIMEOUT_SECONDS))
+                _async_http_client_loop = loop
+    return _async_http_client
+
+
+async def close_http_clients():
+    """동기/비동기 클라이언트의 연결 풀 정리 (서버 종료 시 호출)"""
+    global _http_client, _async_http_client, _async_http_client_loop
+    with _http_client_lock:
+        sync_client, async_client, async_loop = _http_client, _async_http_client, _async_http_client_loop
+        _http_client = _async_http_client = _async_http_client_loop = None
+    if sync_client is not None:
+        sync_client.close()
+    if async_client is not None and async_loop is asyncio.get_running_loop():
+        await async_client.aclose()
+
+
+def get_http_client_stats() -> Dict:
+    """연결 풀 설정과 클라이언트 생성 여부"""
+    return {
+        "pool_size": settings.LLM_HTTP_POOL_SIZE,
+        "keepalive_connections": settings.LLM_HTTP_KEEPALIVE_CONNECTIONS,
+        "sync_client": _http_client is not None,
+        "async_client": _async_http_client is not None,
+    }
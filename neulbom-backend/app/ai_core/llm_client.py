@@ -1,8 +1,21 @@
-from typing import Optional, List, Dict
-import requests
+from typing import Optional, List, Dict, AsyncIterator, Tuple
+import asyncio
 import json
 import logging
+import re
+import time
 from app.core.config import settings
+from app.ai_core.prompts import TURN_ANALYSIS_PROMPT, TURN_ANALYSIS_SYSTEM_PROMPT
+from app.ai_core.http_client import get_http_client, get_async_http_client, request_timeout
+from app.ai_core.resilience import (
+    ProviderError,
+    aacquire_rate_limit,
+    call_with_retry,
+    acall_with_retry,
+    get_circuit_breaker,
+    http_status_error,
+    transport_error
+)
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +28,27 @@ except ImportError:
 
 # Upstage API 설정은 config.py에서 가져옴
 
+# 챗봇 응답 제공자 (장애 시 서로 전환)
+LLM_PROVIDERS = ("upstage", "gemini")
+
+# 감정 분석 요청 시스템 프롬프트
+SENTIMENT_SYSTEM_PROMPT = "당신은 감정 분석 전문가입니다."
+
+# 대화 턴 분석 (결과 JSON만 받으므로 출력 토큰을 짧게 제한)
+TURN_ANALYSIS_MAX_TOKENS = 120
+TURN_CRISIS_LEVELS = ("none", "low", "medium", "high")
+
+# Upstage 스트리밍 종료 표시 ("data: [DONE]")
+_STREAM_DONE = object()
+
+# Gemini 생성 파라미터 (일반/스트리밍/비동기 공통)
+GEMINI_GENERATION_CONFIG = {
+    "temperature": 0.8,  # 더 다양한 응답
+    "top_p": 0.9,
+    "top_k": 40,
+    "max_output_tokens": 1000,
+}
+
 
 class LLMClient:
     """LLM API 호출 래퍼 클래스 (Gemini, Upstage 지원)"""
@@ -54,139 +88,187 @@ class LLMClient:
         message: str,
         history: List[Dict],
         system_prompt: str,
-        provider: Optional[str] = None
+        provider: Optional[str] = None,
+        max_tokens: Optional[int] = None
     ) -> str:
         """
         챗봇 응답 생성
         - provider: "gemini" 또는 "upstage" (None이면 기본값 사용)
+        - max_tokens: 최대 생성 토큰 수 (None이면 기본값 1000)
+        - 일시적 오류는 재시도, 실패하거나 서킷 브레이커가 열려 있으면 다른 제공자로 전환
+        - 모든 제공자가 실패하면 기본 응답
         """
         provider = provider or self.default_provider
         logger.info(f"LLM 응답 생성 시작: provider={provider}, message_length={len(message)}, history_count={len(history)}")
         
-        if provider == "gemini":
-            return self._generate_with_gemini(message, history, system_prompt)
-        elif provider == "upstage":
-            return self._generate_with_upstage(message, history, system_prompt)
-        else:
+        for candidate in self._provider_order(provider):
+            generate = self._generate_with_gemini if candidate == "gemini" else self._generate_with_upstage
+            try:
+                return call_with_retry(f"{candidate}:chat", generate, message, history, system_prompt, max_tokens)
+            except ProviderError as e:
+                logger.warning(f"{candidate} 응답 생성 실패: {e}")
+        return self._fallback_response(message)
+    
+    def _provider_order(self, provider: str) -> List[str]:
+        """호출할 제공자 순서 (요청한 제공자 다음에 설정된 다른 제공자)"""
+        if provider not in LLM_PROVIDERS:
             raise ValueError(f"지원하지 않는 provider: {provider}")
+        order = [provider]
+        if settings.LLM_FAILOVER_ENABLED:
+            order += [other for other in LLM_PROVIDERS if other != provider and self._is_provider_configured(other)]
+        return order
+    
+    def _is_provider_configured(self, provider: str) -> bool:
+        """API 키/모델이 준비된 제공자인지"""
+        if provider == "gemini":
+            return self.gemini_model is not None
+        return bool(self.upstage_api_key)
     
     def _generate_with_gemini(
         self,
         message: str,
         history: List[Dict],
-        system_prompt: str
+        system_prompt: str,
+        max_tokens: Optional[int] = None
     ) -> str:
-        """Gemini API를 사용한 응답 생성"""
+        """Gemini API를 사용한 응답 생성 (실패 시 ProviderError)"""
         if not self.gemini_model:
-            logger.warning("Gemini 모델이 초기화되지 않았습니다.")
-            return self._fallback_response(message)
+            raise ProviderError("Gemini 모델이 초기화되지 않았습니다.")
         
         try:
-            # 시스템 프롬프트와 히스토리를 포함한 전체 프롬프트 구성
-            full_prompt_parts = [system_prompt]
-            
-            # 히스토리 추가
-            for h in history:
-                role = h.get("role", "user")
-                content = h.get("content", "")
-                if role == "user":
-                    full_prompt_parts.append(f"사용자: {content}")
-                elif role == "assistant":
-                    full_prompt_parts.append(f"늘봄: {content}")
-            
-            # 현재 메시지 추가
-            full_prompt_parts.append(f"사용자: {message}")
-            full_prompt_parts.append("늘봄:")
-            
-            full_prompt = "\n\n".join(full_prompt_parts)
-            
             # API 호출 (temperature 등 파라미터는 모델 생성 시 설정)
             response = self.gemini_model.generate_content(
-                full_prompt,
-                generation_config={
-                    "temperature": 0.8,  # 더 다양한 응답
-                    "top_p": 0.9,
-                    "top_k": 40,
-                    "max_output_tokens": 1000,
-                }
+                self._build_gemini_prompt(message, history, system_prompt),
+                generation_config=self._gemini_generation_config(max_tokens)
             )
-            
             reply = response.text.strip()
-            logger.debug(f"Gemini 응답 생성 성공: {len(reply)}자")
-            return reply
-            
         except Exception as e:
-            logger.error(f"Gemini API 오류: {e}", exc_info=True)
-            return self._fallback_response(message)
+            raise transport_error(e, "Gemini API 오류")
+        
+        logger.debug(f"Gemini 응답 생성 성공: {len(reply)}자")
+        return reply
     
     def _generate_with_upstage(
         self,
         message: str,
         history: List[Dict],
-        system_prompt: str
+        system_prompt: str,
+        max_tokens: Optional[int] = None
     ) -> str:
-        """Upstage API를 사용한 응답 생성"""
+        """Upstage API를 사용한 응답 생성 (실패 시 ProviderError)"""
         if not self.upstage_api_key:
-            logger.warning("Upstage API 키가 설정되지 않았습니다.")
-            return self._fallback_response(message)
+            raise ProviderError("Upstage API 키가 설정되지 않았습니다.")
+        
+        headers, data = self._build_upstage_request(message, history, system_prompt, max_tokens)
+        
+        # API 호출 (공유 연결 풀 사용)
+        response = get_http_client().post(
+            settings.UPSTAGE_API_URL,
+            headers=headers,
+            json=data,
+            timeout=request_timeout(settings.LLM_CHAT_TIMEOUT_SECONDS)
+        )
+        return self._parse_upstage_chat_response(response, data)
+    
+    def _parse_upstage_chat_response(self, response, data: Dict) -> str:
+        """Upstage 채팅 API 응답에서 답변 추출 (실패 시 ProviderError)"""
+        if response.status_code != 200:
+            logger.error(f"요청 데이터: model={data.get('model')}, messages_count={len(data.get('messages', []))}")
+            raise http_status_error(response, "Upstage API 오류")
+        
+        result = response.json()
+        if "choices" in result and len(result["choices"]) > 0:
+            reply = result["choices"][0]["message"]["content"].strip()
+            logger.info(f"Upstage API 응답 성공: {len(reply)}자, 응답 시작: {reply[:50]}...")
+            return reply
+        raise ProviderError(f"Upstage API 응답 형식 오류: {str(result)[:200]}")
+    
+    def _build_gemini_prompt(self, message: str, history: List[Dict], system_prompt: str) -> str:
+        """시스템 프롬프트와 히스토리를 포함한 Gemini 전체 프롬프트 구성"""
+        full_prompt_parts = [system_prompt]
+        
+        # 히스토리 추가
+        for h in history:
+            role = h.get("role", "user")
+            content = h.get("content", "")
+            if role == "user":
+                full_prompt_parts.append(f"사용자: {content}")
+            elif role == "assistant":
+                full_prompt_parts.append(f"늘봄: {content}")
         
+        # 현재 메시지 추가
+        full_prompt_parts.append(f"사용자: {message}")
+        full_prompt_parts.append("늘봄:")
+        
+        return "\n\n".join(full_prompt_parts)
+    
+    @staticmethod
+    def _gemini_generation_config(max_tokens: Optional[int] = None) -> Dict:
+        """Gemini 생성 파라미터 (max_tokens가 있으면 최대 출력 토큰만 변경)"""
+        if max_tokens is None:
+            return GEMINI_GENERATION_CONFIG
+        return {**GEMINI_GENERATION_CONFIG, "max_output_tokens": max_tokens}
+    
+    def _build_upstage_request(
+        self,
+        message: str,
+        history: List[Dict],
+        system_prompt: str,
+        max_tokens: Optional[int] = None
+    ) -> Tuple[Dict, Dict]:
+        """Upstage 채팅 API 요청 헤더와 본문 구성"""
+        # 메시지 포맷 변환
+        messages = [{"role": "system", "content": system_prompt}]
+        
+        # 히스토리 추가 (최근 20개만 사용하여 토큰 제한 고려)
+        recent_history = history[-20:] if len(history) > 20 else history
+        for h in recent_history:
+            role = h.get("role", "user")
+            content = h.get("content", "")
+            if role in ["user", "assistant"] and content.strip():
+                messages.append({"role": role, "content": content})
+        
+        # 현재 메시지 추가
+        messages.append({"role": "user", "content": message})
+        
+        logger.debug(f"Upstage API 호출: 히스토리 {len(recent_history)}개, 총 메시지 {len(messages)}개")
+        
+        headers = {
+            "Authorization": f"Bearer {self.upstage_api_key}",
+            "Content-Type": "application/json"
+        }
+        
+        data = {
+            "model": "solar-1-mini-chat",  # Upstage 모델명
+            "messages": messages,
+            "temperature": 0.8,  # 더 다양한 응답을 위해 temperature 증가
+            "max_tokens": max_tokens or 1000,
+            "top_p": 0.9,  # 다양성 증가
+            "frequency_penalty": 0.3,  # 반복 방지
+            "presence_penalty": 0.3  # 주제 다양성 증가
+        }
+        return headers, data
+    
+    @staticmethod
+    def _parse_upstage_stream_line(line: str):
+        """
+        Upstage 스트리밍 응답 한 줄 파싱
+        - 반환: 응답 조각, 종료 이벤트면 _STREAM_DONE, 건너뛸 줄이면 None
+        """
+        if not line or not line.startswith("data:"):
+            return None
+        payload = line[len("data:"):].strip()
+        if payload == "[DONE]":
+            return _STREAM_DONE
         try:
-            # 메시지 포맷 변환
-            messages = [{"role": "system", "content": system_prompt}]
-            
-            # 히스토리 추가 (최근 20개만 사용하여 토큰 제한 고려)
-            recent_history = history[-20:] if len(history) > 20 else history
-            for h in recent_history:
-                role = h.get("role", "user")
-                content = h.get("content", "")
-                if role in ["user", "assistant"] and content.strip():
-                    messages.append({"role": role, "content": content})
-            
-            # 현재 메시지 추가
-            messages.append({"role": "user", "content": message})
-            
-            logger.debug(f"Upstage API 호출: 히스토리 {len(recent_history)}개, 총 메시지 {len(messages)}개")
-            
-            # API 호출
-            headers = {
-                "Authorization": f"Bearer {self.upstage_api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            data = {
-                "model": "solar-1-mini-chat",  # Upstage 모델명
-                "messages": messages,
-                "temperature": 0.8,  # 더 다양한 응답을 위해 temperature 증가
-                "max_tokens": 1000,
-                "top_p": 0.9,  # 다양성 증가
-                "frequency_penalty": 0.3,  # 반복 방지
-                "presence_penalty": 0.3  # 주제 다양성 증가
-            }
-            
-            response = requests.post(
-                settings.UPSTAGE_API_URL,
-                headers=headers,
-                json=data,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                if "choices" in result and len(result["choices"]) > 0:
-                    reply = result["choices"][0]["message"]["content"].strip()
-                    logger.info(f"Upstage API 응답 성공: {len(reply)}자, 응답 시작: {reply[:50]}...")
-                    return reply
-                else:
-                    logger.error(f"Upstage API 응답 형식 오류: {result}")
-                    return self._fallback_response(message)
-            else:
-                error_text = response.text[:500] if hasattr(response, 'text') else str(response)
-                logger.error(f"Upstage API 오류: {response.status_code} - {error_text}")
-                logger.error(f"요청 데이터: model={data.get('model')}, messages_count={len(data.get('messages', []))}")
-                return self._fallback_response(message)
-        except Exception as e:
-            logger.error(f"Upstage API 오류: {e}", exc_info=True)
-            return self._fallback_response(message)
+            event = json.loads(payload)
+        except ValueError:
+            logger.debug(f"Upstage 스트리밍 이벤트 파싱 실패: {payload[:100]}")
+            return None
+        choices = event.get("choices") or []
+        if not choices:
+            return None
+        return (choices[0].get("delta") or {}).get("content") or ""
     
     def summarize_text(
         self,
@@ -226,36 +308,105 @@ class LLMClient:
         """
         provider = provider or self.default_provider
         
-        prompt = f"""다음 텍스트의 감정을 분석해주세요. 
+        try:
+            response = self.generate_chat_response(
+                message=self._sentiment_prompt(text),
+                history=[],
+                system_prompt=SENTIMENT_SYSTEM_PROMPT,
+                provider=provider
+            )
+            return self._parse_sentiment(response)
+        except Exception as e:
+            print(f"감정 분석 오류: {e}")
+            return {"sentiment": "neutral", "score": 0.5}
+    
+    @staticmethod
+    def _sentiment_prompt(text: str) -> str:
+        """감정 분석 요청 프롬프트"""
+        return f"""다음 텍스트의 감정을 분석해주세요. 
 긍정, 부정, 중립 중 하나로 분류하고, 감정 점수를 0.0(매우 부정)부터 1.0(매우 긍정)까지 숫자로 제공해주세요.
 
 텍스트: {text}
 
 응답 형식: JSON 형식으로 {{"sentiment": "긍정/부정/중립", "score": 0.0~1.0}}"""
-        
+    
+    @staticmethod
+    def _parse_sentiment(response: str) -> Dict:
+        """감정 분석 응답 파싱 (JSON이 아니면 텍스트에서 추출)"""
+        # JSON 파싱 시도
+        try:
+            result = json.loads(response)
+            return result
+        except:
+            # JSON이 아닌 경우 텍스트에서 추출
+            if "긍정" in response:
+                return {"sentiment": "positive", "score": 0.7}
+            elif "부정" in response:
+                return {"sentiment": "negative", "score": 0.3}
+            else:
+                return {"sentiment": "neutral", "score": 0.5}
+    
+    def analyze_turn(self, text: str, provider: Optional[str] = None) -> Dict:
+        """
+        대화 턴 분석: 위기 수준, 감정, 복지 정보 질문 여부를 LLM 1회 호출로 함께 판단
+        - 반환: {"crisis_level", "sentiment", "score", "welfare_intent", "source"}
+        - source가 "fallback"이면 호출/JSON 파싱 실패 (crisis_level, welfare_intent는 None, 감정은 응답 텍스트에서 추정)
+        """
         try:
             response = self.generate_chat_response(
-                message=prompt,
+                message=TURN_ANALYSIS_PROMPT.format(text=text),
                 history=[],
-                system_prompt="당신은 감정 분석 전문가입니다.",
-                provider=provider
+                system_prompt=TURN_ANALYSIS_SYSTEM_PROMPT,
+                provider=provider,
+                max_tokens=TURN_ANALYSIS_MAX_TOKENS
             )
-            
-            # JSON 파싱 시도
-            try:
-                result = json.loads(response)
-                return result
-            except:
-                # JSON이 아닌 경우 텍스트에서 추출
-                if "긍정" in response:
-                    return {"sentiment": "positive", "score": 0.7}
-                elif "부정" in response:
-                    return {"sentiment": "negative", "score": 0.3}
-                else:
-                    return {"sentiment": "neutral", "score": 0.5}
         except Exception as e:
-            print(f"감정 분석 오류: {e}")
-            return {"sentiment": "neutral", "score": 0.5}
+            logger.error(f"대화 턴 분석 오류: {e}")
+            response = ""
+        return self._parse_turn_analysis(response)
+    
+    @classmethod
+    def _parse_turn_analysis(cls, response: str) -> Dict:
+        """대화 턴 분석 응답 파싱 (응답 앞뒤의 설명/코드 블록은 무시하고 JSON 객체만 사용)"""
+        parsed = None
+        match = re.search(r"\{.*\}", response or "", re.DOTALL)
+        if match:
+            try:
+                parsed = json.loads(match.group(0))
+            except ValueError:
+                parsed = None
+        
+        if not isinstance(parsed, dict):
+            logger.warning(f"대화 턴 분석 응답을 파싱할 수 없습니다: {(response or '')[:100]}")
+            sentiment = cls._parse_sentiment(response or "")
+            return {
+                "crisis_level": None,
+                "sentiment": sentiment.get("sentiment", "neutral"),
+                "score": sentiment.get("score", 0.5),
+                "welfare_intent": None,
+                "source": "fallback",
+            }
+        
+        try:
+            score = min(1.0, max(0.0, float(parsed.get("score", 0.5))))
+        except (TypeError, ValueError):
+            score = 0.5
+        crisis_level = str(parsed.get("crisis_level", "none")).strip().lower()
+        if crisis_level not in TURN_CRISIS_LEVELS:
+            crisis_level = "none"
+        sentiment = str(parsed.get("sentiment", "neutral")).strip().lower()
+        sentiment = {"긍정": "positive", "부정": "negative", "중립": "neutral"}.get(sentiment, sentiment)
+        welfare_intent = parsed.get("welfare_intent", False)
+        if not isinstance(welfare_intent, bool):
+            welfare_intent = str(welfare_intent).strip().lower() in ("true", "yes", "1")
+        
+        return {
+            "crisis_level": crisis_level,
+            "sentiment": sentiment,
+            "score": score,
+            "welfare_intent": welfare_intent,
+            "source": "llm",
+        }
     
     def get_text_embedding(self, text: str, is_query: bool = False, provider: Optional[str] = None) -> List[float]:
         """
@@ -269,48 +420,176 @@ class LLMClient:
         if not text or not text.strip():
             return [0.0] * settings.EMBEDDING_DIMENSION
         
-        # 텍스트 정제 (개행 문자 제거)
-        text = text.replace("\n", " ").strip()
+        # 텍스트 정제 (개행 문자 제거, 입력 길이 제한)
+        text = self._prepare_embedding_text(text)
         
         # 프로바이더 선택
         provider = provider or settings.EMBEDDING_PROVIDER
         
         if provider == "gemini":
-            return self._get_embedding_gemini(text)
+            return self._get_embedding_gemini(text, is_query=is_query)
         else:  # upstage (기본값)
             return self._get_embedding_direct(text, is_query=is_query)
     
-    def _get_embedding_gemini(self, text: str) -> List[float]:
+    def get_text_embeddings(
+        self,
+        texts: List[str],
+        is_query: bool = False,
+        provider: Optional[str] = None
+    ) -> List[Optional[List[float]]]:
+        """
+        여러 텍스트를 한 번에 벡터로 변환 (대량 인덱싱용)
+        - 프로바이더의 요청당 입력 수/토큰 한도에 맞춰 묶어서 호출
+        - 반환 리스트의 순서는 입력 순서와 동일
+        - 임베딩에 실패한 항목은 None (빈 텍스트는 0 벡터)
+        
+        Args:
+            texts: 임베딩할 텍스트 리스트
+            is_query: True이면 쿼리 모델 사용, False이면 문서 모델 사용
+            provider: "upstage" 또는 "gemini" (None이면 설정값 사용)
+        """
+        results: List[Optional[List[float]]] = [None] * len(texts)
+        
+        # (원래 위치, 정제된 텍스트)
+        pending = []
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                results[i] = [0.0] * settings.EMBEDDING_DIMENSION
+            else:
+                pending.append((i, self._prepare_embedding_text(text)))
+        
+        if not pending:
+            return results
+        
+        provider = provider or settings.EMBEDDING_PROVIDER
+        
+        for batch in self._iter_embedding_batches(pending):
+            batch_texts = [text for _, text in batch]
+            if provider == "gemini":
+                vectors = self._get_embeddings_gemini(batch_texts, is_query=is_query)
+            else:  # upstage (기본값)
+                vectors = self._get_embeddings_direct(batch_texts, is_query=is_query)
+            
+            # 묶음 요청이 통째로 실패하면 한 건씩 다시 요청하여 실패 항목만 골라냄
+            if vectors is None and len(batch) > 1:
+                logger.warning(f"임베딩 묶음 요청 실패 ({len(batch)}개), 개별 요청으로 재시도합니다.")
+                vectors = []
+                for text in batch_texts:
+                    if provider == "gemini":
+                        single = self._get_embeddings_gemini([text], is_query=is_query)
+                    else:
+                        single = self._get_embeddings_direct([text], is_query=is_query)
+                    vectors.append(single[0] if single else None)
+            
+            if vectors is None:
+                vectors = [None] * len(batch)
+            
+            for (i, _), vector in zip(batch, vectors):
+                results[i] = vector
+        
+        failed = [i for i, vector in enumerate(results) if vector is None]
+        if failed:
+            logger.warning(f"임베딩 실패 항목 {len(failed)}/{len(texts)}개 (위치: {failed[:20]})")
+        
+        return results
+    
+    def _prepare_embedding_text(self, text: str) -> str:
+        """
+        임베딩 입력 정제 (개행 제거 및 입력 1개당 토큰 한도 적용)
+        - 단건/묶음 요청 공통, 한도를 넘는 입력은 앞부분만 사용 (잘린 경우 경고 로그)
+        """
+        text = text.replace("\n", " ").strip()
+        max_tokens = settings.EMBEDDING_MAX_INPUT_TOKENS
+        if self._estimate_tokens(text) > max_tokens:
+            logger.warning(
+                f"임베딩 입력이 EMBEDDING_MAX_INPUT_TOKENS({max_tokens})를 넘어 잘라서 전송합니다: "
+                f"{len(text)}자 → {max_tokens}자, 시작: {text[:30]}..."
+            )
+            text = text[:max_tokens]
+        return text
+    
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        """
+        토큰 수 추정
+        - 한글은 대략 글자당 1토큰 이하이므로 글자 수를 보수적인 상한으로 사용
+        """
+        return len(text)
+    
+    def _iter_embedding_batches(self, items: List[tuple]):
+        """요청당 입력 수/총 토큰 한도를 넘지 않도록 (위치, 텍스트) 목록을 묶음으로 분할"""
+        max_items = max(1, settings.EMBEDDING_BATCH_SIZE)
+        max_tokens = settings.EMBEDDING_BATCH_MAX_TOKENS
+        
+        batch = []
+        batch_tokens = 0
+        for item in items:
+            tokens = self._estimate_tokens(item[1])
+            if batch and (len(batch) >= max_items or batch_tokens + tokens > max_tokens):
+                yield batch
+                batch = []
+                batch_tokens = 0
+            batch.append(item)
+            batch_tokens += tokens
+        
+        if batch:
+            yield batch
+    
+    def _get_embedding_gemini(self, text: str, is_query: bool = False) -> List[float]:
         """
         Gemini API를 사용하여 임베딩 생성
         
         Args:
             text: 임베딩할 텍스트
+            is_query: True이면 검색 쿼리용 task_type 사용
         """
-        if not GEMINI_AVAILABLE:
-            logger.warning("google.generativeai 패키지가 설치되지 않았습니다. 더미 임베딩을 반환합니다.")
+        vectors = self._get_embeddings_gemini([text], is_query=is_query)
+        if not vectors or vectors[0] is None:
+            logger.warning("Gemini 임베딩 생성 실패. 더미 임베딩을 반환합니다.")
             return [0.0] * settings.EMBEDDING_DIMENSION
+        return vectors[0]
+    
+    def _get_embeddings_gemini(self, texts: List[str], is_query: bool = False) -> Optional[List[List[float]]]:
+        """
+        Gemini API로 여러 텍스트의 임베딩을 한 번에 생성
+        - 일시적 오류는 재시도, 서킷 브레이커가 열려 있으면 호출하지 않음
+        - 요청 자체가 실패하면 None 반환
+        """
+        if not GEMINI_AVAILABLE:
+            logger.warning("google.generativeai 패키지가 설치되지 않았습니다.")
+            return None
         
         if not self.gemini_api_key:
-            logger.warning("Gemini API 키가 설정되지 않았습니다. 더미 임베딩을 반환합니다.")
-            return [0.0] * settings.EMBEDDING_DIMENSION
+            logger.warning("Gemini API 키가 설정되지 않았습니다.")
+            return None
         
         try:
-            # Gemini 임베딩 API 호출
+            return call_with_retry("gemini:embedding", self._request_gemini_embeddings, texts, is_query)
+        except ProviderError as e:
+            logger.warning(f"Gemini Embedding API 오류: {e}")
+            return None
+    
+    def _request_gemini_embeddings(self, texts: List[str], is_query: bool) -> List[List[float]]:
+        """Gemini 임베딩 API 1회 호출 (실패 시 ProviderError)"""
+        try:
+            # Gemini 임베딩 API 호출 (content에 리스트를 넘기면 입력 순서대로 반환)
             result = genai.embed_content(
                 model=settings.GEMINI_EMBEDDING_MODEL,
-                content=text,
-                task_type="retrieval_document"  # 또는 "retrieval_query"
+                content=texts if len(texts) > 1 else texts[0],
+                task_type="retrieval_query" if is_query else "retrieval_document"
             )
-            
-            if result and "embedding" in result:
-                return result["embedding"]
-            else:
-                logger.warning(f"Gemini API 응답 형식을 파싱할 수 없습니다: {result}. 더미 임베딩을 반환합니다.")
-                return [0.0] * settings.EMBEDDING_DIMENSION
         except Exception as e:
-            logger.warning(f"Gemini Embedding API 오류: {e}. 더미 임베딩을 반환합니다.")
-            return [0.0] * settings.EMBEDDING_DIMENSION
+            raise transport_error(e, "Gemini Embedding API 오류")
+        
+        if not result or "embedding" not in result:
+            raise ProviderError(f"Gemini API 응답 형식을 파싱할 수 없습니다: {str(result)[:200]}")
+        
+        embeddings = result["embedding"]
+        if len(texts) == 1:
+            embeddings = [embeddings]
+        if len(embeddings) != len(texts):
+            raise ProviderError(f"Gemini 임베딩 개수 불일치: 요청 {len(texts)}개, 응답 {len(embeddings)}개")
+        return embeddings
     
     def _get_embedding_direct(self, text: str, is_query: bool = False) -> List[float]:
         """
@@ -320,54 +599,363 @@ class LLMClient:
             text: 임베딩할 텍스트
             is_query: True이면 쿼리 모델 사용, False이면 문서 모델 사용
         """
-        if not self.upstage_api_key:
-            logger.warning("Upstage API 키가 설정되지 않았습니다. 더미 임베딩을 반환합니다.")
+        vectors = self._get_embeddings_direct([text], is_query=is_query)
+        if not vectors or vectors[0] is None:
+            logger.warning("Upstage 임베딩 생성 실패. 더미 임베딩을 반환합니다.")
             return [0.0] * settings.EMBEDDING_DIMENSION
+        return vectors[0]
+    
+    def _get_embeddings_direct(self, texts: List[str], is_query: bool = False) -> Optional[List[List[float]]]:
+        """
+        Upstage API를 직접 호출하여 여러 텍스트의 임베딩을 한 번에 생성
+        - input에 배열을 넘기고, 응답의 index 필드로 입력 순서를 복원
+        - 일시적 오류는 재시도, 서킷 브레이커가 열려 있으면 호출하지 않음
+        - 요청 자체가 실패하면 None 반환
+        """
+        if not self.upstage_api_key:
+            logger.warning("Upstage API 키가 설정되지 않았습니다.")
+            return None
         
+        try:
+            return call_with_retry("upstage:embedding", self._request_upstage_embeddings, texts, is_query)
+        except ProviderError as e:
+            logger.warning(f"Upstage Embedding API 오류: {e}")
+            return None
+    
+    def _request_upstage_embeddings(self, texts: List[str], is_query: bool) -> List[List[float]]:
+        """Upstage 임베딩 API 1회 호출 (실패 시 ProviderError)"""
+        model, headers, data = self._build_upstage_embedding_request(texts, is_query=is_query)
+        response = get_http_client().post(
+            settings.UPSTAGE_EMBEDDING_API_URL,
+            headers=headers,
+            json=data,
+            timeout=request_timeout(settings.LLM_EMBEDDING_TIMEOUT_SECONDS)
+        )
+        return self._parse_upstage_embedding_response(response, texts, model)
+    
+    def _build_upstage_embedding_request(self, texts: List[str], is_query: bool = False) -> Tuple[str, Dict, Dict]:
+        """Upstage 임베딩 API 요청 구성 (모델명, 헤더, 본문)"""
         # 모델 선택: 쿼리면 query 모델, 문서면 passage 모델
         model = settings.EMBEDDING_QUERY_MODEL if is_query else settings.EMBEDDING_MODEL
         
+        headers = {
+            "Authorization": f"Bearer {self.upstage_api_key}",
+            "Content-Type": "application/json"
+        }
+        
+        data = {
+            "model": model,
+            "input": texts if len(texts) > 1 else texts[0]
+        }
+        return model, headers, data
+    
+    def _parse_upstage_embedding_response(self, response, texts: List[str], model: str) -> List[List[float]]:
+        """Upstage 임베딩 API 응답 검사 후 벡터 목록 추출 (실패 시 ProviderError)"""
+        if response.status_code != 200:
+            raise http_status_error(response, f"Upstage 임베딩 오류 (모델: {model}, 입력 수: {len(texts)})")
+        
+        embeddings = self._parse_upstage_embeddings(response.json())
+        if embeddings is None or len(embeddings) != len(texts):
+            raise ProviderError(f"Upstage API 응답을 파싱할 수 없습니다 (요청 {len(texts)}개)")
+        return embeddings
+    
+    @staticmethod
+    def _parse_upstage_embeddings(result) -> Optional[List[List[float]]]:
+        """Upstage 임베딩 응답에서 벡터 목록을 입력 순서대로 추출"""
+        if isinstance(result, dict) and "data" in result and len(result["data"]) > 0:
+            items = sorted(result["data"], key=lambda item: item.get("index", 0))
+            return [item["embedding"] for item in items]
+        elif isinstance(result, dict) and "embedding" in result:
+            return [result["embedding"]]
+        elif isinstance(result, list) and len(result) > 0 and "embedding" in result[0]:
+            return [item["embedding"] for item in result]
+        return None
+    
+    # 비동기 API (await 경로: 응답을 기다리는 동안 스레드를 점유하지 않음)
+    
+    async def agenerate_chat_response(
+        self,
+        message: str,
+        history: List[Dict],
+        system_prompt: str,
+        provider: Optional[str] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """generate_chat_response의 비동기 버전 (재시도/제공자 전환 동일)"""
+        provider = provider or self.default_provider
+        logger.info(f"LLM 응답 생성 시작(async): provider={provider}, message_length={len(message)}, history_count={len(history)}")
+        
+        for candidate in self._provider_order(provider):
+            generate = self._agenerate_with_gemini if candidate == "gemini" else self._agenerate_with_upstage
+            try:
+                return await acall_with_retry(f"{candidate}:chat", generate, message, history, system_prompt, max_tokens)
+            except ProviderError as e:
+                logger.warning(f"{candidate} 응답 생성 실패: {e}")
+        return self._fallback_response(message)
+    
+    async def _agenerate_with_gemini(
+        self,
+        message: str,
+        history: List[Dict],
+        system_prompt: str,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Gemini API를 사용한 비동기 응답 생성 (generate_content_async, 실패 시 ProviderError)"""
+        if not self.gemini_model:
+            raise ProviderError("Gemini 모델이 초기화되지 않았습니다.")
+        
         try:
-            headers = {
-                "Authorization": f"Bearer {self.upstage_api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            data = {
-                "model": model,
-                "input": text
-            }
-            
-            response = requests.post(
-                settings.UPSTAGE_EMBEDDING_API_URL,
-                headers=headers,
-                json=data,
-                timeout=30
+            response = await self.gemini_model.generate_content_async(
+                self._build_gemini_prompt(message, history, system_prompt),
+                generation_config=self._gemini_generation_config(max_tokens)
             )
+            reply = response.text.strip()
+        except Exception as e:
+            raise transport_error(e, "Gemini API 오류")
+        
+        logger.debug(f"Gemini 응답 생성 성공: {len(reply)}자")
+        return reply
+    
+    async def _agenerate_with_upstage(
+        self,
+        message: str,
+        history: List[Dict],
+        system_prompt: str,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Upstage API를 사용한 비동기 응답 생성 (실패 시 ProviderError)"""
+        if not self.upstage_api_key:
+            raise ProviderError("Upstage API 키가 설정되지 않았습니다.")
+        
+        headers, data = self._build_upstage_request(message, history, system_prompt, max_tokens)
+        response = await get_async_http_client().post(
+            settings.UPSTAGE_API_URL,
+            headers=headers,
+            json=data,
+            timeout=request_timeout(settings.LLM_CHAT_TIMEOUT_SECONDS)
+        )
+        return self._parse_upstage_chat_response(response, data)
+    
+    async def astream_chat_response(
+        self,
+        message: str,
+        history: List[Dict],
+        system_prompt: str,
+        provider: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        챗봇 응답을 생성되는 대로 조각(토큰 묶음) 단위로 반환 (조각을 기다리는 동안 스레드를 점유하지 않음)
+        - 서킷 브레이커가 열려 있거나 첫 조각을 받기 전에 실패하면 다른 제공자로 전환 (재시도는 하지 않음)
+        - 모든 제공자가 실패하면 기본 응답을 한 조각으로 반환
+        - 이미 일부를 보낸 뒤 실패하면 거기서 종료 (오류는 로그)
+        """
+        provider = provider or self.default_provider
+        logger.info(f"LLM 스트리밍 응답 시작(async): provider={provider}, message_length={len(message)}, history_count={len(history)}")
+        
+        for candidate in self._provider_order(provider):
+            breaker = get_circuit_breaker(f"{candidate}:chat")
+            if not breaker.allow_request():
+                logger.warning(f"{candidate} 서킷 브레이커 열림 - 스트리밍 건너뜀")
+                continue
+            try:
+                await aacquire_rate_limit(f"{candidate}:chat")
+            except ProviderError as e:
+                breaker.release()
+                logger.warning(f"{candidate} 스트리밍 건너뜀: {e}")
+                continue
+            except BaseException:
+                breaker.release()
+                raise
+            
+            stream = self._astream_with_gemini if candidate == "gemini" else self._astream_with_upstage
+            chunks = stream(message, history, system_prompt)
+            started = time.perf_counter()
+            first = None
+            try:
+                async for chunk in chunks:
+                    if chunk:
+                        first = chunk
+                        break
+            except asyncio.CancelledError:
+                breaker.release()
+                await chunks.aclose()
+                raise
+            except Exception as e:
+                error = transport_error(e, f"{candidate} 스트리밍 오류")
+                breaker.record(time.perf_counter() - started, failed=error.retryable)
+                logger.warning(f"{candidate} 스트리밍 실패: {error}")
+                await chunks.aclose()
+                continue
+            breaker.record(time.perf_counter() - started, failed=False)
+            if first is None:
+                # 빈 응답: 제공자 장애는 아니므로 정상으로 집계하고 다음 제공자 시도
+                logger.warning(f"{candidate} 스트리밍 응답이 비어 있음")
+                continue
             
-            # 오류 발생 시에만 로그 출력
+            try:
+                yield first
+                async for chunk in chunks:
+                    if chunk:
+                        yield chunk
+            except Exception as e:
+                logger.error(f"{candidate} 스트리밍 오류: {e}", exc_info=True)
+            finally:
+                await chunks.aclose()
+            return
+        
+        yield self._fallback_response(message)
+    
+    async def _astream_with_gemini(self, message: str, history: List[Dict], system_prompt: str) -> AsyncIterator[str]:
+        """Gemini 비동기 스트리밍 응답 (generate_content_async(stream=True))"""
+        if not self.gemini_model:
+            raise ProviderError("Gemini 모델이 초기화되지 않았습니다.")
+        
+        response = await self.gemini_model.generate_content_async(
+            self._build_gemini_prompt(message, history, system_prompt),
+            generation_config=GEMINI_GENERATION_CONFIG,
+            stream=True
+        )
+        async for chunk in response:
+            yield chunk.text
+    
+    async def _astream_with_upstage(self, message: str, history: List[Dict], system_prompt: str) -> AsyncIterator[str]:
+        """Upstage 비동기 스트리밍 응답 (stream=true, Server-Sent Events의 choices[0].delta.content)"""
+        if not self.upstage_api_key:
+            raise ProviderError("Upstage API 키가 설정되지 않았습니다.")
+        
+        headers, data = self._build_upstage_request(message, history, system_prompt)
+        data["stream"] = True
+        
+        async with get_async_http_client().stream(
+            "POST",
+            settings.UPSTAGE_API_URL,
+            headers=headers,
+            json=data,
+            timeout=request_timeout(settings.LLM_CHAT_TIMEOUT_SECONDS)
+        ) as response:
             if response.status_code != 200:
-                logger.error(f"Upstage API 오류 - 상태코드: {response.status_code}, 모델: {model}")
-                logger.error(f"응답 내용: {response.text[:200]}")
+                await response.aread()
+                raise http_status_error(response, "Upstage API 오류")
             
-            if response.status_code == 200:
-                result = response.json()
-                # Upstage API 응답 형식 처리
-                if "data" in result and len(result["data"]) > 0:
-                    return result["data"][0]["embedding"]
-                elif "embedding" in result:
-                    return result["embedding"]
-                elif isinstance(result, list) and len(result) > 0:
-                    if "embedding" in result[0]:
-                        return result[0]["embedding"]
-                logger.warning(f"Upstage API 응답 형식을 파싱할 수 없습니다: {result}. 더미 임베딩을 반환합니다.")
-                return [0.0] * settings.EMBEDDING_DIMENSION
-            else:
-                logger.warning(f"Upstage API 오류: {response.status_code} - {response.text[:200]}. 더미 임베딩을 반환합니다.")
-                return [0.0] * settings.EMBEDDING_DIMENSION
+            async for line in response.aiter_lines():
+                content = self._parse_upstage_stream_line(line)
+                if content is None:
+                    continue
+                if content is _STREAM_DONE:
+                    return
+                yield content
+    
+    async def aanalyze_sentiment(self, text: str, provider: Optional[str] = None) -> Dict:
+        """analyze_sentiment의 비동기 버전"""
+        provider = provider or self.default_provider
+        
+        try:
+            response = await self.agenerate_chat_response(
+                message=self._sentiment_prompt(text),
+                history=[],
+                system_prompt=SENTIMENT_SYSTEM_PROMPT,
+                provider=provider
+            )
+            return self._parse_sentiment(response)
+        except Exception as e:
+            logger.error(f"감정 분석 오류: {e}")
+            return {"sentiment": "neutral", "score": 0.5}
+    
+    async def aanalyze_turn(self, text: str, provider: Optional[str] = None) -> Dict:
+        """analyze_turn의 비동기 버전"""
+        try:
+            response = await self.agenerate_chat_response(
+                message=TURN_ANALYSIS_PROMPT.format(text=text),
+                history=[],
+                system_prompt=TURN_ANALYSIS_SYSTEM_PROMPT,
+                provider=provider,
+                max_tokens=TURN_ANALYSIS_MAX_TOKENS
+            )
         except Exception as e:
-            logger.warning(f"Upstage Embedding API 오류: {e}. 더미 임베딩을 반환합니다.")
+            logger.error(f"대화 턴 분석 오류: {e}")
+            response = ""
+        return self._parse_turn_analysis(response)
+    
+    async def aget_text_embedding(self, text: str, is_query: bool = False, provider: Optional[str] = None) -> List[float]:
+        """get_text_embedding의 비동기 버전 (실패 시 더미(0) 벡터)"""
+        vector = (await self.aget_text_embeddings([text], is_query=is_query, provider=provider))[0]
+        if vector is None:
+            logger.warning("임베딩 생성 실패. 더미 임베딩을 반환합니다.")
             return [0.0] * settings.EMBEDDING_DIMENSION
+        return vector
+    
+    async def aget_text_embeddings(
+        self,
+        texts: List[str],
+        is_query: bool = False,
+        provider: Optional[str] = None
+    ) -> List[Optional[List[float]]]:
+        """get_text_embeddings의 비동기 버전 (묶음 분할/개별 재시도 방식 동일)"""
+        results: List[Optional[List[float]]] = [None] * len(texts)
+        
+        # (원래 위치, 정제된 텍스트)
+        pending = []
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                results[i] = [0.0] * settings.EMBEDDING_DIMENSION
+            else:
+                pending.append((i, self._prepare_embedding_text(text)))
+        
+        if not pending:
+            return results
+        
+        provider = provider or settings.EMBEDDING_PROVIDER
+        
+        async def fetch(batch_texts: List[str]) -> Optional[List[List[float]]]:
+            if provider == "gemini":
+                # Gemini SDK 임베딩은 동기 호출이므로 스레드에서 실행
+                return await asyncio.to_thread(self._get_embeddings_gemini, batch_texts, is_query)
+            return await self._aget_embeddings_direct(batch_texts, is_query=is_query)
+        
+        for batch in self._iter_embedding_batches(pending):
+            batch_texts = [text for _, text in batch]
+            vectors = await fetch(batch_texts)
+            
+            # 묶음 요청이 통째로 실패하면 한 건씩 다시 요청하여 실패 항목만 골라냄
+            if vectors is None and len(batch) > 1:
+                logger.warning(f"임베딩 묶음 요청 실패 ({len(batch)}개), 개별 요청으로 재시도합니다.")
+                singles = await asyncio.gather(*(fetch([text]) for text in batch_texts))
+                vectors = [single[0] if single else None for single in singles]
+            
+            if vectors is None:
+                vectors = [None] * len(batch)
+            
+            for (i, _), vector in zip(batch, vectors):
+                results[i] = vector
+        
+        failed = [i for i, vector in enumerate(results) if vector is None]
+        if failed:
+            logger.warning(f"임베딩 실패 항목 {len(failed)}/{len(texts)}개 (위치: {failed[:20]})")
+        
+        return results
+    
+    async def _aget_embeddings_direct(self, texts: List[str], is_query: bool = False) -> Optional[List[List[float]]]:
+        """_get_embeddings_direct의 비동기 버전"""
+        if not self.upstage_api_key:
+            logger.warning("Upstage API 키가 설정되지 않았습니다.")
+            return None
+        
+        try:
+            return await acall_with_retry("upstage:embedding", self._arequest_upstage_embeddings, texts, is_query)
+        except ProviderError as e:
+            logger.warning(f"Upstage Embedding API 오류: {e}")
+            return None
+    
+    async def _arequest_upstage_embeddings(self, texts: List[str], is_query: bool) -> List[List[float]]:
+        """_request_upstage_embeddings의 비동기 버전"""
+        model, headers, data = self._build_upstage_embedding_request(texts, is_query=is_query)
+        response = await get_async_http_client().post(
+            settings.UPSTAGE_EMBEDDING_API_URL,
+            headers=headers,
+            json=data,
+            timeout=request_timeout(settings.LLM_EMBEDDING_TIMEOUT_SECONDS)
+        )
+        return self._parse_upstage_embedding_response(response, texts, model)
     
     def _fallback_response(self, message: str) -> str:
         """API 실패 시 기본 응답"""
@@ -2,7 +2,8 @@
 프롬프트 모음
 - 챗봇 페르소나 프롬프트
 - 복지 정보 요약 프롬프트
-- 심사 프롬프트 등
+- 심사 프롬프트
+- 대화 턴 분석 프롬프트 등
 """
 
 # 챗봇 페르소나 프롬프트
@@ -109,3 +110,20 @@ CBT_PROMPT = """사용자의 현재 감정과 상황을 분석하여 CBT(인지
 
 위 맥락을 바탕으로 CBT 기법을 자연스럽게 적용한 응답을 생성해주세요. 특히 부정적 감정이 감지되면 감사 일기나 사고 전환을 적극적으로 유도하세요."""
 
+
+
+# 대화 턴 분석 프롬프트 (위기 수준 + 감정 + 복지 정보 질문 여부를 한 번에 판단)
+TURN_ANALYSIS_SYSTEM_PROMPT = "당신은 정서 지원 챗봇에 들어온 사용자 메시지를 분석하는 전문가입니다. 반드시 JSON 객체 하나만 출력합니다."
+
+TURN_ANALYSIS_PROMPT = """다음 사용자 메시지를 분석해주세요.
+
+메시지: {text}
+
+분석 항목:
+- crisis_level: 자해/자살 암시, 학대, 심각한 절망 등 위기 수준. "none", "low", "medium", "high" 중 하나
+- sentiment: "positive", "negative", "neutral" 중 하나
+- score: 감정 점수, 0.0(매우 부정)부터 1.0(매우 긍정)까지의 숫자
+- welfare_intent: 복지 제도, 지원금, 수당, 혜택 등 복지 정보를 묻는 메시지이면 true, 아니면 false
+
+응답 형식 (설명 없이 JSON만 출력):
+{{"crisis_level": "none", "sentiment": "neutral", "score": 0.5, "welfare_intent": false}}"""
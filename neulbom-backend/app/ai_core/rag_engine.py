@@ -2,10 +2,13 @@
 RAG 엔진
 - 벡터 검색 (FAISS)
 - 문서 검색 로직
+- 하이브리드 검색 (키워드 + 벡터, RRF 융합)
 - Upstage Embeddings 통합
 """
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from contextlib import nullcontext
 from sqlalchemy.orm import Session
 import numpy as np
 import os
@@ -13,11 +16,22 @@ from pathlib import Path
 import json
 import pickle
 import logging
+import atexit
+import itertools
+import re
+import threading
+import time
 
 from app.core.config import settings
 from app.models import models
+from app.models import crud
 from app.ai_core.llm_client import llm_client
+from app.ai_core.rate_limiter import llm_priority, PRIORITY_BATCH
+from app.ai_core.embedding_cache import get_embedding_cache, get_query_embedding_cache, normalize_query_text
 from app.ai_core.prompts import WELFARE_SUMMARY_PROMPT
+from app.ai_core.semantic_cache import get_semantic_cache
+from app.ai_core.text_processor import chunk_text
+from app.utils.rwlock import ReadWriteLock
 
 logger = logging.getLogger(__name__)
 
@@ -30,130 +44,991 @@ except ImportError:
     print("경고: FAISS가 설치되지 않았습니다. pip install faiss-cpu를 실행하세요.")
 
 
+# 지원하는 벡터 인덱스 구조
+VECTOR_INDEX_TYPES = ("flat", "hnsw", "ivf_flat", "ivf_pq")
+
+# 지원하는 차원 축소 방식 (none: 원본 차원, pca: 코퍼스로 학습한 PCA, truncate: 앞쪽 차원만 사용)
+VECTOR_REDUCTIONS = ("none", "pca", "truncate")
+
+# HNSW는 개별 삭제를 지원하지 않으므로 삭제된 항목의 ID를 이 값으로 바꿔 검색에서 제외
+TOMBSTONE_ID = -1
+
+# IVF 클러스터 하나당 필요한 최소 학습 벡터 수 (FAISS 권장값)
+IVF_MIN_POINTS_PER_CENTROID = 39
+
+# 인덱스 세대 번호 (저장소마다, 수정될 때마다 새 번호 → 검색 결과 캐시 무효화 기준)
+_generations = itertools.count(1)
+
+# 청크 인덱스의 FAISS ID = welfare ID * CHUNK_ID_STRIDE + 청크 순서 (ID만으로 welfare ID 복원)
+CHUNK_ID_STRIDE = 1024
+
+
 class VectorStore:
-    """FAISS 기반 벡터 저장소"""
+    """
+    FAISS 기반 벡터 저장소
+    - welfare ID를 FAISS ID로 그대로 사용 (flat/hnsw: IndexIDMap2, IVF 계열: 인덱스 자체 ID + 해시 direct map)
+    - upsert/remove로 개별 항목 갱신·삭제 (전체 재구축 불필요)
+    - 인덱스 구조: flat(정확) / hnsw / ivf_flat / ivf_pq (근사, VECTOR_INDEX_TYPE 설정)
+    - 코사인 유사도: 벡터를 정규화하여 내적(inner product)으로 검색, 점수가 클수록 유사
+    - 선택한 구조와 파라미터는 인덱스 옆 JSON 파일에 함께 저장
+    - 메모리 매핑 로드(VECTOR_INDEX_MMAP): 읽기 전용으로 열어 여러 워커가 페이지 캐시를 공유,
+      첫 수정(upsert/remove) 때만 메모리로 복사
+    - 저장: 버전별 스냅샷 파일(인덱스 + ID 배열)을 임시 파일에 쓴 뒤 이름 변경,
+      마지막으로 매니페스트를 교체하여 읽는 쪽은 항상 짝이 맞는 파일을 봄
+    - schedule_save: 연속된 갱신을 모아 백그라운드에서 한 번만 저장
+    - 스레드 안전: 검색/조회는 읽기 잠금으로 동시 실행, upsert/remove/train은 쓰기 잠금
+    """
     
-    def __init__(self, dimension: Optional[int] = None, index_path: Optional[str] = None):
+    def __init__(
+        self,
+        dimension: Optional[int] = None,
+        index_path: Optional[str] = None,
+        index_type: Optional[str] = None,
+        mmap: Optional[bool] = None,
+        load_existing: bool = True,
+        reduction: Optional[str] = None,
+        reduced_dimension: Optional[int] = None
+    ):
         """
         dimension: 임베딩 차원 (None이면 설정에서 자동 감지)
-        index_path: FAISS 인덱스 파일 경로
+        index_path: FAISS 인덱스 기본 경로 (스냅샷/매니페스트 파일 이름의 기준, 이전 버전 단일 파일)
+        index_type: 새로 만들 인덱스 구조 (None이면 설정값, 기존 인덱스가 있으면 저장된 구조 사용)
+        mmap: 기존 인덱스를 메모리 매핑으로 읽을지 (None이면 VECTOR_INDEX_MMAP)
+        load_existing: False이면 저장된 인덱스를 읽지 않고 빈 인덱스로 시작 (재구축용)
+        reduction: 새로 만들 인덱스의 차원 축소 방식 (None이면 VECTOR_REDUCTION, 기존 인덱스는 저장된 방식 사용)
+        reduced_dimension: 축소 후 차원 (None이면 VECTOR_REDUCED_DIMENSION)
         """
         # 차원 자동 감지 (설정에서 가져오기)
         if dimension is None:
             dimension = settings.EMBEDDING_DIMENSION
         self.dimension = dimension
+        self.index_type = (index_type or settings.VECTOR_INDEX_TYPE).lower()
+        if self.index_type not in VECTOR_INDEX_TYPES:
+            raise ValueError(f"지원하지 않는 벡터 인덱스 구조입니다: {self.index_type} (가능: {', '.join(VECTOR_INDEX_TYPES)})")
+        self.reduction = (reduction or settings.VECTOR_REDUCTION).lower()
+        if self.reduction not in VECTOR_REDUCTIONS:
+            raise ValueError(f"지원하지 않는 차원 축소 방식입니다: {self.reduction} (가능: {', '.join(VECTOR_REDUCTIONS)})")
+        self.reduced_dimension = reduced_dimension or settings.VECTOR_REDUCED_DIMENSION
+        if self.reduction != "none" and not 0 < self.reduced_dimension < dimension:
+            raise ValueError(f"축소 차원({self.reduced_dimension})은 임베딩 차원({dimension})보다 작아야 합니다.")
+        # 입력 벡터 → 인덱스 벡터 변환 (FAISS VectorTransform, 인덱스 스냅샷과 함께 저장)
+        self.projection = None
+        
         self.index_path = index_path or os.path.join(settings.VECTOR_DB_PATH, "faiss.index")
-        self.id_to_welfare_id_path = os.path.join(settings.VECTOR_DB_PATH, "id_mapping.pkl")
+        self.layout_path = os.path.splitext(self.index_path)[0] + "_layout.json"
+        self.ids_path = os.path.splitext(self.index_path)[0] + "_ids.npy"
+        self.manifest_path = os.path.splitext(self.index_path)[0] + "_manifest.json"
+        self.mmap = settings.VECTOR_INDEX_MMAP if mmap is None else mmap
+        self.read_only = False
+        self._id_array: Optional[np.ndarray] = None
+        # 이전 버전(행 위치 → welfare ID 매핑) 인덱스 변환용 경로
+        self.id_to_welfare_id_path = os.path.join(os.path.dirname(self.index_path), "id_mapping.pkl")
+        self.layout: Dict = {}
+        self._tombstones = 0
+        
+        # 인덱스 읽기/쓰기 잠금 (FAISS 검색은 GIL을 놓으므로 읽기는 스레드 수만큼 병렬 실행)
+        self._rw_lock = ReadWriteLock("VectorStore", warn_wait_seconds=settings.VECTOR_LOCK_WAIT_WARN_MS / 1000)
+        # 저장 상태: 수정 후 저장되지 않았는지, 예약된 저장 타이머, 스냅샷 버전
+        self._lock = threading.RLock()
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        # 재구축 중 변경된 ID 기록 (None이면 기록 안 함), 교체된 뒤에는 retired
+        self._changed_ids: Optional[Set[int]] = None
+        self._retired = False
+        # 검색 결과가 달라질 수 있는 변경마다 증가 (저장소 간에도 겹치지 않음)
+        self.generation = next(_generations)
         
         # 디렉토리 생성
         os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        self._manifest = self._read_manifest()
+        self.version = self._manifest["version"] if self._manifest else 0
         
         # FAISS 인덱스 초기화
         if FAISS_AVAILABLE:
-            if os.path.exists(self.index_path):
-                self.index = faiss.read_index(self.index_path)
-                # ID 매핑 로드
-                if os.path.exists(self.id_to_welfare_id_path):
-                    with open(self.id_to_welfare_id_path, 'rb') as f:
-                        self.id_to_welfare_id = pickle.load(f)
+            source_path = self._current_index_file() if load_existing else None
+            if source_path:
+                index = self._read_index(source_path)
+                if isinstance(index, (faiss.IndexIDMap, faiss.IndexIDMap2, faiss.IndexIVF)):
+                    self.index = index
+                    self.layout = self._load_layout(index)
+                    self._tombstones = self._count_tombstones()
+                    if self.layout["index_type"] != self.index_type:
+                        logger.warning(
+                            f"저장된 벡터 인덱스 구조({self.layout['index_type']})가 설정({self.index_type})과 다릅니다. "
+                            "설정한 구조를 적용하려면 벡터 인덱스를 재구축하세요."
+                        )
+                        self.index_type = self.layout["index_type"]
+                    self._load_projection()
+                    if self.layout.get("metric") != "cosine":
+                        self.index = self._convert_to_cosine()
+                    elif self.read_only:
+                        self._id_array = self._load_id_array()
                 else:
-                    self.id_to_welfare_id = {}
+                    self.index = self._convert_legacy_index(index)
+                # 변환된 인덱스는 메모리에 새로 만든 것이므로 수정 가능
+                self.read_only = self.read_only and self.index is index
             else:
-                # L2 거리 기반 인덱스 생성
-                self.index = faiss.IndexFlatL2(dimension)
-                self.id_to_welfare_id = {}
+                # 빈 인덱스 생성 (IVF 계열은 첫 학습 때 데이터 크기에 맞춰 다시 생성, PCA는 첫 학습 때 적용)
+                if self.reduction == "truncate":
+                    self.projection = faiss.RemapDimensionsTransform(self.dimension, self.reduced_dimension, False)
+                self.layout = self._make_layout()
+                self.index = self._create_index(self.layout)
         else:
             self.index = None
-            self.id_to_welfare_id = {}
     
-    def add_vectors(self, vectors: np.ndarray, welfare_ids: List[int]):
-        """벡터와 welfare ID를 추가합니다."""
+    def _snapshot_path(self, file_name: str) -> str:
+        """스냅샷 파일 이름 → 인덱스 디렉토리 안의 경로"""
+        return os.path.join(os.path.dirname(self.index_path), file_name)
+    
+    def _read_manifest(self) -> Optional[Dict]:
+        """매니페스트 읽기 (없거나 가리키는 스냅샷이 없으면 None)"""
+        if not os.path.exists(self.manifest_path):
+            return None
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"벡터 인덱스 매니페스트를 읽을 수 없습니다: {e}")
+            return None
+        if not os.path.exists(self._snapshot_path(manifest.get("index_file", ""))):
+            logger.warning(f"매니페스트가 가리키는 인덱스 파일이 없습니다: {manifest.get('index_file')}")
+            return None
+        return manifest
+    
+    def _current_index_file(self) -> Optional[str]:
+        """읽을 인덱스 파일 (매니페스트의 스냅샷 → 이전 버전 단일 파일 순)"""
+        if self._manifest:
+            return self._snapshot_path(self._manifest["index_file"])
+        if os.path.exists(self.index_path):
+            return self.index_path
+        return None
+    
+    def _read_index(self, path: str):
+        """인덱스 파일 읽기 (메모리 매핑 모드면 읽기 전용으로 매핑, 실패 시 일반 로드)"""
+        if self.mmap:
+            try:
+                index = faiss.read_index(path, faiss.IO_FLAG_MMAP_IFC | faiss.IO_FLAG_READ_ONLY)
+                self.read_only = True
+                return index
+            except RuntimeError as e:
+                logger.warning(f"벡터 인덱스 메모리 매핑 실패, 메모리로 읽습니다: {e}")
+        self.read_only = False
+        return faiss.read_index(path)
+    
+    def _load_id_array(self) -> Optional[np.ndarray]:
+        """저장된 ID 배열(.npy)을 메모리 매핑으로 읽기 (인덱스와 개수가 다르면 사용 안 함)"""
+        ids_path = self._snapshot_path(self._manifest["ids_file"]) if self._manifest else self.ids_path
+        if not os.path.exists(ids_path):
+            return None
+        try:
+            ids = np.load(ids_path, mmap_mode='r')
+        except (OSError, ValueError) as e:
+            logger.warning(f"벡터 ID 파일을 읽을 수 없습니다: {e}")
+            return None
+        return ids if len(ids) == self.index.ntotal else None
+    
+    def _ensure_writable(self):
+        """메모리 매핑(읽기 전용) 인덱스를 수정 전에 메모리 사본으로 교체"""
+        if not self.read_only:
+            return
+        self.index = faiss.deserialize_index(faiss.serialize_index(self.index))
+        self.read_only = False
+        self._id_array = None
+        logger.info("메모리 매핑 벡터 인덱스를 수정하기 위해 메모리로 복사했습니다.")
+    
+    @property
+    def index_dimension(self) -> int:
+        """FAISS 인덱스에 저장되는 벡터 차원 (차원 축소 시 축소 후 차원)"""
+        return self.projection.d_out if self.projection is not None else self.dimension
+    
+    def _load_projection(self):
+        """저장된 차원 축소 정보와 변환 행렬 읽기 (설정과 달라도 저장된 방식 사용)"""
+        reduction = self.layout.get("reduction")
+        method = reduction["method"] if reduction else "none"
+        if method != self.reduction:
+            logger.warning(
+                f"저장된 벡터 인덱스 차원 축소 방식({method})이 설정({self.reduction})과 다릅니다. "
+                "설정한 방식을 적용하려면 벡터 인덱스를 재구축하세요."
+            )
+            self.reduction = method
+        if not reduction:
+            return
+        self.reduced_dimension = reduction["dimension"]
+        projection_file = self._manifest.get("projection_file") if self._manifest else None
+        if not projection_file:
+            raise ValueError("차원 축소된 벡터 인덱스의 변환 행렬 파일이 매니페스트에 없습니다. 재구축하세요.")
+        with open(self._snapshot_path(projection_file), 'rb') as f:
+            self.projection = faiss.read_VectorTransform(faiss.PyCallbackIOReader(f.read))
+    
+    def _fit_projection(self, vectors: np.ndarray):
+        """
+        PCA 변환 학습 (정규화된 입력 벡터 표본 사용)
+        - 표본이 축소 차원보다 적으면 PCA를 학습할 수 없으므로 차원 축소 없이 진행 (재구축 시 다시 시도)
+        """
+        if len(vectors) < self.reduced_dimension:
+            logger.warning(
+                f"학습 벡터({len(vectors)}개)가 축소 차원({self.reduced_dimension})보다 적어 차원 축소 없이 인덱스를 만듭니다."
+            )
+            self.reduction = "none"
+            return
+        started = time.perf_counter()
+        projection = faiss.PCAMatrix(self.dimension, self.reduced_dimension, 0, False)
+        projection.train(vectors)
+        self.projection = projection
+        logger.info(
+            f"PCA 차원 축소 학습 완료: {self.dimension} → {self.reduced_dimension} "
+            f"(학습 벡터 {len(vectors)}개, {time.perf_counter() - started:.1f}초)"
+        )
+    
+    def _make_layout(self, train_size: Optional[int] = None) -> Dict:
+        """
+        인덱스 구조와 파라미터 결정
+        - train_size: 학습 벡터 수 (IVF 클러스터 수를 이에 맞춰 줄임)
+        """
+        index_type = self.index_type
+        dimension = self.index_dimension
+        layout = {"index_type": index_type, "dimension": dimension, "metric": "cosine"}
+        if self.projection is not None:
+            layout["input_dimension"] = self.dimension
+            layout["reduction"] = {"method": self.reduction, "dimension": dimension}
+        
+        if index_type == "ivf_pq":
+            pq_m, pq_nbits = settings.VECTOR_PQ_M, settings.VECTOR_PQ_NBITS
+            if dimension % pq_m != 0:
+                raise ValueError(f"VECTOR_PQ_M({pq_m})은 인덱스 벡터 차원({dimension})의 약수여야 합니다.")
+            if train_size is not None and train_size < 2 ** pq_nbits:
+                # PQ 코드북 학습에는 최소 2^nbits개의 벡터가 필요
+                logger.warning(f"학습 벡터({train_size}개)가 부족하여 IVF-PQ 대신 IVF-Flat을 사용합니다.")
+                index_type = "ivf_flat"
+                layout["index_type"] = index_type
+            else:
+                layout.update(pq_m=pq_m, pq_nbits=pq_nbits)
+        
+        if index_type == "flat":
+            layout["factory"] = "IDMap2,Flat"
+        elif index_type == "hnsw":
+            layout["hnsw_m"] = settings.VECTOR_HNSW_M
+            layout["hnsw_ef_construction"] = settings.VECTOR_HNSW_EF_CONSTRUCTION
+            layout["factory"] = f"IDMap2,HNSW{layout['hnsw_m']},Flat"
+        else:
+            # IVF는 ID를 직접 저장하므로 IDMap으로 감싸지 않음 (IDMap은 IVF 삭제 후 내부 번호가 어긋남)
+            nlist = settings.VECTOR_IVF_NLIST
+            if train_size is not None:
+                nlist = max(1, min(nlist, train_size // IVF_MIN_POINTS_PER_CENTROID))
+            layout["nlist"] = nlist
+            if index_type == "ivf_pq":
+                # np: 쓰지 않는 polysemous 학습을 끔 (검색 시 polysemous 임계값을 쓰지 않으므로 학습 시간만 늘어남)
+                layout["factory"] = f"IVF{nlist},PQ{layout['pq_m']}x{layout['pq_nbits']}np"
+            else:
+                layout["factory"] = f"IVF{nlist},Flat"
+        return layout
+    
+    def _create_index(self, layout: Dict):
+        """구조 정보로 빈 ID 매핑 인덱스 생성"""
+        index = faiss.index_factory(layout["dimension"], layout["factory"], faiss.METRIC_INNER_PRODUCT)
+        if layout["index_type"] == "hnsw":
+            faiss.downcast_index(index.index).hnsw.efConstruction = layout["hnsw_ef_construction"]
+        elif isinstance(index, faiss.IndexIVF):
+            # ID로 교체/삭제/복원할 수 있도록 ID → 위치 해시 유지
+            index.set_direct_map_type(faiss.DirectMap.Hashtable)
+        return index
+    
+    def _load_layout(self, index) -> Dict:
+        """저장된 구조 정보 읽기 (매니페스트 → 구조 파일 → 인덱스에서 추정 순)"""
+        if self._manifest and self._manifest.get("layout"):
+            return dict(self._manifest["layout"])
+        if os.path.exists(self.layout_path):
+            try:
+                with open(self.layout_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"벡터 인덱스 구조 파일을 읽을 수 없습니다: {e}")
+        
+        base = faiss.downcast_index(index.index) if isinstance(index, faiss.IndexIDMap) else index
+        if isinstance(base, faiss.IndexHNSW):
+            index_type = "hnsw"
+        elif isinstance(base, faiss.IndexIVFPQ):
+            index_type = "ivf_pq"
+        elif isinstance(base, faiss.IndexIVF):
+            index_type = "ivf_flat"
+        else:
+            index_type = "flat"
+        metric = "cosine" if index.metric_type == faiss.METRIC_INNER_PRODUCT else "l2"
+        return {"index_type": index_type, "dimension": index.d, "metric": metric}
+    
+    def _export(self) -> Tuple[np.ndarray, np.ndarray]:
+        """인덱스의 (welfare ID 배열, 벡터 행렬) 추출 (삭제 표시 제외, PQ는 근사 복원)"""
+        ids = self._stored_ids()
+        if isinstance(self.index, faiss.IndexIVF):
+            vectors = self.index.reconstruct_batch(ids) if len(ids) else np.empty((0, self.index_dimension), dtype='float32')
+        else:
+            vectors = faiss.downcast_index(self.index.index).reconstruct_n(0, self.index.ntotal)
+        live = ids != TOMBSTONE_ID
+        return ids[live], vectors[live]
+    
+    def _convert_to_cosine(self):
+        """L2 거리 인덱스(이전 버전)를 정규화 벡터 + 내적 인덱스로 변환"""
+        welfare_ids, vectors = self._export()
+        if len(welfare_ids) == 0:
+            self.layout = self._make_layout()
+            return self._create_index(self.layout)
+        index = self._build_index(vectors, welfare_ids)
+        logger.info(f"벡터 인덱스를 코사인 유사도(내적) 방식으로 변환: {index.ntotal}개")
+        return index
+    
+    def _convert_legacy_index(self, legacy_index):
+        """
+        이전 버전 인덱스(행 위치 + pickle ID 매핑)를 ID 매핑 인덱스로 변환
+        - 같은 welfare의 중복 벡터는 마지막(가장 최근) 것만 유지
+        """
+        id_to_welfare_id = {}
+        if os.path.exists(self.id_to_welfare_id_path):
+            with open(self.id_to_welfare_id_path, 'rb') as f:
+                id_to_welfare_id = pickle.load(f)
+        
+        if legacy_index.ntotal == 0 or not id_to_welfare_id:
+            self.layout = self._make_layout()
+            return self._create_index(self.layout)
+        
+        vectors = legacy_index.reconstruct_n(0, legacy_index.ntotal)
+        latest_rows = {}
+        for row, welfare_id in sorted(id_to_welfare_id.items()):
+            if 0 <= row < legacy_index.ntotal:
+                latest_rows[welfare_id] = row
+        
+        welfare_ids = np.array(list(latest_rows.keys()), dtype='int64')
+        rows = np.array(list(latest_rows.values()), dtype='int64')
+        index = self._build_index(vectors[rows], welfare_ids)
+        logger.info(f"이전 형식 벡터 인덱스 변환: {legacy_index.ntotal}개 → {index.ntotal}개 (중복 제거)")
+        return index
+    
+    def _build_index(self, vectors: np.ndarray, welfare_ids: np.ndarray):
+        """인덱스 공간의 벡터 전체로 새 인덱스 구성 (필요하면 학습 포함), self.layout 갱신"""
+        vectors = self._normalize(vectors)
+        self.layout = self._make_layout(train_size=len(vectors) if self._needs_training_type() else None)
+        index = self._create_index(self.layout)
+        if not index.is_trained:
+            index.train(self._training_sample(vectors))
+        index.add_with_ids(vectors, welfare_ids)
+        return index
+    
+    def _needs_training_type(self) -> bool:
+        return self.index_type in ("ivf_flat", "ivf_pq")
+    
+    @staticmethod
+    def _training_sample(vectors: np.ndarray) -> np.ndarray:
+        """학습용 표본 추출 (VECTOR_INDEX_TRAIN_SIZE개 이하, 재현 가능하도록 고정 시드)"""
+        limit = settings.VECTOR_INDEX_TRAIN_SIZE
+        if len(vectors) <= limit:
+            return vectors
+        rows = np.random.default_rng(0).choice(len(vectors), size=limit, replace=False)
+        return vectors[np.sort(rows)]
+    
+    def is_trained(self) -> bool:
+        """벡터 추가 전에 학습이 끝났는지 (flat/hnsw는 PCA 차원 축소를 쓰지 않으면 항상 True)"""
+        if not FAISS_AVAILABLE or self.index is None:
+            return True
+        if self.reduction == "pca" and self.projection is None:
+            return False
+        return bool(self.index.is_trained)
+    
+    def train(self, vectors: np.ndarray):
+        """
+        PCA 차원 축소와 IVF 계열 인덱스 학습 (변환 행렬, 클러스터 중심/PQ 코드북)
+        - 비어 있는 인덱스에서만 가능, 학습 벡터 수에 맞춰 클러스터 수를 정함
+        - 이미 벡터가 있으면 무시 (구조를 바꾸려면 재구축)
+        """
+        with self._rw_lock.write_lock():
+            self._train(vectors)
+    
+    def _train(self, vectors: np.ndarray):
+        """train 본체 (호출 측에서 쓰기 잠금 보유)"""
+        if not FAISS_AVAILABLE or self.index is None or self.is_trained():
+            return
+        if self.index.ntotal > 0:
+            logger.warning("벡터가 있는 인덱스는 다시 학습할 수 없습니다. 재구축하세요.")
+            return
+        
+        if self.reduction == "pca" and self.projection is None:
+            self._fit_projection(self._training_sample(self._normalize(vectors)))
+        vectors = self._training_sample(self._prepare_vectors(vectors))
+        self.layout = self._make_layout(train_size=len(vectors))
+        self.index = self._create_index(self.layout)
+        if self.index.is_trained:
+            return
+        started = time.perf_counter()
+        self.index.train(vectors)
+        logger.info(
+            f"벡터 인덱스 학습 완료: {self.layout['factory']} "
+            f"(학습 벡터 {len(vectors)}개, {time.perf_counter() - started:.1f}초)"
+        )
+    
+    def _prepare_vectors(self, vectors) -> np.ndarray:
+        """
+        입력(임베딩) 벡터를 인덱스 벡터로 변환 (원본은 변경하지 않음)
+        - float32 2차원 배열로 변환하고 차원 확인 후 L2 정규화
+        - 차원 축소를 쓰면 변환 후 다시 정규화 (문서/쿼리 벡터 모두 같은 변환)
+        """
+        vectors = self._normalize(vectors)
+        if vectors.shape[1] != self.dimension:
+            raise ValueError(f"벡터 차원이 맞지 않습니다. 예상: {self.dimension}, 실제: {vectors.shape[1]}")
+        if self.projection is not None:
+            vectors = np.ascontiguousarray(self.projection.apply(vectors), dtype='float32')
+            faiss.normalize_L2(vectors)
+        return vectors
+    
+    @staticmethod
+    def _normalize(vectors) -> np.ndarray:
+        """float32 2차원 배열 사본으로 변환 후 L2 정규화 (0 벡터는 그대로 유지, 모든 항목과 유사도 0)"""
+        vectors = np.array(vectors, dtype='float32', order='C', copy=True)
+        if vectors.ndim == 1:
+            vectors = vectors.reshape(1, -1)
+        faiss.normalize_L2(vectors)
+        return vectors
+    
+    def _supports_remove(self) -> bool:
+        """개별 삭제 지원 여부 (HNSW는 삭제 표시로 대신함)"""
+        return self.layout.get("index_type") != "hnsw"
+    
+    def _count_tombstones(self) -> int:
+        if self._supports_remove():
+            return 0
+        return int(np.count_nonzero(faiss.vector_to_array(self.index.id_map) == TOMBSTONE_ID))
+    
+    def _delete_ids(self, ids: np.ndarray) -> int:
+        """ID 삭제 (HNSW는 ID를 TOMBSTONE_ID로 바꿔 검색에서 제외)"""
+        if isinstance(self.index, faiss.IndexIVF):
+            # 해시 direct map은 IDSelectorArray로만 삭제 가능, 없는 ID는 미리 제외
+            ids = ids[np.isin(ids, self._stored_ids())]
+            if len(ids) == 0:
+                return 0
+            return int(self.index.remove_ids(faiss.IDSelectorArray(ids)))
+        if self._supports_remove():
+            return int(self.index.remove_ids(faiss.IDSelectorBatch(ids)))
+        
+        id_map = faiss.vector_to_array(self.index.id_map)
+        mask = np.isin(id_map, ids)
+        removed = int(np.count_nonzero(mask))
+        if removed:
+            id_map[mask] = TOMBSTONE_ID
+            faiss.copy_array_to_vector(id_map, self.index.id_map)
+            self.index.construct_rev_map()
+            self._tombstones += removed
+        return removed
+    
+    def _compact_if_needed(self):
+        """HNSW 삭제 표시가 많아지면 살아 있는 벡터만으로 인덱스 재구성"""
+        if self._supports_remove() or self.index.ntotal == 0:
+            return
+        if self._tombstones / self.index.ntotal <= settings.VECTOR_HNSW_MAX_TOMBSTONE_RATIO:
+            return
+        
+        welfare_ids, vectors = self._export()
+        before = self.index.ntotal
+        self.index = self._build_index(vectors, welfare_ids)
+        self._tombstones = 0
+        logger.info(f"HNSW 인덱스 재구성: {before}개 → {self.index.ntotal}개 (삭제 표시 정리)")
+    
+    def upsert(self, welfare_ids: List[int], vectors: np.ndarray):
+        """
+        welfare ID별 벡터 추가 또는 교체
+        - 이미 있는 ID는 기존 벡터를 지우고 새 벡터로 교체
+        - 같은 ID가 여러 번 들어오면 마지막 벡터 사용
+        - 학습 전인 IVF 인덱스는 이 벡터로 먼저 학습 (전체 구축 시에는 train()을 먼저 호출)
+        """
+        if self._retired:
+            # 재구축으로 교체된 저장소에 늦게 들어온 갱신은 현재 저장소로 전달
+            return get_vector_store().upsert(welfare_ids, vectors)
         if not FAISS_AVAILABLE or self.index is None:
             return
         
         if len(vectors) == 0:
             return
         
-        # numpy 배열로 변환
-        if not isinstance(vectors, np.ndarray):
-            vectors = np.array(vectors).astype('float32')
+        raw_vectors = np.asarray(vectors)
+        vectors = self._prepare_vectors(raw_vectors)
         
-        # 차원 확인
-        if vectors.shape[1] != self.dimension:
-            raise ValueError(f"벡터 차원이 맞지 않습니다. 예상: {self.dimension}, 실제: {vectors.shape[1]}")
+        # 배치 내 중복 ID 제거 (마지막 것 우선)
+        latest = {int(welfare_id): i for i, welfare_id in enumerate(welfare_ids)}
+        ids = np.array(list(latest.keys()), dtype='int64')
+        rows = np.array(list(latest.values()), dtype='int64')
         
-        # 현재 인덱스 크기
-        start_id = self.index.ntotal
+        with self._rw_lock.write_lock():
+            # 잠금을 기다리는 동안 교체되었을 수 있으므로 잠금 안에서 다시 확인
+            # (재구축은 이 저장소의 쓰기 잠금을 잡은 채 변경분을 옮기고 retire 호출)
+            retired = self._retired
+            if not retired:
+                self._upsert_locked(ids, rows, raw_vectors, vectors, latest.keys())
+        if retired:
+            return get_vector_store().upsert(welfare_ids, raw_vectors)
+    
+    def _upsert_locked(self, ids: np.ndarray, rows: np.ndarray, raw_vectors: np.ndarray,
+                       vectors: np.ndarray, changed: Iterable[int]):
+        """upsert 본체 (호출 측에서 쓰기 잠금 보유)"""
+        self._ensure_writable()
+        if not self.is_trained():
+            self._train(raw_vectors[rows])
+            # 학습 중 PCA 변환이 정해졌을 수 있으므로 다시 변환
+            vectors = self._prepare_vectors(raw_vectors)
         
-        # 인덱스에 추가
-        self.index.add(vectors)
+        self._delete_ids(ids)
+        self.index.add_with_ids(vectors[rows], ids)
+        self._compact_if_needed()
+        self._dirty = True
+        self.generation = next(_generations)
+        if self._changed_ids is not None:
+            self._changed_ids.update(changed)
+    
+    def add_vectors(self, vectors: np.ndarray, welfare_ids: List[int]):
+        """벡터와 welfare ID를 추가합니다. (이미 있는 ID는 교체)"""
+        self.upsert(welfare_ids, vectors)
+    
+    def remove(self, welfare_ids: Iterable[int]) -> int:
+        """welfare ID에 해당하는 벡터 삭제, 삭제된 개수 반환"""
+        if self._retired:
+            return get_vector_store().remove(welfare_ids)
+        if not FAISS_AVAILABLE or self.index is None:
+            return 0
         
-        # ID 매핑 저장
-        for i, welfare_id in enumerate(welfare_ids):
-            self.id_to_welfare_id[start_id + i] = welfare_id
+        ids = np.array(list(welfare_ids), dtype='int64')
+        if len(ids) == 0:
+            return 0
+        with self._rw_lock.write_lock():
+            # upsert와 같이 잠금 안에서 교체 여부 다시 확인
+            retired = self._retired
+            if not retired:
+                self._ensure_writable()
+                removed = self._delete_ids(ids)
+                self._compact_if_needed()
+                if removed:
+                    self._dirty = True
+                    self.generation = next(_generations)
+                if self._changed_ids is not None:
+                    self._changed_ids.update(ids.tolist())
+        if retired:
+            return get_vector_store().remove(ids.tolist())
+        return removed
+    
+    def start_change_tracking(self):
+        """이후 upsert/remove된 ID 기록 시작 (백그라운드 재구축 중 변경분 반영용)"""
+        with self._rw_lock.write_lock():
+            self._changed_ids = set()
+    
+    def take_changed_ids(self, stop: bool = False) -> Set[int]:
+        """기록된 변경 ID를 가져오고 비움 (stop=True면 기록 중단)"""
+        with self._rw_lock.write_lock():
+            return self._take_changed_ids(stop)
+    
+    def _take_changed_ids(self, stop: bool = False) -> Set[int]:
+        """take_changed_ids 본체 (호출 측에서 쓰기 잠금 보유)"""
+        changed = self._changed_ids or set()
+        self._changed_ids = None if stop else set()
+        return changed
+    
+    def retire(self):
+        """
+        재구축된 저장소로 교체된 뒤 호출: 예약된 저장을 취소하고 이후 저장/갱신을 막음
+        - 쓰기 잠금을 보유한 채 호출해야 함 (upsert/remove가 잠금 안에서 _retired를 확인)
+        - 이미 진행 중인 저장은 끝나지 않으므로 새 스냅샷 기록 전에 flush()로 대기
+        """
+        with self._lock:
+            self._cancel_scheduled_save()
+            self._dirty = False
+            self._retired = True
+    
+    def _stored_ids(self) -> np.ndarray:
+        """인덱스에 저장된 ID 배열 (HNSW는 삭제 표시 포함)"""
+        if self._id_array is not None:
+            return np.asarray(self._id_array)
+        if isinstance(self.index, faiss.IndexIVF):
+            invlists = self.index.invlists
+            ids = [
+                faiss.rev_swig_ptr(invlists.get_ids(list_no), invlists.list_size(list_no)).copy()
+                for list_no in range(self.index.nlist)
+                if invlists.list_size(list_no) > 0
+            ]
+            return np.concatenate(ids) if ids else np.empty(0, dtype='int64')
+        return faiss.vector_to_array(self.index.id_map)
+    
+    def get_ids(self) -> Set[int]:
+        """인덱스에 저장된 welfare ID 집합"""
+        if not FAISS_AVAILABLE or self.index is None:
+            return set()
+        with self._rw_lock.read_lock():
+            ids = set(self._stored_ids().tolist())
+        ids.discard(TOMBSTONE_ID)
+        return ids
+    
+    def get_id_array(self) -> np.ndarray:
+        """인덱스에 저장된 ID 배열 (삭제 표시 제외, 대량 비교용)"""
+        if not FAISS_AVAILABLE or self.index is None:
+            return np.empty(0, dtype='int64')
+        with self._rw_lock.read_lock():
+            ids = self._stored_ids()
+        return ids[ids != TOMBSTONE_ID]
+    
+    def _search_params(self, selector, ef_search: Optional[int], nprobe: Optional[int]):
+        """인덱스 구조에 맞는 검색 파라미터 생성 (호출마다 efSearch/nprobe 조정 가능)"""
+        kwargs = {"sel": selector} if selector is not None else {}
+        index_type = self.layout.get("index_type")
+        if index_type == "hnsw":
+            return faiss.SearchParametersHNSW(efSearch=ef_search or settings.VECTOR_HNSW_EF_SEARCH, **kwargs)
+        if index_type in ("ivf_flat", "ivf_pq"):
+            return faiss.SearchParametersIVF(nprobe=nprobe or settings.VECTOR_IVF_NPROBE, **kwargs)
+        return faiss.SearchParameters(**kwargs) if kwargs else None
+    
+    def search(
+        self,
+        query_vector: np.ndarray,
+        k: int = 10,
+        allowed_welfare_ids: Optional[Iterable[int]] = None,
+        offset: int = 0,
+        min_score: Optional[float] = None,
+        ef_search: Optional[int] = None,
+        nprobe: Optional[int] = None
+    ) -> List[int]:
+        """유사도 검색, welfare ID 리스트 반환 (인자는 search_with_scores 참고)"""
+        return [
+            welfare_id
+            for welfare_id, _ in self.search_with_scores(
+                query_vector,
+                k=k,
+                allowed_welfare_ids=allowed_welfare_ids,
+                offset=offset,
+                min_score=min_score,
+                ef_search=ef_search,
+                nprobe=nprobe
+            )
+        ]
     
-    def search(self, query_vector: np.ndarray, k: int = 10) -> List[int]:
+    def search_with_scores(
+        self,
+        query_vector: np.ndarray,
+        k: int = 10,
+        allowed_welfare_ids: Optional[Iterable[int]] = None,
+        offset: int = 0,
+        min_score: Optional[float] = None,
+        ef_search: Optional[int] = None,
+        nprobe: Optional[int] = None
+    ) -> List[Tuple[int, float]]:
         """
         유사도 검색
-        - query_vector: 쿼리 벡터 (1차원 배열)
+        - query_vector: 쿼리 벡터 (1차원 배열, 내부에서 한 번 정규화)
         - k: 반환할 결과 수
-        - 반환: welfare ID 리스트
+        - allowed_welfare_ids: 검색 대상 welfare ID 집합 (None이면 전체)
+          FAISS ID selector로 전달되어 top-k가 조건에 맞는 항목 안에서만 계산됨
+        - offset: 건너뛸 결과 수 (페이지네이션)
+        - min_score: 최소 코사인 유사도 (-1~1, 미만인 결과는 제외)
+        - ef_search: HNSW 탐색 폭 (None이면 VECTOR_HNSW_EF_SEARCH)
+        - nprobe: IVF 탐색 클러스터 수 (None이면 VECTOR_IVF_NPROBE)
+        - 반환: [(welfare ID, 코사인 유사도), ...] (유사도 내림차순)
         """
-        if not FAISS_AVAILABLE or self.index is None or self.index.ntotal == 0:
-            return []
-        
-        # numpy 배열로 변환
-        if not isinstance(query_vector, np.ndarray):
-            query_vector = np.array([query_vector]).astype('float32')
-        else:
-            query_vector = query_vector.reshape(1, -1).astype('float32')
+        return self.search_batch(
+            np.asarray(query_vector).reshape(1, -1),
+            k=k,
+            allowed_welfare_ids=allowed_welfare_ids,
+            offset=offset,
+            min_score=min_score,
+            ef_search=ef_search,
+            nprobe=nprobe
+        )[0]
+    
+    def search_batch(
+        self,
+        query_matrix: np.ndarray,
+        k: int = 10,
+        allowed_welfare_ids: Optional[Iterable[int]] = None,
+        offset: int = 0,
+        min_score: Optional[float] = None,
+        ef_search: Optional[int] = None,
+        nprobe: Optional[int] = None
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        여러 쿼리를 FAISS 호출 한 번으로 검색 (인자는 search_with_scores 참고)
+        - query_matrix: 쿼리 벡터 행렬 (행 = 쿼리)
+        - allowed_welfare_ids/offset/min_score는 모든 쿼리에 같이 적용
+        - 반환: 쿼리 순서대로 [(welfare ID, 코사인 유사도), ...] 리스트
+        """
+        query_matrix = np.asarray(query_matrix)
+        if query_matrix.ndim == 1:
+            query_matrix = query_matrix.reshape(1, -1)
+        empty = [[] for _ in range(len(query_matrix))]
+        if not FAISS_AVAILABLE or self.index is None or len(query_matrix) == 0:
+            return empty
         
-        # 검색
-        distances, indices = self.index.search(query_vector, min(k, self.index.ntotal))
+        query_matrix = self._prepare_vectors(query_matrix)
+        allowed = None
+        if allowed_welfare_ids is not None:
+            allowed = np.fromiter(allowed_welfare_ids, dtype='int64')
+            if len(allowed) == 0:
+                return empty
         
-        # welfare ID로 변환
-        welfare_ids = []
-        for idx in indices[0]:
-            if idx in self.id_to_welfare_id:
-                welfare_ids.append(self.id_to_welfare_id[idx])
+        with self._rw_lock.read_lock():
+            candidate_count = self._size()
+            if candidate_count == 0:
+                return empty
+            
+            selector = None
+            if allowed is not None:
+                selector = faiss.IDSelectorBatch(allowed)
+                candidate_count = min(len(allowed), candidate_count)
+            elif self._tombstones:
+                selector = faiss.IDSelectorNot(faiss.IDSelectorBatch(np.array([TOMBSTONE_ID], dtype='int64')))
+            params = self._search_params(selector, ef_search, nprobe)
+            
+            # 검색
+            fetch_k = min(offset + k, candidate_count)
+            if fetch_k <= 0:
+                return empty
+            scores, indices = self.index.search(query_matrix, fetch_k, params=params)
         
-        return welfare_ids
+        # FAISS ID가 곧 welfare ID (-1은 결과 없음), 점수는 정규화 벡터의 내적 = 코사인 유사도
+        batch_results = []
+        for row_ids, row_scores in zip(indices, scores):
+            results = []
+            for welfare_id, score in zip(row_ids, row_scores):
+                if welfare_id < 0:
+                    continue
+                if min_score is not None and score < min_score:
+                    break
+                results.append((int(welfare_id), float(score)))
+            batch_results.append(results[offset:offset + k])
+        return batch_results
     
     def save(self):
-        """인덱스를 파일에 저장합니다."""
-        if not FAISS_AVAILABLE or self.index is None:
+        """
+        현재 인덱스를 새 버전 스냅샷으로 저장 (예약된 저장은 취소)
+        1) 읽기 잠금 안에서 인덱스를 메모리에 직렬화 (검색은 막지 않음)
+        2) 잠금 밖에서 인덱스/ID 배열을 임시 파일에 쓰고 이름 변경
+        3) 매니페스트를 임시 파일 + 이름 변경으로 교체 (여기서 새 버전이 보이게 됨)
+        4) 오래된 스냅샷 정리
+        """
+        if not FAISS_AVAILABLE or self.index is None or self._retired:
             return
         
-        faiss.write_index(self.index, self.index_path)
+        # 저장은 한 번에 하나씩 (늦게 끝난 이전 저장이 최신 스냅샷을 덮어쓰지 않도록)
+        with self._save_lock:
+            if self._retired:
+                # 저장 차례를 기다리는 동안 교체된 저장소는 매니페스트를 덮어쓰지 않음
+                return
+            with self._rw_lock.read_lock():
+                with self._lock:
+                    self._cancel_scheduled_save()
+                    self._dirty = False
+                data = faiss.serialize_index(self.index)
+                ids = np.array(self._stored_ids(), dtype='int64')
+                layout = dict(self.layout)
+                count = self._size()
+                projection = self.projection
+            
+            try:
+                self._write_snapshot(data, ids, layout, count, projection)
+            except Exception:
+                # 저장 실패 시 다음 저장에서 다시 시도
+                with self._lock:
+                    self._dirty = True
+                raise
+    
+    def _write_snapshot(self, data: np.ndarray, ids: np.ndarray, layout: Dict, count: int, projection=None):
+        """직렬화된 인덱스를 새 버전 스냅샷 파일과 매니페스트로 기록 (호출 측에서 _save_lock 보유)"""
+        disk_manifest = self._read_manifest()
+        version = max(self.version, disk_manifest["version"] if disk_manifest else 0) + 1
+        stem = os.path.splitext(os.path.basename(self.index_path))[0]
+        manifest = {
+            "version": version,
+            "index_file": f"{stem}.{version:06d}.index",
+            "ids_file": f"{stem}.{version:06d}_ids.npy",
+            "count": count,
+            "layout": layout,
+            "saved_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
         
-        # ID 매핑 저장
-        with open(self.id_to_welfare_id_path, 'wb') as f:
-            pickle.dump(self.id_to_welfare_id, f)
+        self._write_atomic(self._snapshot_path(manifest["index_file"]), lambda f: f.write(memoryview(data)))
+        self._write_atomic(self._snapshot_path(manifest["ids_file"]), lambda f: np.save(f, ids))
+        if projection is not None:
+            # 차원 축소 변환 행렬은 인덱스와 같은 버전으로 저장 (쿼리도 같은 행렬로 변환해야 함)
+            manifest["projection_file"] = f"{stem}.{version:06d}_projection.bin"
+            self._write_atomic(
+                self._snapshot_path(manifest["projection_file"]),
+                lambda f: faiss.write_VectorTransform(projection, faiss.PyCallbackIOWriter(f.write))
+            )
+        self._write_atomic(
+            self.manifest_path,
+            lambda f: f.write(json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8'))
+        )
+        self.version = version
+        self._manifest = manifest
+        self._cleanup_snapshots(stem)
     
-    def get_size(self) -> int:
-        """저장된 벡터 수를 반환합니다."""
+    @staticmethod
+    def _write_atomic(path: str, write):
+        """임시 파일에 쓰고 fsync 후 이름 변경 (중간에 실패해도 기존 파일은 그대로)"""
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                write(f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    
+    def _cleanup_snapshots(self, stem: str):
+        """최근 VECTOR_SNAPSHOT_KEEP개를 제외한 스냅샷과 이전 버전 단일 파일 삭제"""
+        directory = os.path.dirname(self.index_path)
+        keep_versions = set(range(self.version - max(settings.VECTOR_SNAPSHOT_KEEP, 1) + 1, self.version + 1))
+        for file_name in os.listdir(directory):
+            match = re.fullmatch(rf"{re.escape(stem)}\.(\d+)(\.index|_ids\.npy|_projection\.bin)", file_name)
+            if match and int(match.group(1)) not in keep_versions:
+                self._remove_file(os.path.join(directory, file_name))
+        
+        # ID는 인덱스 안에 저장되므로 이전 버전 파일(단일 인덱스, 구조 파일, pickle 매핑)은 정리
+        for path in (self.index_path, self.layout_path, self.ids_path, self.id_to_welfare_id_path):
+            self._remove_file(path)
+    
+    @staticmethod
+    def _remove_file(path: str):
+        """파일 삭제 (없거나 다른 프로세스가 사용 중이면 무시)"""
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug(f"파일 삭제 실패 (다음 저장 때 다시 시도): {path}, {e}")
+    
+    def schedule_save(self, delay: Optional[float] = None):
+        """
+        잠시 후 백그라운드에서 저장 (개별 갱신용)
+        - 대기 중에 들어온 갱신은 같은 저장에 포함되어 스냅샷 하나만 생성
+        """
+        delay = settings.VECTOR_SAVE_DEBOUNCE_SECONDS if delay is None else delay
+        with self._lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                return
+            self._save_timer = threading.Timer(delay, self._run_scheduled_save)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def _run_scheduled_save(self):
+        with self._lock:
+            self._save_timer = None
+            if not self._dirty:
+                return
+        try:
+            self.save()
+        except Exception as e:
+            logger.error(f"벡터 인덱스 백그라운드 저장 실패: {e}", exc_info=True)
+    
+    def _cancel_scheduled_save(self):
+        """예약된 저장 취소 (호출 측에서 lock 보유)"""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+    
+    def flush(self):
+        """저장되지 않은 변경이 있으면 즉시 저장 (서버 종료/스크립트 끝에서 호출)"""
+        if self._dirty:
+            self.save()
+        else:
+            # 백그라운드 저장이 진행 중이면 끝날 때까지 대기
+            with self._save_lock:
+                pass
+    
+    def _size(self) -> int:
+        """get_size 본체 (호출 측에서 잠금 보유)"""
         if self.index is None:
             return 0
-        return self.index.ntotal
+        return self.index.ntotal - self._tombstones
+    
+    def get_size(self) -> int:
+        """저장된 벡터 수를 반환합니다. (삭제 표시된 항목 제외)"""
+        with self._rw_lock.read_lock():
+            return self._size()
+    
+    def get_stats(self) -> Dict:
+        """인덱스 상태와 잠금 대기 통계 (/health 노출용)"""
+        with self._rw_lock.read_lock():
+            size = self._size()
+        return {
+            "size": size,
+            "index_type": self.layout.get("index_type"),
+            "dimension": self.layout.get("dimension"),
+            "reduction": self.reduction,
+            "version": self.version,
+            "generation": self.generation,
+            "read_only": self.read_only,
+            "unsaved_changes": self._dirty,
+            "lock": self._rw_lock.get_stats(),
+        }
 
 
 # 전역 벡터 저장소 인스턴스
 _vector_store: Optional[VectorStore] = None
+_vector_store_lock = threading.Lock()
 
 
 def get_vector_store() -> VectorStore:
     """벡터 저장소 싱글톤 인스턴스를 반환합니다."""
     global _vector_store
     if _vector_store is None:
-        _vector_store = VectorStore()
+        with _vector_store_lock:
+            if _vector_store is None:
+                _vector_store = VectorStore()
     return _vector_store
 
 
+# 청크 단위 벡터 저장소 (VECTOR_CHUNKING_ENABLED일 때 사용, 문서 단위 인덱스와 별도 디렉토리)
+_chunk_store: Optional[VectorStore] = None
+
+
+def get_chunk_store() -> VectorStore:
+    """청크 벡터 저장소 싱글톤 인스턴스를 반환합니다."""
+    global _chunk_store
+    if _chunk_store is None:
+        with _vector_store_lock:
+            if _chunk_store is None:
+                _chunk_store = VectorStore(index_path=os.path.join(settings.VECTOR_DB_PATH, "chunks", "faiss.index"))
+    return _chunk_store
+
+
+def get_vector_store_stats() -> Optional[Dict]:
+    """벡터 저장소 상태/잠금/재구축 통계 (아직 로드되지 않았으면 None, 로드를 유발하지 않음)"""
+    stats = _vector_store.get_stats() if _vector_store is not None else None
+    if _rebuild_status["state"] != "idle":
+        stats = dict(stats or {}, rebuild=get_rebuild_status())
+    if _chunk_store is not None:
+        stats = dict(stats or {}, chunks=_chunk_store.get_stats())
+    return stats
+
+
+def flush_vector_store():
+    """예약된 벡터 인덱스 저장을 즉시 실행 (서버 종료 시 호출)"""
+    if _vector_store is not None:
+        _vector_store.flush()
+    if _chunk_store is not None:
+        _chunk_store.flush()
+
+
+atexit.register(flush_vector_store)
+
+
+def _is_valid_embedding(embedding: Optional[List[float]]) -> bool:
+    """API 실패 시 반환되는 더미(0) 벡터가 아닌지 확인 (캐시 저장 여부 판단용)"""
+    return bool(embedding) and any(value != 0.0 for value in embedding)
+
+
 def get_embedding(text: str, is_query: bool = False, provider: Optional[str] = None) -> List[float]:
     """
     텍스트를 벡터로 임베딩
     - Upstage 또는 Gemini Embeddings API 사용
     - 텍스트 정제 후 임베딩 생성
+    - 같은 텍스트는 임베딩 캐시에서 재사용 (API 호출 생략)
+    - 검색 쿼리는 정규화 후 쿼리 임베딩 캐시(LRU + TTL)를 먼저 확인하고,
+      동시에 들어온 같은 쿼리는 API를 한 번만 호출
     
     Args:
         text: 임베딩할 텍스트
@@ -164,34 +1039,440 @@ def get_embedding(text: str, is_query: bool = False, provider: Optional[str] = N
         # 기본 차원
         return [0.0] * settings.EMBEDDING_DIMENSION
     
+    if is_query:
+        query = normalize_query_text(text) or text
+        query_cache = get_query_embedding_cache()
+        if query_cache:
+            return query_cache.get_or_compute(
+                query_cache.make_key(query, provider=provider),
+                lambda: _compute_embedding(query, is_query=True, provider=provider),
+                cacheable=_is_valid_embedding
+            )
+        return _compute_embedding(query, is_query=True, provider=provider)
+    return _compute_embedding(text, is_query=is_query, provider=provider)
+
+
+def _compute_embedding(text: str, is_query: bool = False, provider: Optional[str] = None) -> List[float]:
+    """get_embedding 본체: 임베딩 캐시(메모리/디스크) 확인 후 API 호출"""
+    cache = get_embedding_cache()
+    cache_key = cache.make_key(text, is_query=is_query, provider=provider) if cache else None
+    if cache:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+    
     # llm_client의 get_text_embedding 메서드 사용
     try:
-        return llm_client.get_text_embedding(text, is_query=is_query, provider=provider)
+        with _embedding_priority(is_query):
+            embedding = llm_client.get_text_embedding(text, is_query=is_query, provider=provider)
     except Exception as e:
         logger.error(f"임베딩 생성 실패: {e}")
         raise ValueError(
             f"임베딩 생성 실패: {e}. "
             ".env 파일에 UPSTAGE_API_KEY를 확인하세요."
         )
+    
+    if cache and _is_valid_embedding(embedding):
+        cache.put(cache_key, embedding)
+    return embedding
+
+
+def _embedding_priority(is_query: bool):
+    """문서 임베딩(인덱싱)은 배치 우선순위로 요청, 검색 쿼리 임베딩은 호출한 쪽 우선순위 유지"""
+    return nullcontext() if is_query else llm_priority(PRIORITY_BATCH)
+
+
+def get_embeddings(
+    texts: List[str],
+    is_query: bool = False,
+    provider: Optional[str] = None
+) -> List[Optional[List[float]]]:
+    """
+    여러 텍스트를 묶음 요청으로 임베딩 (인덱스 재구축용)
+    - 입력 순서대로 벡터 반환, 실패한 항목은 None
+    - 캐시에 있는 텍스트는 제외하고 나머지만 API로 요청
+    
+    Args:
+        texts: 임베딩할 텍스트 리스트
+        is_query: True이면 쿼리 모델 사용, False이면 문서 모델 사용
+        provider: "upstage" 또는 "gemini" (None이면 설정값 사용)
+    """
+    if not texts:
+        return []
+    
+    results: List[Optional[List[float]]] = [None] * len(texts)
+    cache = get_embedding_cache()
+    keys: List[Optional[str]] = [None] * len(texts)
+    
+    if cache:
+        for i, text in enumerate(texts):
+            if text and text.strip():
+                keys[i] = cache.make_key(text, is_query=is_query, provider=provider)
+        cached = cache.get_many([key for key in keys if key])
+        for i, key in enumerate(keys):
+            if key in cached:
+                results[i] = cached[key]
+    
+    missing = [i for i, vector in enumerate(results) if vector is None]
+    if not missing:
+        return results
+    
+    try:
+        with _embedding_priority(is_query):
+            embeddings = llm_client.get_text_embeddings(
+                [texts[i] for i in missing], is_query=is_query, provider=provider
+            )
+    except Exception as e:
+        logger.error(f"일괄 임베딩 생성 실패: {e}")
+        raise ValueError(
+            f"일괄 임베딩 생성 실패: {e}. "
+            ".env 파일에 UPSTAGE_API_KEY를 확인하세요."
+        )
+    
+    new_entries = []
+    for i, embedding in zip(missing, embeddings):
+        results[i] = embedding
+        if cache and keys[i] and _is_valid_embedding(embedding):
+            new_entries.append((keys[i], embedding))
+    if new_entries:
+        cache.put_many(new_entries)
+    
+    return results
+
+
+def get_query_embeddings(queries: List[str], provider: Optional[str] = None) -> List[Optional[List[float]]]:
+    """
+    여러 검색 쿼리를 묶음 요청으로 임베딩 (get_embedding(is_query=True)의 여러 쿼리 버전)
+    - 쿼리를 정규화하여 쿼리 임베딩 캐시를 먼저 확인하고, 없는 쿼리만 중복 없이 한 번에 요청
+    - 입력 순서대로 벡터 반환, 실패한 항목은 None (빈 쿼리는 0 벡터)
+    """
+    normalized = [normalize_query_text(query) or query for query in queries]
+    results: List[Optional[List[float]]] = [[0.0] * settings.EMBEDDING_DIMENSION for _ in queries]
+    rows = [i for i, query in enumerate(queries) if query and query.strip()]
+    if not rows:
+        return results
+    
+    query_cache = get_query_embedding_cache()
+    if not query_cache:
+        embeddings = get_embeddings([normalized[i] for i in rows], is_query=True, provider=provider)
+    else:
+        keys = [query_cache.make_key(normalized[i], provider=provider) for i in rows]
+        texts = dict(zip(keys, (normalized[i] for i in rows)))
+        embeddings = query_cache.get_many_or_compute(
+            keys,
+            lambda missing: get_embeddings([texts[key] for key in missing], is_query=True, provider=provider),
+            cacheable=_is_valid_embedding
+        )
+    for i, embedding in zip(rows, embeddings):
+        results[i] = embedding
+    return results
+
+
+def get_embedding_cache_stats() -> Optional[dict]:
+    """임베딩 캐시 적중/미스 통계 (캐시 비활성화 시 None)"""
+    cache = get_embedding_cache()
+    return cache.get_stats() if cache else None
+
+
+def get_query_embedding_cache_stats() -> Optional[dict]:
+    """쿼리 임베딩 캐시 적중/합쳐진 요청 통계 (캐시 비활성화 시 None)"""
+    cache = get_query_embedding_cache()
+    return cache.get_stats() if cache else None
 
 
 def similarity_search(
     query_embedding: List[float],
-    limit: int = 10
+    limit: int = 10,
+    allowed_welfare_ids: Optional[Iterable[int]] = None,
+    offset: int = 0,
+    min_score: Optional[float] = None,
+    ef_search: Optional[int] = None,
+    nprobe: Optional[int] = None
 ) -> List[int]:
+    """벡터 유사도 검색, welfare ID 리스트 반환 (인자는 similarity_search_with_scores 참고)"""
+    return [
+        welfare_id
+        for welfare_id, _ in similarity_search_with_scores(
+            query_embedding,
+            limit=limit,
+            allowed_welfare_ids=allowed_welfare_ids,
+            offset=offset,
+            min_score=min_score,
+            ef_search=ef_search,
+            nprobe=nprobe
+        )
+    ]
+
+
+def similarity_search_with_scores(
+    query_embedding: List[float],
+    limit: int = 10,
+    allowed_welfare_ids: Optional[Iterable[int]] = None,
+    offset: int = 0,
+    min_score: Optional[float] = None,
+    ef_search: Optional[int] = None,
+    nprobe: Optional[int] = None
+) -> List[Tuple[int, float]]:
     """
     벡터 유사도 검색
     - query_embedding: 쿼리 벡터
     - limit: 반환할 결과 수
-    - 반환: welfare ID 리스트
+    - allowed_welfare_ids: 검색 대상 welfare ID 집합 (None이면 전체)
+    - offset: 건너뛸 결과 수
+    - min_score: 최소 코사인 유사도 (미만인 결과 제외)
+    - ef_search / nprobe: 근사 인덱스(HNSW / IVF) 탐색 범위 (None이면 설정값)
+    - 반환: [(welfare ID, 코사인 유사도), ...]
+    - 청크 인덱스를 사용 중이면 복지 정보별 가장 비슷한 청크의 유사도
     """
+    if _chunk_index_ready():
+        return [
+            (welfare_id, score)
+            for welfare_id, score, _ in similarity_search_chunks(
+                query_embedding,
+                limit=limit,
+                allowed_welfare_ids=allowed_welfare_ids,
+                offset=offset,
+                min_score=min_score,
+                ef_search=ef_search,
+                nprobe=nprobe
+            )
+        ]
+    
     vector_store = get_vector_store()
-    return vector_store.search(np.array(query_embedding), k=limit)
+    return vector_store.search_with_scores(
+        np.array(query_embedding),
+        k=limit,
+        allowed_welfare_ids=allowed_welfare_ids,
+        offset=offset,
+        min_score=min_score,
+        ef_search=ef_search,
+        nprobe=nprobe
+    )
+
+
+def _chunk_index_ready() -> bool:
+    """청크 검색 사용 여부 (설정이 켜져 있고 청크 인덱스가 비어 있지 않을 때)"""
+    return settings.VECTOR_CHUNKING_ENABLED and get_chunk_store().get_size() > 0
+
+
+def similarity_search_chunks(
+    query_embedding: List[float],
+    limit: int = 10,
+    allowed_welfare_ids: Optional[Iterable[int]] = None,
+    offset: int = 0,
+    min_score: Optional[float] = None,
+    ef_search: Optional[int] = None,
+    nprobe: Optional[int] = None
+) -> List[Tuple[int, float, int]]:
+    """
+    청크 벡터 검색 후 복지 정보별로 집계 (인자는 similarity_search_with_scores 참고)
+    - 복지 정보의 점수 = 가장 비슷한 청크의 코사인 유사도 (max)
+    - 같은 복지 정보의 청크가 상위를 차지할 수 있으므로 limit보다 많이 가져오고,
+      복지 정보 수가 모자라면 두 배씩 늘려 다시 검색
+    - 반환: [(welfare ID, 최고 유사도, 해당 청크 순서), ...] (유사도 내림차순)
+    """
+    return similarity_search_chunks_batch(
+        np.asarray(query_embedding).reshape(1, -1),
+        limit=limit,
+        allowed_welfare_ids=allowed_welfare_ids,
+        offset=offset,
+        min_score=min_score,
+        ef_search=ef_search,
+        nprobe=nprobe
+    )[0]
+
+
+def similarity_search_chunks_batch(
+    query_matrix: np.ndarray,
+    limit: int = 10,
+    allowed_welfare_ids: Optional[Iterable[int]] = None,
+    offset: int = 0,
+    min_score: Optional[float] = None,
+    ef_search: Optional[int] = None,
+    nprobe: Optional[int] = None
+) -> List[List[Tuple[int, float, int]]]:
+    """
+    similarity_search_chunks의 여러 쿼리 버전 (청크 인덱스 FAISS 호출을 쿼리 묶음당 한 번으로)
+    - 복지 정보 수가 모자란 쿼리만 모아 가져올 수를 두 배로 늘려 다시 검색
+    - 반환: 쿼리 순서대로 [(welfare ID, 최고 유사도, 해당 청크 순서), ...] 리스트
+    """
+    query_matrix = np.asarray(query_matrix)
+    batch_results: List[List[Tuple[int, float, int]]] = [[] for _ in range(len(query_matrix))]
+    chunk_store = get_chunk_store()
+    allowed_chunk_ids = None
+    if allowed_welfare_ids is not None:
+        allowed = np.fromiter(allowed_welfare_ids, dtype='int64')
+        if len(allowed) == 0:
+            return batch_results
+        chunk_ids = chunk_store.get_id_array()
+        allowed_chunk_ids = chunk_ids[np.isin(chunk_ids // CHUNK_ID_STRIDE, allowed)]
+        if len(allowed_chunk_ids) == 0:
+            return batch_results
+    
+    total = len(allowed_chunk_ids) if allowed_chunk_ids is not None else chunk_store.get_size()
+    wanted = offset + limit
+    fetch_k = min(wanted * max(settings.VECTOR_CHUNK_OVERFETCH, 1), total)
+    pending = list(range(len(query_matrix)))
+    while pending:
+        batch_hits = chunk_store.search_batch(
+            query_matrix[pending],
+            k=fetch_k,
+            allowed_welfare_ids=allowed_chunk_ids,
+            min_score=min_score,
+            ef_search=ef_search,
+            nprobe=nprobe
+        )
+        retry = []
+        for row, hits in zip(pending, batch_hits):
+            # 결과가 유사도 내림차순이므로 복지 정보별 첫 청크가 최고 점수
+            best: Dict[int, Tuple[float, int]] = {}
+            for chunk_id, score in hits:
+                welfare_id, chunk_index = divmod(chunk_id, CHUNK_ID_STRIDE)
+                if welfare_id not in best:
+                    best[welfare_id] = (score, chunk_index)
+            if len(best) < wanted and len(hits) >= fetch_k and fetch_k < total:
+                retry.append(row)
+            results = [(welfare_id, score, chunk_index) for welfare_id, (score, chunk_index) in best.items()]
+            batch_results[row] = results[offset:offset + limit]
+        pending = retry
+        fetch_k = min(fetch_k * 2, total)
+    return batch_results
+
+
+def _index_version() -> Tuple:
+    """검색 결과에 영향을 주는 인덱스 상태 (문서/청크 인덱스 세대, 청크 검색 사용 여부)"""
+    use_chunks = _chunk_index_ready()
+    return (get_vector_store().generation, get_chunk_store().generation if use_chunks else None, use_chunks)
+
+
+def _search_vectors(
+    query_embedding: List[float],
+    limit: int = 10,
+    allowed_welfare_ids: Optional[Iterable[int]] = None,
+    offset: int = 0,
+    min_score: Optional[float] = None
+) -> List[Tuple[int, float, Optional[int]]]:
+    """
+    검색 서비스용 벡터 검색 (search_context / 하이브리드 검색 공용)
+    - 청크 인덱스를 사용 중이면 청크 검색, 아니면 문서 단위 검색 (청크 순서는 None)
+    - 최근 검색한 쿼리와 임베딩이 충분히 비슷하고 조건이 같으면 의미 캐시의 결과를 재사용 (FAISS 검색만 생략,
+      호출 측의 카드 조회는 그대로 실행)
+    - 반환: [(welfare ID, 코사인 유사도, 가장 비슷한 청크 순서), ...]
+    """
+    return _search_vectors_batch(
+        [query_embedding],
+        limit=limit,
+        allowed_welfare_ids=allowed_welfare_ids,
+        offset=offset,
+        min_score=min_score
+    )[0]
+
+
+def _search_vectors_batch(
+    query_embeddings: Sequence[Sequence[float]],
+    limit: int = 10,
+    allowed_welfare_ids: Optional[Iterable[int]] = None,
+    offset: int = 0,
+    min_score: Optional[float] = None
+) -> List[List[Tuple[int, float, Optional[int]]]]:
+    """
+    _search_vectors의 여러 쿼리 버전
+    - 의미 캐시에서 재사용할 수 없는 쿼리만 모아 FAISS 호출 한 번으로 검색
+    - 반환: 쿼리 순서대로 [(welfare ID, 코사인 유사도, 가장 비슷한 청크 순서), ...] 리스트
+    """
+    query_matrix = np.asarray(query_embeddings, dtype='float32')
+    allowed = frozenset(allowed_welfare_ids) if allowed_welfare_ids is not None else None
+    
+    def search(rows: List[int]) -> List[List[Tuple[int, float, Optional[int]]]]:
+        if _chunk_index_ready():
+            return similarity_search_chunks_batch(
+                query_matrix[rows], limit=limit, allowed_welfare_ids=allowed, offset=offset, min_score=min_score
+            )
+        return [
+            [(welfare_id, score, None) for welfare_id, score in results]
+            for results in get_vector_store().search_batch(
+                query_matrix[rows], k=limit, allowed_welfare_ids=allowed, offset=offset, min_score=min_score
+            )
+        ]
+    
+    semantic_cache = get_semantic_cache()
+    if semantic_cache is None:
+        return search(list(range(len(query_matrix))))
+    return semantic_cache.get_many_or_search(
+        query_matrix,
+        params=(limit, offset, min_score, allowed),
+        index_version=_index_version(),
+        search=search
+    )
+
+
+def get_semantic_cache_stats() -> Optional[dict]:
+    """의미 기반 결과 캐시 적중/무효화/결과 차이 통계 (캐시 비활성화 시 None)"""
+    cache = get_semantic_cache()
+    return cache.get_stats() if cache else None
+
+
+# 벡터 검색 필터용 welfare ID 집합 캐시: {(필터 종류, 값): (생성 시각, ID 집합)}
+_filter_id_sets: Dict[Tuple[str, object], Tuple[float, frozenset]] = {}
+_filter_id_sets_lock = threading.Lock()
+
+
+def _get_filter_id_set(db: Session, name: str, value) -> frozenset:
+    """필터 하나(지역/나이/돌봄 대상/분류)에 해당하는 welfare ID 집합 (TTL 캐시)"""
+    key = (name, value)
+    now = time.monotonic()
+    with _filter_id_sets_lock:
+        cached = _filter_id_sets.get(key)
+        if cached and now - cached[0] < settings.VECTOR_FILTER_CACHE_TTL_SECONDS:
+            return cached[1]
+    
+    ids = frozenset(crud.get_welfare_ids_by_filter(db, **{name: value}))
+    with _filter_id_sets_lock:
+        _filter_id_sets[key] = (now, ids)
+    return ids
+
+
+def get_filter_welfare_ids(
+    db: Session,
+    region: Optional[str] = None,
+    age: Optional[int] = None,
+    care_target: Optional[str] = None,
+    category: Optional[str] = None
+) -> Optional[Set[int]]:
+    """
+    필터 조건에 맞는 welfare ID 집합 (벡터 검색의 allowed_welfare_ids로 사용)
+    - 조건별 ID 집합을 미리 계산해 캐시하고 교집합으로 조합
+    - 조건이 하나도 없으면 None (전체 검색)
+    """
+    filters = [
+        (name, value)
+        for name, value in (("region", region), ("age", age), ("care_target", care_target), ("category", category))
+        if value
+    ]
+    if not filters:
+        return None
+    
+    result: Optional[frozenset] = None
+    for name, value in filters:
+        ids = _get_filter_id_set(db, name, value)
+        result = ids if result is None else result & ids
+        if not result:
+            return set()
+    return set(result)
+
+
+def invalidate_filter_cache():
+    """필터 ID 집합 캐시 초기화 (복지 정보 추가/변경 후 호출)"""
+    with _filter_id_sets_lock:
+        _filter_id_sets.clear()
 
 
 def search_context(
     query: str,
-    limit: int = 10
+    limit: int = 10,
+    allowed_welfare_ids: Optional[Iterable[int]] = None,
+    offset: int = 0,
+    min_score: Optional[float] = None
 ) -> List[int]:
     """
     순수 검색 엔진: 쿼리를 입력받아 Vector DB에서 관련 문서 ID를 검색해 반환
@@ -199,10 +1480,36 @@ def search_context(
     Args:
         query: 검색 쿼리 (질문)
         limit: 반환할 결과 수
+        allowed_welfare_ids: 검색 대상 welfare ID 집합 (get_filter_welfare_ids 결과, None이면 전체)
+        offset: 건너뛸 결과 수 (페이지네이션)
+        min_score: 최소 코사인 유사도 (미만인 결과는 제외, None이면 제한 없음)
         
     Returns:
         관련 문서(welfare) ID 리스트 (유사도 순)
     """
+    return [
+        welfare_id
+        for welfare_id, _ in search_context_with_scores(
+            query,
+            limit=limit,
+            allowed_welfare_ids=allowed_welfare_ids,
+            offset=offset,
+            min_score=min_score
+        )
+    ]
+
+
+def search_context_with_scores(
+    query: str,
+    limit: int = 10,
+    allowed_welfare_ids: Optional[Iterable[int]] = None,
+    offset: int = 0,
+    min_score: Optional[float] = None
+) -> List[Tuple[int, float]]:
+    """
+    search_context와 같지만 [(welfare ID, 코사인 유사도), ...]를 반환
+    - 호출 측에서 점수로 약한 결과를 걸러 DB 조회/프롬프트 추가를 생략할 수 있음
+    """
     # 빈 쿼리 처리
     if not query or not query.strip():
         logger.warning("빈 쿼리로 검색 시도")
@@ -213,14 +1520,239 @@ def search_context(
     try:
         # 벡터 유사도 검색 (Semantic Search)
         query_embedding = get_embedding(query, is_query=True)
-        welfare_ids = similarity_search(query_embedding, limit=limit)
-        logger.debug(f"벡터 검색 결과: {len(welfare_ids)}개")
-        return welfare_ids
+        if not _is_valid_embedding(query_embedding):
+            # 임베딩 API 실패 시 더미(0) 벡터로 검색하면 무의미한 결과가 나오므로 중단
+            logger.warning("쿼리 임베딩 생성 실패로 벡터 검색을 건너뜁니다.")
+            return []
+        results = _search_vectors(
+            query_embedding,
+            limit=limit,
+            allowed_welfare_ids=allowed_welfare_ids,
+            offset=offset,
+            min_score=min_score
+        )
+        logger.debug(f"벡터 검색 결과: {len(results)}개")
+        return [(welfare_id, score) for welfare_id, score, _ in results]
     except Exception as e:
         logger.error(f"벡터 검색 실패: {e}")
         return []
 
 
+def search_context_batch(
+    queries: List[str],
+    limit: int = 10,
+    allowed_welfare_ids: Optional[Iterable[int]] = None,
+    min_score: Optional[float] = None
+) -> List[List[int]]:
+    """
+    여러 쿼리를 한 번에 검색 (평가, 캐시 예열, 여러 의도가 섞인 질문 등)
+    - 쿼리 임베딩은 묶음 요청 한 번, 벡터 검색은 FAISS 호출 한 번으로 처리
+    - 인자는 search_context 참고 (allowed_welfare_ids/min_score는 모든 쿼리에 공통)
+    - 반환: 쿼리 순서대로 관련 문서(welfare) ID 리스트 (빈 쿼리/임베딩 실패는 빈 리스트)
+    """
+    return [
+        [welfare_id for welfare_id, _ in results]
+        for results in search_context_batch_with_scores(
+            queries,
+            limit=limit,
+            allowed_welfare_ids=allowed_welfare_ids,
+            min_score=min_score
+        )
+    ]
+
+
+def search_context_batch_with_scores(
+    queries: List[str],
+    limit: int = 10,
+    allowed_welfare_ids: Optional[Iterable[int]] = None,
+    min_score: Optional[float] = None
+) -> List[List[Tuple[int, float]]]:
+    """search_context_batch와 같지만 쿼리별로 [(welfare ID, 코사인 유사도), ...]를 반환"""
+    batch_results: List[List[Tuple[int, float]]] = [[] for _ in queries]
+    rows = [i for i, query in enumerate(queries) if query and query.strip()]
+    if not rows:
+        return batch_results
+    
+    try:
+        embeddings = get_query_embeddings([queries[i].strip() for i in rows])
+        # 임베딩 API 실패(None/더미 벡터)인 쿼리는 검색하지 않음
+        valid = [(row, embedding) for row, embedding in zip(rows, embeddings) if _is_valid_embedding(embedding)]
+        if len(valid) < len(rows):
+            logger.warning(f"쿼리 임베딩 생성 실패로 {len(rows) - len(valid)}개 쿼리의 벡터 검색을 건너뜁니다.")
+        if not valid:
+            return batch_results
+        
+        found = _search_vectors_batch(
+            [embedding for _, embedding in valid],
+            limit=limit,
+            allowed_welfare_ids=allowed_welfare_ids,
+            min_score=min_score
+        )
+        for (row, _), results in zip(valid, found):
+            batch_results[row] = [(welfare_id, score) for welfare_id, score, _ in results]
+        return batch_results
+    except Exception as e:
+        logger.error(f"일괄 벡터 검색 실패: {e}")
+        return [[] for _ in queries]
+
+
+# 하이브리드 검색에서 벡터 검색(쿼리 임베딩 + FAISS)을 병렬 실행하기 위한 스레드 풀
+_search_executor: Optional[ThreadPoolExecutor] = None
+_search_executor_lock = threading.Lock()
+
+
+def _get_search_executor() -> ThreadPoolExecutor:
+    """검색용 스레드 풀 싱글톤 인스턴스를 반환합니다."""
+    global _search_executor
+    if _search_executor is None:
+        with _search_executor_lock:
+            if _search_executor is None:
+                _search_executor = ThreadPoolExecutor(
+                    max_workers=settings.HYBRID_SEARCH_WORKERS,
+                    thread_name_prefix="hybrid-search"
+                )
+    return _search_executor
+
+
+def reciprocal_rank_fusion(
+    ranked_lists: Dict[str, List[int]],
+    k: Optional[int] = None
+) -> List[Tuple[int, float]]:
+    """
+    여러 검색 결과 순위를 Reciprocal Rank Fusion으로 융합
+    - score(d) = Σ 1 / (k + rank_s(d)), rank는 1부터 시작
+    - 반환: [(welfare_id, 융합 점수), ...] (점수 높은 순)
+    """
+    k = k if k is not None else settings.HYBRID_RRF_K
+    scores: Dict[int, float] = {}
+    for ranked_ids in ranked_lists.values():
+        for rank, welfare_id in enumerate(ranked_ids, start=1):
+            scores[welfare_id] = scores.get(welfare_id, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+def _vector_candidates(
+    query: str,
+    limit: int,
+    allowed_welfare_ids: Optional[Set[int]] = None,
+    min_score: Optional[float] = None
+) -> List[Tuple[int, float, Optional[int]]]:
+    """
+    벡터 검색 후보 (ID, 유사도, 가장 비슷한 청크 순서)
+    - 청크 인덱스를 사용하지 않으면 청크 순서는 None
+    - 인덱스가 비어 있거나 쿼리 임베딩 실패 시 빈 리스트
+    """
+    if not _chunk_index_ready() and get_vector_store().get_size() == 0:
+        return []
+    if allowed_welfare_ids is not None and not allowed_welfare_ids:
+        return []
+    query_embedding = get_embedding(query, is_query=True)
+    if not _is_valid_embedding(query_embedding):
+        return []
+    return _search_vectors(query_embedding, limit=limit, allowed_welfare_ids=allowed_welfare_ids, min_score=min_score)
+
+
+def hybrid_search(
+    db: Session,
+    query: str,
+    region: Optional[str] = None,
+    age: Optional[int] = None,
+    care_target: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 10,
+    candidate_pool: Optional[int] = None,
+    min_vector_score: Optional[float] = None
+) -> List[Dict]:
+    """
+    하이브리드 검색: 키워드(FTS/LIKE) 검색과 벡터 검색을 동시에 실행하고 RRF로 융합
+    
+    Args:
+        db: 데이터베이스 세션 (키워드 검색은 호출 스레드에서 실행)
+        query: 검색어 또는 자연어 질문
+        region/age/care_target: 필터 (두 소스 모두에 적용)
+        skip/limit: 융합 결과 페이지네이션
+        candidate_pool: 소스별 후보 수 (None이면 설정값, skip+limit 이상으로 자동 확장)
+        min_vector_score: 벡터 후보의 최소 코사인 유사도 (미만인 후보는 융합에서 제외)
+        
+    Returns:
+        [{"welfare_id", "score", "lexical_rank", "lexical_score", "vector_rank", "vector_score", "passage"}, ...]
+        (순위/점수가 None이면 해당 소스의 후보에 없었음,
+         passage는 청크 검색에서 쿼리와 가장 비슷했던 원문 청크, 없으면 None)
+    """
+    if not query or not query.strip():
+        return []
+    query = query.strip()
+    
+    if candidate_pool is None:
+        candidate_pool = min(
+            max(settings.HYBRID_CANDIDATE_POOL, skip + limit),
+            settings.HYBRID_MAX_CANDIDATE_POOL
+        )
+    
+    # 필터 조건은 FAISS ID selector로 전달하여 조건에 맞는 항목 안에서만 top-k 계산
+    try:
+        allowed_welfare_ids = get_filter_welfare_ids(db, region=region, age=age, care_target=care_target)
+    except Exception as e:
+        logger.error(f"벡터 검색 필터 계산 실패: {e}")
+        allowed_welfare_ids = set()
+    
+    # 벡터 검색은 외부 임베딩 API를 호출하므로 별도 스레드에서 먼저 시작
+    vector_future = _get_search_executor().submit(
+        _vector_candidates, query, candidate_pool, allowed_welfare_ids, min_vector_score
+    )
+    
+    try:
+        lexical = crud.search_welfare_ids_lexical(
+            db, query, region=region, age=age, care_target=care_target, limit=candidate_pool
+        )
+    except Exception as e:
+        logger.error(f"키워드 후보 검색 실패: {e}")
+        lexical = []
+    
+    try:
+        vector = vector_future.result(timeout=settings.HYBRID_VECTOR_TIMEOUT_SECONDS)
+    except FutureTimeoutError:
+        logger.warning(f"벡터 검색 시간 초과 ({settings.HYBRID_VECTOR_TIMEOUT_SECONDS}초), 키워드 결과만 사용")
+        vector = []
+    except Exception as e:
+        logger.error(f"벡터 후보 검색 실패: {e}")
+        vector = []
+    
+    lexical_ids = [welfare_id for welfare_id, _ in lexical]
+    lexical_scores = dict(lexical)
+    lexical_ranks = {welfare_id: rank for rank, welfare_id in enumerate(lexical_ids, start=1)}
+    vector_ids = [welfare_id for welfare_id, _, _ in vector]
+    vector_scores = {welfare_id: score for welfare_id, score, _ in vector}
+    vector_chunks = {welfare_id: chunk_index for welfare_id, _, chunk_index in vector if chunk_index is not None}
+    vector_ranks = {welfare_id: rank for rank, welfare_id in enumerate(vector_ids, start=1)}
+    
+    fused = reciprocal_rank_fusion({"lexical": lexical_ids, "vector": vector_ids})
+    logger.debug(f"하이브리드 검색: 키워드 {len(lexical_ids)}개, 벡터 {len(vector_ids)}개 → {len(fused)}개")
+    page = fused[skip:skip + limit]
+    
+    # 반환할 페이지의 청크 원문만 조회
+    passages = {}
+    chunk_keys = [(welfare_id, vector_chunks[welfare_id]) for welfare_id, _ in page if welfare_id in vector_chunks]
+    if chunk_keys:
+        try:
+            passages = crud.get_welfare_chunk_texts(db, chunk_keys)
+        except Exception as e:
+            logger.error(f"청크 원문 조회 실패: {e}")
+    
+    return [
+        {
+            "welfare_id": welfare_id,
+            "score": score,
+            "lexical_rank": lexical_ranks.get(welfare_id),
+            "lexical_score": lexical_scores.get(welfare_id),
+            "vector_rank": vector_ranks.get(welfare_id),
+            "vector_score": vector_scores.get(welfare_id),
+            "passage": passages.get((welfare_id, vector_chunks.get(welfare_id))),
+        }
+        for welfare_id, score in page
+    ]
+
+
 def summarize_welfare(text: str, target_level: str = "17세") -> str:
     """
     복지 정보를 17세 수준으로 요약
@@ -231,8 +1763,9 @@ def summarize_welfare(text: str, target_level: str = "17세") -> str:
         text=text
     )
     
-    # LLM API 호출
-    summary = llm_client.summarize_text(text, target_level)
+    # LLM API 호출 (크롤링 후 요약은 배치 우선순위)
+    with llm_priority(PRIORITY_BATCH):
+        summary = llm_client.summarize_text(text, target_level)
     
     return summary
 
@@ -240,7 +1773,7 @@ def summarize_welfare(text: str, target_level: str = "17세") -> str:
 def store_welfare_embedding(db: Session, welfare: models.Welfare):
     """
     복지 정보의 임베딩을 생성하여 저장
-    - DB에 임베딩 저장
+    - DB(welfare_embeddings)에 바이너리로 저장
     - 벡터 DB에도 저장
     """
     if not welfare.full_text:
@@ -248,10 +1781,12 @@ def store_welfare_embedding(db: Session, welfare: models.Welfare):
     
     # 임베딩 생성
     embedding = get_embedding(welfare.full_text)
+    if not _is_valid_embedding(embedding):
+        logger.error(f"임베딩 생성 실패 (ID: {welfare.id})")
+        return
     
     # DB에 저장
-    welfare.embedding = embedding
-    db.commit()
+    crud.save_welfare_embeddings(db, {welfare.id: embedding})
     
     # 벡터 DB에 추가
     vector_store = get_vector_store()
@@ -259,7 +1794,37 @@ def store_welfare_embedding(db: Session, welfare: models.Welfare):
         np.array([embedding]).astype('float32'),
         [welfare.id]
     )
-    vector_store.save()
+    vector_store.schedule_save()
+    _index_chunks_quietly(db, [(welfare.id, welfare.full_text)], {welfare.id: embedding})
+    invalidate_filter_cache()
+
+
+def _embed_and_save_welfares(db: Session, targets: List[Tuple[int, str]]) -> Tuple[List[int], List[List[float]], int]:
+    """
+    (ID, 원본 텍스트) 목록의 임베딩을 생성하여 DB에 저장 (이미 있으면 교체)
+    - 반환: (저장한 welfare ID 리스트, 임베딩 리스트, 실패 수)
+    """
+    try:
+        embeddings = get_embeddings([full_text for _, full_text in targets])
+    except Exception as e:
+        logger.error(f"임베딩 생성 실패 ({len(targets)}개): {e}")
+        embeddings = [None] * len(targets)
+    
+    created = {}
+    failed_count = 0
+    for (welfare_id, _), embedding in zip(targets, embeddings):
+        if not _is_valid_embedding(embedding):
+            logger.error(f"임베딩 생성 실패 (ID: {welfare_id})")
+            failed_count += 1
+            continue
+        created[welfare_id] = embedding
+    
+    if created:
+        crud.save_welfare_embeddings(db, created)
+        texts = dict(targets)
+        _index_chunks_quietly(db, [(welfare_id, texts[welfare_id]) for welfare_id in created], created)
+    
+    return list(created.keys()), list(created.values()), failed_count
 
 
 def batch_store_embeddings(db: Session, batch_size: int = 100):
@@ -267,27 +1832,13 @@ def batch_store_embeddings(db: Session, batch_size: int = 100):
     모든 복지 정보의 임베딩을 일괄 생성하여 저장
     - DB에서 임베딩이 없는 복지 정보를 가져와서 처리
     """
-    # 임베딩이 없는 복지 정보 조회
-    welfares = db.query(models.Welfare).filter(
-        models.Welfare.embedding.is_(None),
-        models.Welfare.full_text.isnot(None)
-    ).limit(batch_size).all()
+    # 임베딩이 없는 복지 정보 조회 (ID와 원본 텍스트만)
+    targets = crud.get_welfares_without_embedding(db, limit=batch_size)
     
-    if not welfares:
+    if not targets:
         return 0
     
-    vectors = []
-    welfare_ids = []
-    
-    for welfare in welfares:
-        if welfare.full_text:
-            embedding = get_embedding(welfare.full_text)
-            welfare.embedding = embedding
-            vectors.append(embedding)
-            welfare_ids.append(welfare.id)
-    
-    # DB 커밋
-    db.commit()
+    welfare_ids, vectors, _ = _embed_and_save_welfares(db, targets)
     
     # 벡터 DB에 일괄 추가
     if vectors:
@@ -296,11 +1847,346 @@ def batch_store_embeddings(db: Session, batch_size: int = 100):
             np.array(vectors).astype('float32'),
             welfare_ids
         )
-        vector_store.save()
+        vector_store.schedule_save()
+        invalidate_filter_cache()
     
     return len(welfare_ids)
 
 
+def refresh_welfare_embeddings(db: Session, welfare_ids: List[int]) -> int:
+    """
+    지정한 복지 정보의 임베딩을 다시 생성하여 DB와 벡터 인덱스에 반영
+    - 원본 텍스트가 바뀐 항목(크롤링/CSV 갱신)에 사용, 벡터는 같은 ID로 교체됨
+    - 원본 텍스트가 없어졌거나 삭제된 항목은 인덱스에서 제거
+    - 반환: 갱신된 항목 수
+    """
+    if not welfare_ids:
+        return 0
+    
+    rows = crud.get_welfare_texts(db, list(welfare_ids))
+    targets = [(welfare_id, full_text) for welfare_id, full_text in rows if full_text]
+    removed_ids = set(welfare_ids) - {welfare_id for welfare_id, _ in targets}
+    if removed_ids:
+        remove_welfare_embeddings(db, list(removed_ids))
+    if not settings.VECTOR_CHUNKING_ENABLED:
+        # 청크 검색을 다시 켤 때 새 원문으로 청크를 만들도록 이전 청크 삭제
+        crud.delete_welfare_chunks(db, [welfare_id for welfare_id, _ in targets])
+    
+    vector_store = get_vector_store()
+    refreshed = 0
+    batch_size = settings.EMBEDDING_BATCH_SIZE
+    for start in range(0, len(targets), batch_size):
+        created_ids, vectors, _ = _embed_and_save_welfares(db, targets[start:start + batch_size])
+        if vectors:
+            vector_store.upsert(created_ids, np.array(vectors).astype('float32'))
+            refreshed += len(created_ids)
+    
+    if refreshed:
+        vector_store.schedule_save()
+        invalidate_filter_cache()
+    return refreshed
+
+
+def remove_welfare_embeddings(db: Session, welfare_ids: List[int]) -> int:
+    """
+    복지 정보의 임베딩을 DB와 벡터 인덱스에서 삭제 (복지 정보 삭제 시 호출)
+    - 반환: 인덱스에서 삭제된 벡터 수
+    """
+    if not welfare_ids:
+        return 0
+    
+    crud.delete_welfare_embeddings(db, list(welfare_ids))
+    remove_welfare_chunks(db, welfare_ids)
+    vector_store = get_vector_store()
+    removed = vector_store.remove(welfare_ids)
+    if removed:
+        vector_store.schedule_save()
+        invalidate_filter_cache()
+    return removed
+
+
+def split_welfare_text(full_text: Optional[str]) -> List[str]:
+    """복지 정보 원문을 인덱싱용 청크로 분할 (최대 VECTOR_CHUNK_MAX_PER_WELFARE개)"""
+    max_chunks = min(settings.VECTOR_CHUNK_MAX_PER_WELFARE, CHUNK_ID_STRIDE)
+    return chunk_text(full_text or "", settings.VECTOR_CHUNK_SIZE, settings.VECTOR_CHUNK_OVERLAP)[:max_chunks]
+
+
+def _chunk_vector_ids(counts: Dict[int, int]) -> np.ndarray:
+    """{welfare ID: 유지할 청크 수} → 그 뒤 순서의 청크 벡터 ID (청크 수가 줄었을 때 남은 이전 청크 삭제용)"""
+    if not counts:
+        return np.empty(0, dtype='int64')
+    return np.concatenate([
+        welfare_id * CHUNK_ID_STRIDE + np.arange(count, CHUNK_ID_STRIDE, dtype='int64')
+        for welfare_id, count in counts.items()
+    ])
+
+
+def _upsert_chunk_vectors(vectors: Dict[Tuple[int, int], Sequence[float]]):
+    """{(welfare ID, 청크 순서): 벡터}를 청크 인덱스에 반영 (복지 정보별로 주어진 청크만 남김)"""
+    if not vectors:
+        return
+    chunk_store = get_chunk_store()
+    keys = list(vectors.keys())
+    chunk_store.upsert(
+        [welfare_id * CHUNK_ID_STRIDE + chunk_index for welfare_id, chunk_index in keys],
+        np.vstack([np.asarray(vectors[key], dtype='float32') for key in keys])
+    )
+    counts: Dict[int, int] = {}
+    for welfare_id, chunk_index in keys:
+        counts[welfare_id] = max(counts.get(welfare_id, 0), chunk_index + 1)
+    chunk_store.remove(_chunk_vector_ids(counts))
+
+
+def index_welfare_chunks(
+    db: Session,
+    targets: List[Tuple[int, str]],
+    document_embeddings: Optional[Dict[int, Sequence[float]]] = None
+) -> int:
+    """
+    (ID, 원본 텍스트) 목록을 청크로 나눠 임베딩하고 DB(welfare_chunks)와 청크 인덱스에 저장 (기존 청크는 교체)
+    - 청크가 하나뿐인 항목은 문서 임베딩(document_embeddings)이 있으면 다시 요청하지 않고 재사용
+    - 청크 임베딩이 하나라도 실패한 항목은 저장하지 않음 (다음 동기화 때 다시 시도)
+    - 반환: 청크를 저장한 복지 정보 수
+    """
+    document_embeddings = document_embeddings or {}
+    chunk_texts = {welfare_id: split_welfare_text(full_text) for welfare_id, full_text in targets}
+    
+    vectors: Dict[Tuple[int, int], Sequence[float]] = {}
+    pending: List[Tuple[int, int, str]] = []
+    for welfare_id, texts in chunk_texts.items():
+        if len(texts) == 1 and welfare_id in document_embeddings:
+            vectors[(welfare_id, 0)] = document_embeddings[welfare_id]
+        else:
+            pending.extend((welfare_id, chunk_index, text) for chunk_index, text in enumerate(texts))
+    
+    batch_size = settings.EMBEDDING_BATCH_SIZE
+    for start in range(0, len(pending), batch_size):
+        batch = pending[start:start + batch_size]
+        try:
+            embeddings = get_embeddings([text for _, _, text in batch])
+        except Exception as e:
+            logger.error(f"청크 임베딩 생성 실패 ({len(batch)}개): {e}")
+            continue
+        for (welfare_id, chunk_index, _), embedding in zip(batch, embeddings):
+            if _is_valid_embedding(embedding):
+                vectors[(welfare_id, chunk_index)] = embedding
+    
+    records = {}
+    for welfare_id, texts in chunk_texts.items():
+        if not texts:
+            continue
+        if all((welfare_id, chunk_index) in vectors for chunk_index in range(len(texts))):
+            records[welfare_id] = [(text, vectors[(welfare_id, chunk_index)]) for chunk_index, text in enumerate(texts)]
+        else:
+            logger.error(f"청크 임베딩 생성 실패 (ID: {welfare_id})")
+    
+    if not records:
+        return 0
+    crud.save_welfare_chunks(db, records)
+    _upsert_chunk_vectors({
+        (welfare_id, chunk_index): vectors[(welfare_id, chunk_index)]
+        for welfare_id, items in records.items()
+        for chunk_index in range(len(items))
+    })
+    get_chunk_store().schedule_save()
+    return len(records)
+
+
+def _index_chunks_quietly(
+    db: Session,
+    targets: List[Tuple[int, str]],
+    document_embeddings: Dict[int, Sequence[float]]
+):
+    """문서 임베딩 저장 후 청크 인덱싱 (설정이 꺼져 있으면 생략, 실패해도 문서 인덱싱은 유지)"""
+    if not settings.VECTOR_CHUNKING_ENABLED:
+        return
+    try:
+        index_welfare_chunks(db, targets, document_embeddings)
+    except Exception as e:
+        logger.error(f"청크 인덱싱 실패 ({len(targets)}개): {e}")
+
+
+def remove_welfare_chunks(db: Session, welfare_ids: List[int]) -> int:
+    """복지 정보의 청크를 DB와 청크 인덱스에서 삭제, 인덱스에서 삭제된 벡터 수 반환"""
+    if not welfare_ids:
+        return 0
+    
+    crud.delete_welfare_chunks(db, list(welfare_ids))
+    if not settings.VECTOR_CHUNKING_ENABLED:
+        return 0
+    chunk_store = get_chunk_store()
+    removed = chunk_store.remove(_chunk_vector_ids({welfare_id: 0 for welfare_id in welfare_ids}))
+    if removed:
+        chunk_store.schedule_save()
+    return removed
+
+
+def sync_chunk_index(db: Session) -> Dict[str, int]:
+    """
+    청크 인덱스를 DB와 일치시킴 (VECTOR_CHUNKING_ENABLED일 때 로드/동기화 과정에서 호출)
+    1) 청크가 없는 복지 정보는 청크 생성 (저장된 문서 임베딩 재사용 가능)
+    2) DB에는 청크가 있지만 인덱스에 없는 청크 추가
+    3) DB에서 삭제된 복지 정보의 청크 벡터 제거
+    
+    Returns:
+        {"added"(복지 정보 수), "restored"(청크 수), "removed"(청크 수)}
+    """
+    chunk_store = get_chunk_store()
+    result = {"added": 0, "restored": 0, "removed": 0}
+    batch_size = settings.EMBEDDING_BATCH_SIZE
+    
+    # 1) 청크 생성
+    targets = crud.get_welfares_without_chunks(db)
+    if targets:
+        logger.info(f"🔄 청크 임베딩 생성 중... (총 {len(targets)}개 항목)")
+    for start in range(0, len(targets), batch_size):
+        batch = targets[start:start + batch_size]
+        document_embeddings = crud.get_welfare_embeddings(db, [welfare_id for welfare_id, _ in batch])
+        result["added"] += index_welfare_chunks(db, batch, document_embeddings)
+    
+    # 2) 인덱스에 빠진 청크 복원 (저장된 임베딩 사용, API 호출 없음)
+    index_ids = set(chunk_store.get_id_array().tolist())
+    missing_welfare_ids = sorted({
+        welfare_id
+        for welfare_id, chunk_index in crud.get_welfare_chunk_keys(db)
+        if welfare_id * CHUNK_ID_STRIDE + chunk_index not in index_ids
+    })
+    for start in range(0, len(missing_welfare_ids), batch_size):
+        vectors = crud.get_welfare_chunk_embeddings(db, missing_welfare_ids[start:start + batch_size])
+        _upsert_chunk_vectors(vectors)
+        result["restored"] += len(vectors)
+    
+    # 3) 삭제된 복지 정보의 청크 제거
+    welfare_ids = crud.get_welfare_ids_by_filter(db)
+    orphan_ids = [chunk_id for chunk_id in index_ids if chunk_id // CHUNK_ID_STRIDE not in welfare_ids]
+    if orphan_ids:
+        result["removed"] = chunk_store.remove(orphan_ids)
+    
+    # 문서 임베딩 생성 과정에서 먼저 추가된 청크도 있으므로 예약된 저장까지 바로 실행
+    chunk_store.flush()
+    
+    logger.info(
+        f"✅ 청크 인덱스 동기화 완료: 생성 {result['added']}개 항목, 복원 {result['restored']}개, "
+        f"삭제 {result['removed']}개 (총 {chunk_store.get_size()}개 청크)"
+    )
+    return result
+
+
+def sync_vector_index(db: Session, changed_welfare_ids: Optional[List[int]] = None) -> Dict[str, int]:
+    """
+    전체 재구축 없이 벡터 인덱스를 DB와 일치시킴 (CSV 임포트/크롤링 후 호출)
+    1) 원본 텍스트가 바뀐 항목은 임베딩 재생성 후 교체
+    2) 임베딩이 없는 새 항목은 생성 후 추가
+    3) DB에는 임베딩이 있지만 인덱스에 없는 항목 추가
+    4) DB에서 삭제된 복지 정보의 벡터 제거
+    5) 청크 검색을 사용하면 청크 인덱스도 동기화 (sync_chunk_index)
+    
+    Returns:
+        {"refreshed", "added", "restored", "removed"} 항목 수 (문서 단위 인덱스 기준)
+    """
+    vector_store = get_vector_store()
+    result = {"refreshed": 0, "added": 0, "restored": 0, "removed": 0}
+    
+    # 1) 내용이 바뀐 항목 갱신
+    if changed_welfare_ids:
+        result["refreshed"] = refresh_welfare_embeddings(db, changed_welfare_ids)
+    
+    # 2) 임베딩이 없는 항목 생성
+    while True:
+        added = batch_store_embeddings(db, batch_size=settings.EMBEDDING_BATCH_SIZE)
+        result["added"] += added
+        if added == 0:
+            break
+    
+    # 3) 인덱스에 빠진 항목 복원 (저장된 임베딩 사용, API 호출 없음)
+    index_ids = vector_store.get_ids()
+    missing_ids = sorted(crud.get_embedded_welfare_ids(db) - index_ids)
+    for start in range(0, len(missing_ids), settings.EMBEDDING_BATCH_SIZE):
+        chunk = missing_ids[start:start + settings.EMBEDDING_BATCH_SIZE]
+        embeddings = crud.get_welfare_embeddings(db, chunk)
+        if embeddings:
+            vector_store.upsert(list(embeddings.keys()), np.vstack(list(embeddings.values())))
+            result["restored"] += len(embeddings)
+    
+    # 4) 삭제된 복지 정보의 벡터 제거
+    orphan_ids = index_ids - crud.get_welfare_ids_by_filter(db)
+    if orphan_ids:
+        result["removed"] = vector_store.remove(orphan_ids)
+    
+    # 배치 작업이므로 예약된 저장을 기다리지 않고 바로 스냅샷 저장
+    if any(result.values()):
+        vector_store.save()
+        invalidate_filter_cache()
+    
+    logger.info(
+        f"✅ 벡터 인덱스 동기화 완료: 갱신 {result['refreshed']}개, 추가 {result['added']}개, "
+        f"복원 {result['restored']}개, 삭제 {result['removed']}개 (총 {vector_store.get_size()}개)"
+    )
+    if settings.VECTOR_CHUNKING_ENABLED:
+        sync_chunk_index(db)
+    return result
+
+
+def _embed_missing_welfares(db: Session) -> int:
+    """임베딩이 없는 복지 정보만 묶음 요청으로 임베딩하여 DB에 저장 (비용 절감), 생성 수 반환"""
+    missing = crud.get_welfares_without_embedding(db)
+    new_embeddings_count = 0
+    failed_count = 0
+    batch_size = settings.EMBEDDING_BATCH_SIZE
+    
+    if missing:
+        logger.info(f"🔄 임베딩 생성 중... (총 {len(missing)}개 항목)")
+    for start in range(0, len(missing), batch_size):
+        try:
+            created_ids, _, failed = _embed_and_save_welfares(db, missing[start:start + batch_size])
+        except Exception as e:
+            logger.error(f"임베딩 DB 저장 실패: {e}")
+            created_ids, failed = [], len(missing[start:start + batch_size])
+        new_embeddings_count += len(created_ids)
+        failed_count += failed
+        logger.info(f"  진행 중: {min(start + batch_size, len(missing))}/{len(missing)} (새 임베딩: {new_embeddings_count}개, 실패: {failed_count}개)")
+    
+    if new_embeddings_count > 0:
+        logger.info(f"✓ {new_embeddings_count}개의 새 임베딩을 DB에 저장했습니다.")
+    return new_embeddings_count
+
+
+def _fill_vector_store(db: Session, vector_store: VectorStore, sample_size: int = 0) -> Tuple[int, List[Tuple[int, np.ndarray]]]:
+    """
+    저장된 임베딩(바이너리)을 배치로 읽어 벡터 저장소에 추가
+    - IVF 계열은 저장된 임베딩 일부로 먼저 학습
+    - sample_size: 검증용으로 무작위 추출할 (welfare ID, 벡터) 수 (reservoir sampling)
+    - 반환: (추가한 임베딩 수, 표본)
+    """
+    batch_size = settings.EMBEDDING_BATCH_SIZE
+    
+    if not vector_store.is_trained():
+        samples = []
+        sample_count = 0
+        for _, vectors in crud.iter_welfare_embeddings(db, batch_size=batch_size):
+            samples.append(vectors)
+            sample_count += len(vectors)
+            if sample_count >= settings.VECTOR_INDEX_TRAIN_SIZE:
+                break
+        if samples:
+            vector_store.train(np.vstack(samples))
+    
+    rng = np.random.default_rng()
+    reservoir: List[Tuple[int, np.ndarray]] = []
+    seen = 0
+    for welfare_ids, vectors in crud.iter_welfare_embeddings(db, batch_size=batch_size):
+        vector_store.add_vectors(vectors, welfare_ids)
+        for welfare_id, vector in zip(welfare_ids, vectors):
+            seen += 1
+            if len(reservoir) < sample_size:
+                reservoir.append((welfare_id, vector))
+            elif sample_size:
+                slot = rng.integers(seen)
+                if slot < sample_size:
+                    reservoir[slot] = (welfare_id, vector)
+    return seen, reservoir
+
+
 def load_welfares_to_vector_db(db: Session, force_rebuild: bool = False):
     """
     DB에 있는 복지 정보를 벡터 DB(FAISS)에 로드
@@ -309,95 +2195,208 @@ def load_welfares_to_vector_db(db: Session, force_rebuild: bool = False):
     
     Args:
         db: 데이터베이스 세션
-        force_rebuild: True이면 기존 인덱스를 삭제하고 재구축
+        force_rebuild: True이면 새 인덱스를 만들어 검증 후 교체 (rebuild_vector_index)
     """
-    vector_store = get_vector_store()
-    
-    # 기존 인덱스가 있고 재구축이 필요 없으면 스킵
-    if not force_rebuild and vector_store.get_size() > 0:
-        logger.info(f"✓ 기존 벡터 인덱스 사용: {vector_store.get_size()}개 벡터")
-        return
-    
-    # 재구축이 필요한 경우 기존 인덱스 삭제
     if force_rebuild:
-        logger.info("기존 벡터 인덱스 삭제 중...")
-        global _vector_store
-        vector_store_path = os.path.join(settings.VECTOR_DB_PATH, "faiss.index")
-        id_mapping_path = os.path.join(settings.VECTOR_DB_PATH, "id_mapping.pkl")
-        if os.path.exists(vector_store_path):
-            os.remove(vector_store_path)
-        if os.path.exists(id_mapping_path):
-            os.remove(id_mapping_path)
-        _vector_store = None
-        vector_store = get_vector_store()
-    
-    # DB에서 복지 정보 조회
-    welfares = db.query(models.Welfare).filter(
-        models.Welfare.full_text.isnot(None)
-    ).all()
-    
-    if not welfares:
-        logger.warning("벡터 DB에 로드할 복지 정보가 없습니다.")
+        rebuild_vector_index(db)
         return
     
-    logger.info(f"🔄 벡터 DB 초기화 중... (총 {len(welfares)}개 항목)")
+    vector_store = get_vector_store()
     
-    vectors = []
-    welfare_ids = []
-    new_embeddings_count = 0
+    # 기존 인덱스가 있으면 스킵
+    if vector_store.get_size() > 0:
+        logger.info(f"✓ 기존 벡터 인덱스 사용: {vector_store.get_size()}개 벡터")
+    else:
+        # 1) 임베딩이 없는 항목만 생성하여 DB에 저장
+        _embed_missing_welfares(db)
+        
+        # 2) 저장된 임베딩을 벡터 DB에 추가
+        logger.info("🔄 벡터 DB 초기화 중...")
+        _fill_vector_store(db, vector_store)
+        
+        if vector_store.get_size() == 0:
+            logger.warning("벡터 DB에 로드할 복지 정보가 없습니다.")
+            return
+        
+        # 인덱스 저장
+        vector_store.save()
+        invalidate_filter_cache()
+        
+        logger.info(f"✅ 벡터 DB 초기화 완료: {vector_store.get_size()}개 벡터 저장됨")
     
-    for i, welfare in enumerate(welfares):
-        if welfare.full_text:
-            # 이미 임베딩이 있으면 사용, 없으면 생성 (비용 절감)
-            if not welfare.embedding:
-                try:
-                    embedding = get_embedding(welfare.full_text)
-                    welfare.embedding = embedding
-                    new_embeddings_count += 1
-                except Exception as e:
-                    logger.error(f"임베딩 생성 실패 (ID: {welfare.id}): {e}")
-                    continue
-            else:
-                embedding = welfare.embedding
-            
-            vectors.append(embedding)
-            welfare_ids.append(welfare.id)
-            
-            # 배치로 벡터 DB에 추가 (100개씩)
-            if len(vectors) >= 100:
-                vector_store.add_vectors(
-                    np.array(vectors).astype('float32'),
-                    welfare_ids
-                )
-                vectors = []
-                welfare_ids = []
-                logger.info(f"  진행 중: {i + 1}/{len(welfares)} (새 임베딩: {new_embeddings_count}개)")
+    # 3) 청크 인덱스 로드 (빠진 청크만 생성/복원)
+    if settings.VECTOR_CHUNKING_ENABLED:
+        sync_chunk_index(db)
+
+
+# 재구축 상태 (동시에 하나만 실행)
+_rebuild_lock = threading.Lock()
+_rebuild_status: Dict = {"state": "idle"}
+
+
+def get_rebuild_status() -> Dict:
+    """벡터 인덱스 재구축 상태: idle / running / succeeded / failed"""
+    return dict(_rebuild_status)
+
+
+def validate_vector_store(
+    vector_store: VectorStore,
+    expected_count: int,
+    samples: List[Tuple[int, np.ndarray]],
+    previous_count: int = 0
+) -> Dict:
+    """
+    재구축한 인덱스 검증
+    - 개수: 넣은 임베딩 수와 같고, 기존 인덱스보다 지나치게 줄지 않았는지
+    - recall: 표본 벡터로 검색했을 때 자기 자신이 상위 K개 안에 나오는 비율
     
-    # 남은 벡터 추가
-    if vectors:
-        vector_store.add_vectors(
-            np.array(vectors).astype('float32'),
-            welfare_ids
+    Returns:
+        {"ok", "count", "expected_count", "recall", "errors"}
+    """
+    count = vector_store.get_size()
+    errors = []
+    if count == 0:
+        errors.append("인덱스가 비어 있음")
+    if count != expected_count:
+        errors.append(f"개수 불일치 (인덱스 {count}개, 임베딩 {expected_count}개)")
+    if previous_count and count < previous_count * settings.VECTOR_REBUILD_MIN_SIZE_RATIO:
+        errors.append(f"기존 인덱스({previous_count}개) 대비 크기가 너무 작음 ({count}개)")
+    
+    recall = None
+    if samples:
+        k = settings.VECTOR_REBUILD_RECALL_K
+        hits = sum(
+            1 for welfare_id, vector in samples
+            if welfare_id in vector_store.search(vector, k=k)
         )
+        recall = hits / len(samples)
+        if recall < settings.VECTOR_REBUILD_MIN_RECALL:
+            errors.append(f"recall@{k} {recall:.3f} < {settings.VECTOR_REBUILD_MIN_RECALL}")
     
-    # 인덱스 저장
-    vector_store.save()
+    return {
+        "ok": not errors,
+        "count": count,
+        "expected_count": expected_count,
+        "recall": recall,
+        "errors": errors,
+    }
+
+
+def _apply_changes(db: Session, vector_store: VectorStore, welfare_ids: Set[int]):
+    """재구축 중 기존 저장소에 반영된 변경을 새 저장소에 적용 (DB의 현재 임베딩 기준)"""
+    if not welfare_ids:
+        return
+    embeddings = crud.get_welfare_embeddings(db, list(welfare_ids))
+    if embeddings:
+        vector_store.upsert(list(embeddings.keys()), np.vstack(list(embeddings.values())))
+    removed_ids = set(welfare_ids) - set(embeddings.keys())
+    if removed_ids:
+        vector_store.remove(removed_ids)
+
+
+def _rebuild_vector_index(db: Session) -> Dict:
+    """
+    블루/그린 재구축 본체
+    1) 임베딩이 없는 항목 생성 (DB)
+    2) 저장된 임베딩으로 새 인덱스를 메모리에 구성 (기존 인덱스는 계속 검색에 사용)
+    3) 검증 (개수 + 표본 recall), 실패하면 기존 인덱스 유지
+    4) 구성 중 기존 인덱스에 들어온 변경 반영 후 스냅샷 저장
+    5) 쓰기 잠금 안에서 남은 변경 반영 후 전역 저장소 교체
+    """
+    global _vector_store
+    started = time.perf_counter()
+    old_store = get_vector_store()
+    previous_count = old_store.get_size()
+    old_store.start_change_tracking()
     
-    # DB 커밋 (새로 생성한 임베딩 저장)
-    if new_embeddings_count > 0:
-        try:
-            db.commit()
-            logger.info(f"✓ {new_embeddings_count}개의 새 임베딩을 DB에 저장했습니다.")
-        except Exception as e:
-            logger.error(f"DB 커밋 실패: {e}")
-            db.rollback()
+    try:
+        _embed_missing_welfares(db)
+        
+        logger.info("🔄 새 벡터 인덱스 구성 중... (기존 인덱스로 검색 계속)")
+        new_store = VectorStore(load_existing=False)
+        expected_count, samples = _fill_vector_store(
+            db, new_store, sample_size=settings.VECTOR_REBUILD_RECALL_SAMPLE
+        )
+        
+        validation = validate_vector_store(new_store, expected_count, samples, previous_count=previous_count)
+        if not validation["ok"]:
+            old_store.take_changed_ids(stop=True)
+            logger.error(f"❌ 새 벡터 인덱스 검증 실패, 기존 인덱스 유지: {validation['errors']}")
+            return validation
+        
+        _apply_changes(db, new_store, old_store.take_changed_ids())
+        
+        with old_store._rw_lock.write_lock():
+            # 교체 직전까지 들어온 변경 (짧은 구간이라 기존 검색은 잠깐만 대기)
+            _apply_changes(db, new_store, old_store._take_changed_ids(stop=True))
+            with _vector_store_lock:
+                _vector_store = new_store
+            old_store.retire()
+        
+        # 기존 저장소에서 이미 진행 중인 저장이 끝난 뒤에 새 스냅샷을 기록
+        # (늦게 끝난 기존 저장이 매니페스트를 기존 인덱스로 되돌리지 않도록, 쓰기 잠금 밖에서 대기)
+        old_store.flush()
+        new_store.save()
+        invalidate_filter_cache()
+    except Exception:
+        old_store.take_changed_ids(stop=True)
+        raise
     
-    logger.info(f"✅ 벡터 DB 초기화 완료: {vector_store.get_size()}개 벡터 저장됨")
+    validation["seconds"] = round(time.perf_counter() - started, 2)
+    logger.info(
+        f"✅ 벡터 인덱스 교체 완료: {previous_count}개 → {new_store.get_size()}개 "
+        f"(recall {validation['recall']}, {validation['seconds']}초)"
+    )
+    return validation
+
+
+def _run_rebuild(db: Optional[Session]) -> Dict:
+    """재구축 실행 및 상태 기록 (db가 None이면 새 세션을 열고 닫음)"""
+    own_session = db is None
+    if own_session:
+        from app.models.connection import SessionLocal
+        db = SessionLocal()
+    try:
+        result = _rebuild_vector_index(db)
+        _rebuild_status.update(
+            state="succeeded" if result["ok"] else "failed",
+            finished_at=time.strftime("%Y-%m-%dT%H:%M:%S"),
+            result=result
+        )
+        return result
+    except Exception as e:
+        logger.error(f"벡터 인덱스 재구축 실패: {e}", exc_info=True)
+        _rebuild_status.update(state="failed", finished_at=time.strftime("%Y-%m-%dT%H:%M:%S"), error=str(e))
+        raise
+    finally:
+        _rebuild_lock.release()
+        if own_session:
+            db.close()
 
 
-def rebuild_vector_index(db: Session):
+def rebuild_vector_index(db: Optional[Session] = None, background: bool = False) -> Dict:
     """
-    벡터 인덱스를 재구축합니다.
-    - 모든 복지 정보의 임베딩을 다시 생성하여 벡터 DB에 저장
+    벡터 인덱스를 재구축합니다. (블루/그린: 새 인덱스를 검증한 뒤 교체)
+    - 재구축 중에도 기존 인덱스로 검색 가능
+    - background=True이면 별도 스레드에서 실행하고 바로 반환 (새 DB 세션 사용)
+    
+    Returns:
+        재구축 상태 (get_rebuild_status와 같은 형식)
     """
-    load_welfares_to_vector_db(db, force_rebuild=True)
+    if not _rebuild_lock.acquire(blocking=False):
+        logger.warning("벡터 인덱스 재구축이 이미 진행 중입니다.")
+        return get_rebuild_status()
+    
+    _rebuild_status.clear()
+    _rebuild_status.update(state="running", started_at=time.strftime("%Y-%m-%dT%H:%M:%S"))
+    
+    if background:
+        def run():
+            try:
+                _run_rebuild(None)
+            except Exception:
+                pass  # _run_rebuild에서 로그/상태 기록
+        threading.Thread(target=run, name="vector-rebuild", daemon=True).start()
+    else:
+        _run_rebuild(db)
+    return get_rebuild_status()
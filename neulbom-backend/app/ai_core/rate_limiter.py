@@ -0,0 +1,258 @@
+"""
+LLM/임베딩 API 요청 속도 제한 (클라이언트 측)
+- 제공자별 토큰 버킷: 초당 LLM_RATE_LIMIT_PER_SECOND개 충전, 최대 LLM_RATE_LIMIT_BURST개
+- 우선순위: interactive(챗봇) > moderation(게시글/댓글 위기 감지, 가입 심사) > batch(인덱싱, 요약)
+  토큰은 항상 가장 높은 우선순위 대기열의 맨 앞 요청이 가져감 (같은 우선순위는 도착 순서)
+- 부하 차단: 예상 대기 시간이 우선순위별 최대 대기 시간을 넘거나 대기열이 가득 차면 즉시 거절
+  (대기열이 가득 차면 더 낮은 우선순위의 가장 최근 대기 요청을 대신 거절)
+- 우선순위는 컨텍스트 변수로 전달: with llm_priority(PRIORITY_BATCH): ...
+"""
+
+from typing import Dict, Optional
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+import asyncio
+import logging
+import threading
+import time
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_MODERATION = "moderation"
+PRIORITY_BATCH = "batch"
+# 높은 우선순위부터
+PRIORITIES = (PRIORITY_INTERACTIVE, PRIORITY_MODERATION, PRIORITY_BATCH)
+
+# 대기 시간 통계에 보관할 최근 요청 수 (우선순위별)
+_WAIT_SAMPLE_WINDOW = 1000
+
+_current_priority: ContextVar[str] = ContextVar("llm_priority", default=PRIORITY_INTERACTIVE)
+
+
+class RateLimitExceeded(Exception):
+    """대기열이 너무 길거나 최대 대기 시간을 넘어 요청을 보내지 않음 (부하 차단)"""
+
+
+@contextmanager
+def llm_priority(priority: str):
+    """블록 안의 LLM/임베딩 요청 우선순위 지정 (기본값: interactive)"""
+    if priority not in PRIORITIES:
+        raise ValueError(f"지원하지 않는 우선순위: {priority}")
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def current_priority() -> str:
+    """현재 컨텍스트의 요청 우선순위"""
+    return _current_priority.get()
+
+
+def _max_wait_seconds(priority: str) -> float:
+    """우선순위별 최대 대기 시간"""
+    if priority == PRIORITY_INTERACTIVE:
+        return settings.LLM_QUEUE_MAX_WAIT_INTERACTIVE_SECONDS
+    if priority == PRIORITY_MODERATION:
+        return settings.LLM_QUEUE_MAX_WAIT_MODERATION_SECONDS
+    return settings.LLM_QUEUE_MAX_WAIT_BATCH_SECONDS
+
+
+class _Waiter:
+    """대기열 항목"""
+    __slots__ = ("priority", "enqueued", "shed")
+
+    def __init__(self, priority: str):
+        self.priority = priority
+        self.enqueued = time.monotonic()
+        self.shed = False
+
+
+class PriorityRateLimiter:
+    """
+    우선순위 대기열이 있는 토큰 버킷
+    - acquire(동기, 스레드)/aacquire(비동기) 모두 같은 버킷과 대기열을 사용
+    - 대기 중인 요청은 다음 토큰이 충전될 시각까지 잠들었다가 다시 확인
+    """
+
+    def __init__(self, name: str, rate: float, burst: int, max_queue: int):
+        self.name = name
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.max_queue = max_queue
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._queues: Dict[str, deque] = {priority: deque() for priority in PRIORITIES}
+        self._lock = threading.Lock()
+        self._stats = {priority: {"acquired": 0, "queued": 0, "shed": 0, "timed_out": 0} for priority in PRIORITIES}
+        self._waits = {priority: deque(maxlen=_WAIT_SAMPLE_WINDOW) for priority in PRIORITIES}
+
+    def acquire(self, priority: Optional[str] = None) -> float:
+        """토큰 1개 획득 (필요하면 대기), 대기한 시간(초) 반환, 거절 시 RateLimitExceeded"""
+        priority = priority or current_priority()
+        waiter = self._enqueue(priority)
+        if waiter is None:
+            return 0.0
+        try:
+            while True:
+                delay = self._poll(waiter)
+                if delay is None:
+                    return time.monotonic() - waiter.enqueued
+                time.sleep(delay)
+        except BaseException:
+            self._abandon(waiter)
+            raise
+
+    async def aacquire(self, priority: Optional[str] = None) -> float:
+        """acquire의 비동기 버전 (대기는 asyncio.sleep)"""
+        priority = priority or current_priority()
+        waiter = self._enqueue(priority)
+        if waiter is None:
+            return 0.0
+        try:
+            while True:
+                delay = self._poll(waiter)
+                if delay is None:
+                    return time.monotonic() - waiter.enqueued
+                await asyncio.sleep(delay)
+        except BaseException:
+            self._abandon(waiter)
+            raise
+
+    def _refill(self, now: float):
+        """경과 시간만큼 토큰 충전 (잠금 안에서 호출)"""
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _take(self, priority: str, waited: float):
+        """토큰 1개 사용 기록 (잠금 안에서 호출)"""
+        self._tokens -= 1
+        self._stats[priority]["acquired"] += 1
+        self._waits[priority].append(waited)
+
+    def _enqueue(self, priority: str) -> Optional[_Waiter]:
+        """바로 보낼 수 있으면 토큰을 가져가고 None, 아니면 대기열에 추가 (거절 대상이면 RateLimitExceeded)"""
+        if priority not in PRIORITIES:
+            raise ValueError(f"지원하지 않는 우선순위: {priority}")
+        rank = PRIORITIES.index(priority)
+        with self._lock:
+            self._refill(time.monotonic())
+            # 같거나 높은 우선순위 대기 요청 수 (이들이 먼저 토큰을 가져감)
+            ahead = sum(len(self._queues[p]) for p in PRIORITIES[:rank + 1])
+            if ahead == 0 and self._tokens >= 1:
+                self._take(priority, 0.0)
+                return None
+
+            expected_wait = (ahead + 1 - self._tokens) / self.rate
+            if expected_wait > _max_wait_seconds(priority):
+                self._stats[priority]["shed"] += 1
+                raise RateLimitExceeded(
+                    f"{self.name} {priority} 요청 거절: 예상 대기 {expected_wait:.1f}초 (대기 {ahead}건)"
+                )
+
+            if sum(len(queue) for queue in self._queues.values()) >= self.max_queue:
+                victim = self._evict_lower(rank)
+                if victim is None:
+                    self._stats[priority]["shed"] += 1
+                    raise RateLimitExceeded(f"{self.name} {priority} 요청 거절: 대기열 가득 참 ({self.max_queue}건)")
+
+            waiter = _Waiter(priority)
+            self._queues[priority].append(waiter)
+            self._stats[priority]["queued"] += 1
+            return waiter
+
+    def _evict_lower(self, rank: int) -> Optional[_Waiter]:
+        """더 낮은 우선순위 중 가장 최근 대기 요청을 거절 처리 (잠금 안에서 호출)"""
+        for priority in reversed(PRIORITIES[rank + 1:]):
+            queue = self._queues[priority]
+            if queue:
+                victim = queue.pop()
+                victim.shed = True
+                self._stats[priority]["shed"] += 1
+                return victim
+        return None
+
+    def _poll(self, waiter: _Waiter) -> Optional[float]:
+        """토큰을 가져갔으면 None, 아니면 다시 확인할 때까지 잠들 시간(초)"""
+        with self._lock:
+            if waiter.shed:
+                raise RateLimitExceeded(f"{self.name} {waiter.priority} 요청 거절: 높은 우선순위 요청에 대기열 자리를 넘김")
+            now = time.monotonic()
+            self._refill(now)
+            head = next((queue[0] for queue in self._queues.values() if queue), None)
+            if head is waiter and self._tokens >= 1:
+                self._queues[waiter.priority].popleft()
+                self._take(waiter.priority, now - waiter.enqueued)
+                return None
+
+            remaining = waiter.enqueued + _max_wait_seconds(waiter.priority) - now
+            if remaining <= 0:
+                self._queues[waiter.priority].remove(waiter)
+                self._stats[waiter.priority]["timed_out"] += 1
+                raise RateLimitExceeded(f"{self.name} {waiter.priority} 요청 거절: 최대 대기 시간 초과")
+            # 다음 토큰 충전 시각까지 (이미 토큰이 있으면 앞 요청이 가져가도록 잠깐만)
+            next_token = max((1 - self._tokens) / self.rate, 0.005)
+            return min(next_token, remaining)
+
+    def _abandon(self, waiter: _Waiter):
+        """대기 중 예외/취소로 빠진 요청을 대기열에서 제거"""
+        with self._lock:
+            queue = self._queues[waiter.priority]
+            if waiter in queue:
+                queue.remove(waiter)
+
+    def get_stats(self) -> Dict:
+        """우선순위별 처리/거절 수, 현재 대기열 길이, 대기 시간 분포(ms)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            stats = {"rate_per_second": self.rate, "burst": self.burst, "tokens": round(self._tokens, 2)}
+            for priority in PRIORITIES:
+                entry = dict(self._stats[priority])
+                entry["queue_depth"] = len(self._queues[priority])
+                waits = sorted(self._waits[priority])
+                if waits:
+                    entry["wait_ms"] = {
+                        "avg": round(sum(waits) / len(waits) * 1000, 1),
+                        "p50": round(waits[len(waits) // 2] * 1000, 1),
+                        "p95": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))] * 1000, 1),
+                        "max": round(waits[-1] * 1000, 1),
+                    }
+                stats[priority] = entry
+            return stats
+
+
+# 전역 제한기 (제공자별 1개, 채팅/임베딩 요청이 함께 사용)
+_limiters: Dict[str, PriorityRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str) -> Optional[PriorityRateLimiter]:
+    """제공자별 요청 속도 제한기 (LLM_RATE_LIMIT_PER_SECOND가 0 이하이면 None)"""
+    if settings.LLM_RATE_LIMIT_PER_SECOND <= 0:
+        return None
+    limiter = _limiters.get(provider)
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.get(provider)
+            if limiter is None:
+                limiter = _limiters[provider] = PriorityRateLimiter(
+                    provider,
+                    rate=settings.LLM_RATE_LIMIT_PER_SECOND,
+                    burst=settings.LLM_RATE_LIMIT_BURST,
+                    max_queue=settings.LLM_RATE_LIMIT_MAX_QUEUE
+                )
+    return limiter
+
+
+def get_rate_limiter_stats() -> Optional[Dict]:
+    """전체 속도 제한기 상태 (헬스 체크용, 사용하지 않으면 None)"""
+    if settings.LLM_RATE_LIMIT_PER_SECOND <= 0:
+        return None
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return {limiter.name: limiter.get_stats() for limiter in limiters}
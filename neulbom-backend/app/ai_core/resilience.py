@@ -0,0 +1,287 @@
+"""
+LLM/임베딩 제공자 호출 보호
+- 재시도 가능한 오류(429, 5xx, timeout, 연결 오류)는 지수 백오프(+지터)로 제한된 횟수만 재시도
+- 제공자/작업(chat, embedding)별 서킷 브레이커: 최근 호출의 오류율 또는 느린 호출 비율이 기준을 넘으면 열림
+- 열린 브레이커는 호출하지 않고 즉시 실패 (LLMClient가 다른 제공자로 전환)
+- 열린 뒤 일정 시간이 지나면 시험 호출 1건만 허용 (성공 시 닫힘, 실패 시 다시 열림)
+- 매 시도 전에 제공자별 속도 제한기에서 토큰을 받음 (대기 시간은 브레이커 지연 판단에서 제외)
+"""
+
+from typing import Callable, Dict, Optional, TypeVar
+from collections import deque
+import asyncio
+import logging
+import random
+import threading
+import time
+
+import httpx
+
+from app.core.config import settings
+from app.ai_core.rate_limiter import RateLimitExceeded, get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 재시도할 HTTP 상태 코드 (요청 시간 초과, 충돌, 요청 한도 초과, 서버 오류)
+RETRYABLE_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504}
+
+
+class ProviderError(Exception):
+    """
+    제공자 호출 실패
+    - retryable: 일시적 오류 여부 (재시도 대상, 브레이커 실패로 집계)
+    - retry_after: 응답의 Retry-After 헤더 값(초)
+    """
+
+    def __init__(self, message: str, retryable: bool = False, status_code: Optional[int] = None,
+                 retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retryable = retryable
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(ProviderError):
+    """서킷 브레이커가 열려 호출하지 않음"""
+
+
+class LoadShedError(ProviderError):
+    """속도 제한 대기열에서 거절되어 호출하지 않음"""
+
+
+def acquire_rate_limit(name: str):
+    """호출 전 제공자별 속도 제한 토큰 획득 (name: "제공자:작업", 거절 시 LoadShedError)"""
+    limiter = get_rate_limiter(name.split(":")[0])
+    if limiter is None:
+        return
+    try:
+        limiter.acquire()
+    except RateLimitExceeded as e:
+        raise LoadShedError(str(e)) from e
+
+
+async def aacquire_rate_limit(name: str):
+    """acquire_rate_limit의 비동기 버전"""
+    limiter = get_rate_limiter(name.split(":")[0])
+    if limiter is None:
+        return
+    try:
+        await limiter.aacquire()
+    except RateLimitExceeded as e:
+        raise LoadShedError(str(e)) from e
+
+
+def http_status_error(response, context: str) -> ProviderError:
+    """HTTP 오류 응답을 ProviderError로 변환 (상태 코드로 재시도 여부 결정)"""
+    retry_after = None
+    header = response.headers.get("retry-after") if hasattr(response, "headers") else None
+    if header:
+        try:
+            retry_after = float(header)
+        except ValueError:
+            pass
+    return ProviderError(
+        f"{context}: HTTP {response.status_code} - {response.text[:200]}",
+        retryable=response.status_code in RETRYABLE_STATUS_CODES,
+        status_code=response.status_code,
+        retry_after=retry_after
+    )
+
+
+def transport_error(error: Exception, context: str) -> ProviderError:
+    """
+    HTTP 전송 오류/SDK 예외를 ProviderError로 변환
+    - timeout, 연결 오류는 재시도 대상
+    - SDK 예외는 code 속성(HTTP 상태 코드)이 있으면 그 값으로 판단
+    """
+    if isinstance(error, ProviderError):
+        return error
+    if isinstance(error, (httpx.TimeoutException, httpx.TransportError, TimeoutError, ConnectionError)):
+        return ProviderError(f"{context}: {type(error).__name__} {error}", retryable=True)
+    status_code = getattr(error, "code", None)
+    if isinstance(status_code, int):
+        return ProviderError(f"{context}: {error}", retryable=status_code in RETRYABLE_STATUS_CODES, status_code=status_code)
+    return ProviderError(f"{context}: {type(error).__name__} {error}")
+
+
+class CircuitBreaker:
+    """
+    제공자별 서킷 브레이커 (closed → open → half_open → closed/open)
+    - 최근 LLM_BREAKER_WINDOW건의 (실패 여부, 소요 시간)으로 판단
+    - 재시도 대상이 아닌 오류(잘못된 요청 등)는 제공자 장애가 아니므로 정상 응답으로 집계
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.state = "closed"
+        self._calls = deque(maxlen=settings.LLM_BREAKER_WINDOW)
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "failures": 0, "slow_calls": 0, "rejected": 0, "opened": 0}
+
+    def allow_request(self) -> bool:
+        """호출 가능 여부 (열린 상태면 False, 시험 호출 시점이면 1건만 True)"""
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and time.monotonic() - self._opened_at >= settings.LLM_BREAKER_OPEN_SECONDS:
+                self.state = "half_open"
+                self._probe_in_flight = False
+                logger.info(f"서킷 브레이커 시험 호출 허용: {self.name}")
+            if self.state == "half_open" and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self._stats["rejected"] += 1
+            return False
+
+    def record(self, elapsed: float, failed: bool):
+        """호출 결과 기록 (elapsed: 소요 시간 초)"""
+        slow = elapsed >= settings.LLM_BREAKER_SLOW_CALL_SECONDS
+        with self._lock:
+            self._stats["calls"] += 1
+            self._stats["failures"] += int(failed)
+            self._stats["slow_calls"] += int(slow)
+            if self.state == "half_open":
+                self._probe_in_flight = False
+                if failed or slow:
+                    self._open(f"시험 호출 {'실패' if failed else '지연'} ({elapsed:.1f}초)")
+                else:
+                    self.state = "closed"
+                    self._calls.clear()
+                    logger.info(f"서킷 브레이커 닫힘: {self.name}")
+                return
+
+            self._calls.append((failed, slow))
+            if self.state != "closed" or len(self._calls) < settings.LLM_BREAKER_MIN_CALLS:
+                return
+            error_rate = sum(1 for f, _ in self._calls if f) / len(self._calls)
+            slow_rate = sum(1 for _, s in self._calls if s) / len(self._calls)
+            if error_rate >= settings.LLM_BREAKER_ERROR_RATE:
+                self._open(f"오류율 {error_rate:.0%}")
+            elif slow_rate >= settings.LLM_BREAKER_SLOW_CALL_RATE:
+                self._open(f"느린 호출 비율 {slow_rate:.0%}")
+
+    def release(self):
+        """결과 없이 끝난 호출(취소 등)의 시험 호출 자리 반납"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def _open(self, reason: str):
+        """브레이커 열기 (잠금 안에서 호출)"""
+        self.state = "open"
+        self._opened_at = time.monotonic()
+        self._calls.clear()
+        self._stats["opened"] += 1
+        logger.warning(f"서킷 브레이커 열림: {self.name} ({reason}), {settings.LLM_BREAKER_OPEN_SECONDS}초 동안 호출 중단")
+
+    def get_stats(self) -> Dict:
+        """상태와 누적 호출 통계"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["state"] = self.state
+            if self.state == "open":
+                stats["retry_in_seconds"] = round(
+                    max(0.0, settings.LLM_BREAKER_OPEN_SECONDS - (time.monotonic() - self._opened_at)), 1
+                )
+            return stats
+
+
+# 전역 브레이커 ("upstage:chat", "gemini:embedding" 등 이름별 1개)
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """이름별 서킷 브레이커 인스턴스를 반환합니다."""
+    breaker = _breakers.get(name)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.get(name)
+            if breaker is None:
+                breaker = _breakers[name] = CircuitBreaker(name)
+    return breaker
+
+
+def get_circuit_breaker_stats() -> Dict:
+    """전체 서킷 브레이커 상태 (헬스 체크용)"""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.get_stats() for breaker in breakers}
+
+
+def backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """
+    재시도 대기 시간 (attempt: 0부터 시작한 실패 횟수)
+    - 지수 백오프 + 지터, Retry-After가 있으면 그 값 (모두 최대 대기 시간 이하)
+    """
+    if retry_after is not None:
+        return min(max(retry_after, 0.0), settings.LLM_RETRY_MAX_DELAY_SECONDS)
+    delay = min(settings.LLM_RETRY_BASE_DELAY_SECONDS * (2 ** attempt), settings.LLM_RETRY_MAX_DELAY_SECONDS)
+    return delay * random.uniform(0.5, 1.0)
+
+
+def call_with_retry(name: str, func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    서킷 브레이커와 재시도를 적용해 호출
+    - func는 실패 시 ProviderError를 발생시켜야 함 (그 외 예외는 재시도하지 않는 실패로 처리)
+    - 브레이커가 열려 있으면 CircuitOpenError, 속도 제한에서 거절되면 LoadShedError,
+      재시도를 모두 실패하면 마지막 ProviderError
+    """
+    breaker = get_circuit_breaker(name)
+    attempts = max(1, settings.LLM_RETRY_MAX_ATTEMPTS)
+    for attempt in range(attempts):
+        if not breaker.allow_request():
+            raise CircuitOpenError(f"{name} 서킷 브레이커 열림")
+        try:
+            acquire_rate_limit(name)
+        except BaseException:
+            breaker.release()
+            raise
+        started = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            error = transport_error(e, name)
+            breaker.record(time.perf_counter() - started, failed=error.retryable)
+            if not error.retryable or attempt == attempts - 1:
+                raise error
+            delay = backoff_delay(attempt, error.retry_after)
+            logger.warning(f"{name} 호출 실패, {delay:.2f}초 후 재시도 ({attempt + 1}/{attempts - 1}): {error}")
+            time.sleep(delay)
+            continue
+        breaker.record(time.perf_counter() - started, failed=False)
+        return result
+
+
+async def acall_with_retry(name: str, func: Callable, *args, **kwargs):
+    """call_with_retry의 비동기 버전 (func는 코루틴 함수, 대기는 asyncio.sleep)"""
+    breaker = get_circuit_breaker(name)
+    attempts = max(1, settings.LLM_RETRY_MAX_ATTEMPTS)
+    for attempt in range(attempts):
+        if not breaker.allow_request():
+            raise CircuitOpenError(f"{name} 서킷 브레이커 열림")
+        try:
+            await aacquire_rate_limit(name)
+        except BaseException:
+            breaker.release()
+            raise
+        started = time.perf_counter()
+        try:
+            result = await func(*args, **kwargs)
+        except asyncio.CancelledError:
+            breaker.release()
+            raise
+        except Exception as e:
+            error = transport_error(e, name)
+            breaker.record(time.perf_counter() - started, failed=error.retryable)
+            if not error.retryable or attempt == attempts - 1:
+                raise error
+            delay = backoff_delay(attempt, error.retry_after)
+            logger.warning(f"{name} 호출 실패, {delay:.2f}초 후 재시도 ({attempt + 1}/{attempts - 1}): {error}")
+            await asyncio.sleep(delay)
+            continue
+        breaker.record(time.perf_counter() - started, failed=False)
+        return result
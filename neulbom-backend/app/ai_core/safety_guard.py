@@ -5,7 +5,7 @@
 - 2차: LLM 감정 분석을 통한 은유적/맥락적 위기 상황 판단 (정확도)
 """
 
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 import logging
 from app.core.config import settings
 from app.ai_core.llm_client import llm_client
@@ -106,19 +106,72 @@ def analyze_crisis_level(text: str, use_llm: bool = True) -> Dict:
     
     Args:
         text: 분석할 텍스트
-        use_llm: LLM 감정 분석 사용 여부
+        use_llm: LLM 분석 사용 여부
     
     Returns:
         Dict: 위기 수준 정보
+        - LLM 분석을 한 경우 "turn_analysis"에 대화 턴 분석 결과(감정 점수, 복지 정보 질문 여부 포함)를 담아
+          채팅 응답 생성 단계에서 다시 호출하지 않고 재사용
     """
     if not text or not text.strip():
-        return {
-            "level": "low",
-            "is_crisis": False,
-            "info": None,
-            "detection_method": None
-        }
+        return _no_crisis()
+    
+    keyword_result, warning_keyword_count = _keyword_crisis_level(text)
+    if keyword_result is not None:
+        return keyword_result
+    
+    # 2차: LLM 대화 턴 분석 (위기 수준 + 감정을 1회 호출로 판단)
+    if use_llm:
+        try:
+            turn_analysis = llm_client.analyze_turn(text)
+        except Exception as e:
+            logger.error(f"LLM 분석 오류: {e}")
+            return _llm_failure_crisis_level(warning_keyword_count)
+        return _turn_crisis_level(turn_analysis, warning_keyword_count)
+    
+    # 위기 상황 아님
+    return _no_crisis()
+
+
+async def aanalyze_crisis_level(text: str, use_llm: bool = True) -> Dict:
+    """analyze_crisis_level의 비동기 버전 (LLM 분석을 await)"""
+    if not text or not text.strip():
+        return _no_crisis()
+    
+    keyword_result, warning_keyword_count = _keyword_crisis_level(text)
+    if keyword_result is not None:
+        return keyword_result
+    
+    if use_llm:
+        try:
+            turn_analysis = await llm_client.aanalyze_turn(text)
+        except Exception as e:
+            logger.error(f"LLM 분석 오류: {e}")
+            return _llm_failure_crisis_level(warning_keyword_count)
+        return _turn_crisis_level(turn_analysis, warning_keyword_count)
     
+    return _no_crisis()
+
+
+# 위기 수준 순서 (높을수록 심각)
+_LEVEL_RANK = {"low": 0, "medium": 1, "high": 2}
+
+
+def _no_crisis() -> Dict:
+    """위기 상황 아님"""
+    return {
+        "level": "low",
+        "is_crisis": False,
+        "info": None,
+        "detection_method": None
+    }
+
+
+def _keyword_crisis_level(text: str) -> Tuple[Optional[Dict], int]:
+    """
+    1차: 고위험 키워드 기반 판단
+    - 반환: (고위험 키워드가 있으면 위기 정보 아니면 None, 경고 키워드 개수)
+    """
     text_lower = text.lower()
     
     # 1차: 고위험 키워드 개수 확인
@@ -140,64 +193,90 @@ def analyze_crisis_level(text: str, use_llm: bool = True) -> Dict:
             "info": get_crisis_info(),
             "detection_method": "keyword",
             "keyword_count": crisis_keyword_count
-        }
+        }, warning_keyword_count
     
-    # 2차: LLM 감정 분석
-    if use_llm:
+    return None, warning_keyword_count
+
+
+def _sentiment_crisis_level(sentiment: Dict, warning_keyword_count: int) -> Optional[Dict]:
+    """2차: LLM 감정 분석 결과 기반 판단 (위기가 아니면 None)"""
+    sentiment_score = sentiment.get("score", 0.5)
+    sentiment_label = sentiment.get("sentiment", "neutral")
+    
+    # 매우 부정적인 감정 분석
+    if sentiment_score < 0.25:
+        level = "high"
+        return {
+            "level": level,
+            "is_crisis": True,
+            "info": get_crisis_info(),
+            "detection_method": "llm",
+            "sentiment_score": sentiment_score,
+            "sentiment_label": sentiment_label
+        }
+    elif sentiment_score < 0.35:
+        level = "medium"
+        return {
+            "level": level,
+            "is_crisis": True,
+            "info": get_crisis_info(),
+            "detection_method": "llm",
+            "sentiment_score": sentiment_score,
+            "sentiment_label": sentiment_label
+        }
+    elif sentiment_score < 0.4 and warning_keyword_count >= 2:
+        # 부정적 감정 + 경고 키워드 다수
+        level = "medium"
+        return {
+            "level": level,
+            "is_crisis": True,
+            "info": get_crisis_info(),
+            "detection_method": "hybrid",
+            "sentiment_score": sentiment_score,
+            "warning_keyword_count": warning_keyword_count
+        }
+    return None
+
+
+def _turn_crisis_level(turn_analysis: Dict, warning_keyword_count: int) -> Dict:
+    """
+    대화 턴 분석 결과 기반 판단
+    - 감정 점수 기준(_sentiment_crisis_level)과 LLM이 판단한 위기 수준 중 높은 쪽 사용
+    - 분석 실패(source가 "fallback")는 LLM 실패와 같이 경고 키워드로 판단
+    """
+    if turn_analysis.get("source") != "llm":
+        result = _llm_failure_crisis_level(warning_keyword_count)
+    else:
         try:
-            sentiment = llm_client.analyze_sentiment(text)
-            sentiment_score = sentiment.get("score", 0.5)
-            sentiment_label = sentiment.get("sentiment", "neutral")
-            
-            # 매우 부정적인 감정 분석
-            if sentiment_score < 0.25:
-                level = "high"
-                return {
-                    "level": level,
-                    "is_crisis": True,
-                    "info": get_crisis_info(),
-                    "detection_method": "llm",
-                    "sentiment_score": sentiment_score,
-                    "sentiment_label": sentiment_label
-                }
-            elif sentiment_score < 0.35:
-                level = "medium"
-                return {
-                    "level": level,
-                    "is_crisis": True,
-                    "info": get_crisis_info(),
-                    "detection_method": "llm",
-                    "sentiment_score": sentiment_score,
-                    "sentiment_label": sentiment_label
-                }
-            elif sentiment_score < 0.4 and warning_keyword_count >= 2:
-                # 부정적 감정 + 경고 키워드 다수
-                level = "medium"
-                return {
-                    "level": level,
-                    "is_crisis": True,
-                    "info": get_crisis_info(),
-                    "detection_method": "hybrid",
-                    "sentiment_score": sentiment_score,
-                    "warning_keyword_count": warning_keyword_count
-                }
+            result = _sentiment_crisis_level(turn_analysis, warning_keyword_count) or _no_crisis()
         except Exception as e:
-            logger.error(f"LLM 감정 분석 오류: {e}")
-            # LLM 실패 시 경고 키워드가 많으면 위기로 판단
-            if warning_keyword_count >= 3:
-                return {
-                    "level": "medium",
-                    "is_crisis": True,
-                    "info": get_crisis_info(),
-                    "detection_method": "keyword_fallback",
-                    "warning_keyword_count": warning_keyword_count
-                }
+            logger.error(f"LLM 분석 결과 처리 오류: {e}")
+            result = _llm_failure_crisis_level(warning_keyword_count)
+        
+        llm_level = turn_analysis.get("crisis_level")
+        if llm_level in ("medium", "high") and _LEVEL_RANK[llm_level] > _LEVEL_RANK[result["level"]]:
+            logger.warning(f"LLM 기반 위기 감지: {llm_level}")
+            result = {
+                "level": llm_level,
+                "is_crisis": True,
+                "info": get_crisis_info(),
+                "detection_method": "llm",
+                "sentiment_score": turn_analysis.get("score"),
+                "sentiment_label": turn_analysis.get("sentiment")
+            }
     
-    # 위기 상황 아님
-    return {
-        "level": "low",
-        "is_crisis": False,
-        "info": None,
-        "detection_method": None
-    }
+    result["turn_analysis"] = turn_analysis
+    return result
+
 
+def _llm_failure_crisis_level(warning_keyword_count: int) -> Dict:
+    """LLM 실패 시 경고 키워드가 많으면 위기로 판단"""
+    if warning_keyword_count >= 3:
+        return {
+            "level": "medium",
+            "is_crisis": True,
+            "info": get_crisis_info(),
+            "detection_method": "keyword_fallback",
+            "warning_keyword_count": warning_keyword_count
+        }
+    return _no_crisis()
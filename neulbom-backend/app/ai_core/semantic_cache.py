@@ -0,0 +1,232 @@
+"""
+의미 기반 검색 결과 캐시
+- 새 쿼리 임베딩이 최근 검색한 쿼리와 코사인 유사도 임계값 이상이면 그 검색 결과(welfare ID 순위)를 재사용
+- 검색 조건(limit/offset/필터/최소 점수)이 같은 항목끼리만 비교
+- 벡터 인덱스가 바뀌면(인덱스 세대 변경) 전체 무효화
+- 적중 일부는 실제 검색과 비교하여 재사용 결과가 얼마나 달라지는지(drift) 기록
+- 재사용하는 것은 벡터 검색 결과(welfare ID, 점수)뿐이며, 카드 조회(DB)와 하이브리드 검색의 키워드 검색은 매번 실행
+  (복지 정보 수정이 인덱스 세대를 항상 바꾸지는 않아 카드 내용을 캐시하면 오래된 정보를 보여줄 수 있음)
+"""
+
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+from collections import OrderedDict
+import logging
+import random
+import threading
+import time
+
+import numpy as np
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticResultCache:
+    """쿼리 임베딩 유사도 기반 검색 결과 캐시 (최근 항목 LRU + TTL)"""
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        threshold: Optional[float] = None,
+        ttl_seconds: Optional[float] = None,
+        verify_rate: Optional[float] = None
+    ):
+        """
+        max_size: 보관할 최대 쿼리 수
+        threshold: 재사용할 최소 코사인 유사도
+        ttl_seconds: 항목 유지 시간
+        verify_rate: 적중 중 실제 검색으로 결과 차이를 확인할 비율 (0~1)
+        """
+        self.max_size = max_size if max_size is not None else settings.SEMANTIC_CACHE_SIZE
+        self.threshold = threshold if threshold is not None else settings.SEMANTIC_CACHE_THRESHOLD
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.SEMANTIC_CACHE_TTL_SECONDS
+        self.verify_rate = verify_rate if verify_rate is not None else settings.SEMANTIC_CACHE_VERIFY_RATE
+
+        # 정규화된 쿼리 벡터 행렬 (행 = 슬롯), 슬롯별 항목은 LRU 순서로 관리
+        self._matrix: Optional[np.ndarray] = None
+        # {슬롯: (검색 조건 키, 저장 시각, 결과)}
+        self._entries: "OrderedDict[int, Tuple[Hashable, float, List]]" = OrderedDict()
+        self._index_version: Optional[Hashable] = None
+        self._lock = threading.Lock()
+        self._stats = {
+            "lookups": 0,
+            "hits": 0,
+            "stores": 0,
+            "invalidations": 0,
+            "hit_similarity_sum": 0.0,
+            "verified": 0,
+            "overlap_sum": 0.0,
+            "min_overlap": None,
+        }
+
+    def get_or_search(
+        self,
+        query_vector,
+        params: Hashable,
+        index_version: Hashable,
+        search: Callable[[], List]
+    ) -> List:
+        """
+        비슷한 쿼리의 결과가 있으면 재사용, 없으면 search()를 실행하고 저장
+        - params: 검색 조건 키 (같은 조건끼리만 재사용)
+        - index_version: 현재 인덱스 세대 (저장된 세대와 다르면 캐시 전체 무효화)
+        - 결과 항목의 첫 값은 welfare ID여야 함 (drift 계산용)
+        """
+        return self.get_many_or_search(
+            np.asarray(query_vector, dtype=np.float32).reshape(1, -1),
+            params,
+            index_version,
+            lambda rows: [search()]
+        )[0]
+
+    def get_many_or_search(
+        self,
+        query_vectors,
+        params: Hashable,
+        index_version: Hashable,
+        search: Callable[[List[int]], List[List]]
+    ) -> List[List]:
+        """
+        get_or_search의 여러 쿼리 버전
+        - 재사용할 결과가 없는 쿼리(와 drift 확인 대상)만 모아 search(행 번호 리스트)를 한 번 호출
+        - search는 받은 행 번호 순서대로 결과 리스트를 반환해야 함
+        - 반환: 쿼리 순서대로 결과 리스트
+        """
+        queries = np.asarray(query_vectors, dtype=np.float32)
+        norms = np.linalg.norm(queries, axis=1)
+        results: List[Optional[List]] = [None] * len(queries)
+        verify = []
+        for row in range(len(queries)):
+            if norms[row] == 0.0:
+                continue
+            cached = self._lookup(queries[row] / norms[row], params, index_version)
+            if cached is None:
+                continue
+            results[row] = cached[0]
+            if self.verify_rate > 0 and random.random() < self.verify_rate:
+                verify.append(row)
+
+        missing = [row for row, found in enumerate(results) if found is None]
+        if not missing and not verify:
+            return results
+        fresh = search(missing + verify)
+        for row, found in zip(missing + verify, fresh):
+            if results[row] is None:
+                results[row] = found
+                if norms[row] != 0.0:
+                    self._store(queries[row] / norms[row], params, index_version, found)
+            else:
+                self._record_drift(results[row], found)
+        return results
+
+    def invalidate(self):
+        """전체 항목 삭제"""
+        with self._lock:
+            self._clear()
+
+    def get_stats(self) -> Dict:
+        """적중률, 적중 시 평균 유사도, 결과 재사용 검증(겹침 비율) 통계"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        hit_similarity_sum = stats.pop("hit_similarity_sum")
+        overlap_sum = stats.pop("overlap_sum")
+        stats["hit_rate"] = round(stats["hits"] / stats["lookups"], 4) if stats["lookups"] else 0.0
+        stats["avg_hit_similarity"] = round(hit_similarity_sum / stats["hits"], 4) if stats["hits"] else None
+        # 재사용 결과와 실제 검색 결과의 상위 항목 겹침 비율 (1이면 같음, drift = 1 - overlap)
+        stats["avg_overlap"] = round(overlap_sum / stats["verified"], 4) if stats["verified"] else None
+        return stats
+
+    def _lookup(self, query: np.ndarray, params: Hashable, index_version: Hashable) -> Optional[Tuple[List, float]]:
+        """같은 조건의 항목 중 가장 비슷한 쿼리의 결과 (임계값 미만/만료면 None)"""
+        now = time.monotonic()
+        with self._lock:
+            self._stats["lookups"] += 1
+            if index_version != self._index_version:
+                if self._entries:
+                    self._stats["invalidations"] += 1
+                self._clear()
+                self._index_version = index_version
+                return None
+            if not self._entries or self._matrix is None or self._matrix.shape[1] != len(query):
+                return None
+
+            similarities = self._matrix @ query
+            for slot in np.argsort(-similarities):
+                similarity = float(similarities[slot])
+                if similarity < self.threshold:
+                    return None
+                entry = self._entries.get(int(slot))
+                if entry is None or entry[0] != params:
+                    continue
+                if now - entry[1] >= self.ttl_seconds:
+                    self._release(int(slot))
+                    continue
+                self._entries.move_to_end(int(slot))
+                self._stats["hits"] += 1
+                self._stats["hit_similarity_sum"] += similarity
+                return entry[2], similarity
+            return None
+
+    def _store(self, query: np.ndarray, params: Hashable, index_version: Hashable, results: List):
+        """새 항목 저장 (가득 차면 가장 오래 사용하지 않은 슬롯 재사용)"""
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            if index_version != self._index_version:
+                return
+            if self._matrix is None or self._matrix.shape[1] != len(query):
+                self._clear()
+                self._matrix = np.zeros((self.max_size, len(query)), dtype=np.float32)
+            if len(self._entries) >= self.max_size:
+                slot = next(iter(self._entries))
+                self._release(slot)
+            else:
+                used = set(self._entries)
+                slot = next(slot for slot in range(self.max_size) if slot not in used)
+            self._matrix[slot] = query
+            self._entries[slot] = (params, time.monotonic(), list(results))
+            self._stats["stores"] += 1
+
+    def _release(self, slot: int):
+        """슬롯 비우기 (호출 측에서 lock 보유, 빈 행은 유사도 0이라 임계값에 걸리지 않음)"""
+        self._entries.pop(slot, None)
+        self._matrix[slot] = 0.0
+
+    def _clear(self):
+        """전체 비우기 (호출 측에서 lock 보유)"""
+        self._entries.clear()
+        if self._matrix is not None:
+            self._matrix[:] = 0.0
+
+    def _record_drift(self, reused: List, fresh: List):
+        """재사용 결과와 실제 검색 결과의 welfare ID 겹침 비율 기록"""
+        reused_ids = {item[0] for item in reused}
+        fresh_ids = {item[0] for item in fresh}
+        union = reused_ids | fresh_ids
+        overlap = len(reused_ids & fresh_ids) / len(union) if union else 1.0
+        with self._lock:
+            self._stats["verified"] += 1
+            self._stats["overlap_sum"] += overlap
+            if self._stats["min_overlap"] is None or overlap < self._stats["min_overlap"]:
+                self._stats["min_overlap"] = round(overlap, 4)
+        if overlap < 0.5:
+            logger.debug(f"의미 캐시 재사용 결과 차이 큼 (겹침 {overlap:.2f})")
+
+
+# 전역 의미 캐시 인스턴스
+_semantic_cache: Optional[SemanticResultCache] = None
+_semantic_cache_lock = threading.Lock()
+
+
+def get_semantic_cache() -> Optional[SemanticResultCache]:
+    """의미 기반 결과 캐시 싱글톤 인스턴스를 반환합니다. (SEMANTIC_CACHE_SIZE가 0이면 None)"""
+    global _semantic_cache
+    if settings.SEMANTIC_CACHE_SIZE <= 0:
+        return None
+    if _semantic_cache is None:
+        with _semantic_cache_lock:
+            if _semantic_cache is None:
+                _semantic_cache = SemanticResultCache()
+    return _semantic_cache
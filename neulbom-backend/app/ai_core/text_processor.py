@@ -35,37 +35,67 @@ def extract_text_from_hwp(hwp_path: str) -> str:
     return ""
 
 
+# 문장 경계: 마침표/물음표/느낌표(한국어 종결 포함) 뒤의 공백, 또는 줄바꿈
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?。])\s+|\n+')
+
+
+def _split_long_sentence(sentence: str, chunk_size: int) -> List[str]:
+    """chunk_size보다 긴 문장을 공백 위치에서 잘라 여러 조각으로 분할 (공백이 없으면 글자 수로 자름)"""
+    pieces = []
+    while len(sentence) > chunk_size:
+        cut = sentence.rfind(" ", 0, chunk_size + 1)
+        if cut <= 0:
+            cut = chunk_size
+        pieces.append(sentence[:cut].strip())
+        sentence = sentence[cut:].strip()
+    if sentence:
+        pieces.append(sentence)
+    return pieces
+
+
 def chunk_text(text: str, chunk_size: int = 1000, overlap: int = 200) -> List[str]:
     """
     텍스트를 청크로 분할
     - chunk_size: 각 청크의 최대 길이
-    - overlap: 청크 간 겹치는 부분
+    - overlap: 청크 간 겹치는 부분 (이전 청크 끝의 문장 단위, 최대 overlap 글자)
+    - 문단/문장 경계에서 자르고 문장 부호는 유지, chunk_size보다 긴 문장은 공백 위치에서 분할
     """
-    # 문장 단위로 분할
-    sentences = re.split(r'[.!?]\s+', text)
+    if not text or not text.strip():
+        return []
+    
+    # 문장 단위로 분할 (각 문장 안의 연속 공백은 정리)
+    sentences = []
+    for sentence in _SENTENCE_BOUNDARY.split(text):
+        sentence = clean_text(sentence)
+        if sentence:
+            sentences.extend(_split_long_sentence(sentence, chunk_size))
     
     chunks = []
-    current_chunk = ""
+    current: List[str] = []
+    current_length = 0
     
     for sentence in sentences:
         # 현재 청크에 문장 추가 시 길이 초과 여부 확인
-        if len(current_chunk) + len(sentence) > chunk_size:
-            if current_chunk:
-                chunks.append(current_chunk.strip())
+        if current and current_length + 1 + len(sentence) > chunk_size:
+            chunks.append(" ".join(current))
             
-            # overlap을 고려하여 이전 청크의 끝부분 포함
-            if overlap > 0 and chunks:
-                prev_chunk = chunks[-1]
-                overlap_text = prev_chunk[-overlap:] if len(prev_chunk) > overlap else prev_chunk
-                current_chunk = overlap_text + " " + sentence
-            else:
-                current_chunk = sentence
-        else:
-            current_chunk += " " + sentence if current_chunk else sentence
+            # overlap을 고려하여 이전 청크의 끝 문장들을 다음 청크 앞에 포함
+            carried: List[str] = []
+            carried_length = 0
+            for previous in reversed(current):
+                if carried_length + len(previous) + 1 > overlap or carried_length + len(previous) + 1 + len(sentence) > chunk_size:
+                    break
+                carried.insert(0, previous)
+                carried_length += len(previous) + 1
+            current = carried
+            current_length = max(carried_length - 1, 0)
+        
+        current.append(sentence)
+        current_length += len(sentence) + (1 if len(current) > 1 else 0)
     
     # 마지막 청크 추가
-    if current_chunk:
-        chunks.append(current_chunk.strip())
+    if current:
+        chunks.append(" ".join(current))
     
     return chunks
 
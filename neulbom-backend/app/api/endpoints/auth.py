@@ -14,6 +14,7 @@ from app.services.auth_service import (
     get_current_active_user,
     require_level
 )
+from app.utils.response_helpers import create_bookmark_items
 from app.core.config import settings
 from fastapi import Query
 
@@ -190,7 +191,7 @@ def get_welfare_bookmarks(
     """
     bookmarks, total = crud.get_user_bookmarks(db, current_user.id, skip=skip, limit=limit)
     return schema.BookmarkListResponse(
-        items=bookmarks,
+        items=create_bookmark_items(bookmarks),
         total=total,
         skip=skip,
         limit=limit
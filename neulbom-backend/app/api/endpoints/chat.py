@@ -1,41 +1,33 @@
 from fastapi import APIRouter, Depends, Response, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Optional, List, Tuple
 import json
+import logging
+import time
 
-from app.models.connection import get_db
+from app.models.connection import get_db, SessionLocal
 from app.models import schema, models
 from app.models.crud import (
     create_chat_room, get_user_chat_rooms, get_chat_room_by_id,
     update_chat_room_title, delete_chat_room, get_chat_logs_by_room
 )
-from app.services.chat_service import get_chat_response, save_chat_log
+from app.services.chat_service import aget_chat_response, astream_chat_response, save_chat_log
 from app.services.auth_service import get_optional_user, require_level
 
 router = APIRouter(prefix="/api/chat", tags=["chat"])
 
+logger = logging.getLogger(__name__)
 
-@router.post("/message", response_model=schema.ChatResponse)
-def send_message(
+
+def _prepare_chat(
     message_data: schema.ChatMessage,
-    response: Response,
-    room_id: Optional[int] = Query(None, description="채팅방 ID (없으면 새로 생성)"),
-    db: Session = Depends(get_db),
-    current_user: Optional[models.User] = Depends(get_optional_user)
-):
-    """
-    AI 챗봇 메시지 전송
-    - Level 1 (비회원) 이상 접근 가능
-    - room_id가 없으면 새 채팅방 생성
-    """
-    import logging
-    logger = logging.getLogger(__name__)
-    
-    # UTF-8 인코딩 명시
-    response.headers["Content-Type"] = "application/json; charset=utf-8"
-    
-    user_id = current_user.id if current_user else None
-    
+    room_id: Optional[int],
+    user_id: Optional[int],
+    db: Session
+) -> Tuple[Optional[models.ChatRoom], List[dict]]:
+    """채팅방 확인/생성 및 대화 히스토리 결정 (일반/스트리밍 메시지 공용)"""
     # 로그인한 사용자의 경우 채팅방 관리 및 기록 저장
     chat_room = None
     if user_id:
@@ -66,9 +58,37 @@ def send_message(
         # 비회원이거나 새 채팅방인 경우 프론트엔드 히스토리 사용
         logger.debug(f"프론트엔드 히스토리 사용: {len(history)}개 메시지")
     
+    return chat_room, history
+
+
+def _sse_event(event: str, data: dict) -> str:
+    """Server-Sent Events 메시지 한 개"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.post("/message", response_model=schema.ChatResponse)
+async def send_message(
+    message_data: schema.ChatMessage,
+    response: Response,
+    room_id: Optional[int] = Query(None, description="채팅방 ID (없으면 새로 생성)"),
+    db: Session = Depends(get_db),
+    current_user: Optional[models.User] = Depends(get_optional_user)
+):
+    """
+    AI 챗봇 메시지 전송
+    - Level 1 (비회원) 이상 접근 가능
+    - room_id가 없으면 새 채팅방 생성
+    - LLM 호출은 await (DB 작업만 스레드 풀에서 실행)
+    """
+    # UTF-8 인코딩 명시
+    response.headers["Content-Type"] = "application/json; charset=utf-8"
+    
+    user_id = current_user.id if current_user else None
+    chat_room, history = await run_in_threadpool(_prepare_chat, message_data, room_id, user_id, db)
+    
     logger.info(f"챗봇 응답 생성 시작: message_length={len(message_data.message)}, history_count={len(history)}")
     
-    chat_response = get_chat_response(
+    chat_response = await aget_chat_response(
         message=message_data.message,
         history=history,
         user_id=user_id,
@@ -77,7 +97,8 @@ def send_message(
     
     # 채팅 기록 저장 (로그인한 사용자이고 채팅방이 있는 경우만)
     if user_id and chat_room:
-        save_chat_log(
+        await run_in_threadpool(
+            save_chat_log,
             db=db,
             room_id=chat_room.id,
             user_message=message_data.message,
@@ -95,6 +116,84 @@ def send_message(
     return response_dict
 
 
+@router.post("/message/stream")
+async def send_message_stream(
+    message_data: schema.ChatMessage,
+    room_id: Optional[int] = Query(None, description="채팅방 ID (없으면 새로 생성)"),
+    db: Session = Depends(get_db),
+    current_user: Optional[models.User] = Depends(get_optional_user)
+):
+    """
+    AI 챗봇 메시지 전송 (스트리밍, text/event-stream)
+    - /message와 같은 권한/채팅방 처리
+    - 위기 감지는 토큰 전송 전에 완료
+    - LLM 호출과 응답 조각 대기는 await (DB 작업만 스레드 풀에서 실행)
+    - 이벤트 순서:
+      meta  {"is_crisis", "crisis_info", "room_id"}
+      token {"text"} (응답 조각, 여러 번)
+      done  {"reply", "is_crisis", "room_id", "ttft_ms"} (채팅 기록 저장 후)
+    """
+    started = time.perf_counter()
+    user_id = current_user.id if current_user else None
+    chat_room, history = await run_in_threadpool(_prepare_chat, message_data, room_id, user_id, db)
+    chat_room_id = chat_room.id if chat_room else None
+    
+    logger.info(f"챗봇 스트리밍 응답 시작: message_length={len(message_data.message)}, history_count={len(history)}")
+    
+    reply_stream = await astream_chat_response(
+        message=message_data.message,
+        history=history,
+        db=db,
+        started=started
+    )
+    
+    def save_log():
+        # 요청 세션은 응답 전송 중 닫힐 수 있으므로 새 세션 사용
+        log_db = SessionLocal()
+        try:
+            save_chat_log(
+                db=log_db,
+                room_id=chat_room_id,
+                user_message=message_data.message,
+                bot_reply=reply_stream.reply,
+                is_crisis=reply_stream.is_crisis
+            )
+        finally:
+            log_db.close()
+    
+    async def events():
+        yield _sse_event("meta", {
+            "is_crisis": reply_stream.is_crisis,
+            "crisis_info": reply_stream.crisis_info,
+            "room_id": chat_room_id
+        })
+        async for chunk in reply_stream:
+            yield _sse_event("token", {"text": chunk})
+        
+        # 전체 응답이 끝난 뒤 채팅 기록 저장
+        if user_id and chat_room_id:
+            await run_in_threadpool(save_log)
+        
+        ttft_ms = round(reply_stream.ttft * 1000, 1) if reply_stream.ttft is not None else None
+        logger.info(f"챗봇 스트리밍 응답 완료: reply_length={len(reply_stream.reply)}, is_crisis={reply_stream.is_crisis}, room_id={chat_room_id}, ttft_ms={ttft_ms}")
+        yield _sse_event("done", {
+            "reply": reply_stream.reply,
+            "is_crisis": reply_stream.is_crisis,
+            "room_id": chat_room_id,
+            "ttft_ms": ttft_ms
+        })
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream; charset=utf-8",
+        headers={
+            "Cache-Control": "no-cache",
+            # 프록시(nginx) 버퍼링 끄기
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+
 @router.post("/rooms", response_model=schema.ChatRoomResponse)
 def create_room(
     room_data: schema.ChatRoomCreate,
@@ -352,7 +352,9 @@ def create_comment(
         
         # AI 위기 감지 (댓글도 모니터링)
         from app.ai_core.safety_guard import analyze_crisis_level
-        crisis_analysis = analyze_crisis_level(comment_data.content)
+        from app.ai_core.rate_limiter import llm_priority, PRIORITY_MODERATION
+        with llm_priority(PRIORITY_MODERATION):
+            crisis_analysis = analyze_crisis_level(comment_data.content)
         
         # 위기 댓글은 차단
         if crisis_analysis["level"] == "high":
@@ -12,6 +12,7 @@ from app.models.crud import (
 )
 from app.services.auth_service import get_optional_user, require_level
 from app.services.welfare_service import search_welfare_with_profile
+from app.utils.response_helpers import create_welfare_item, create_bookmark_items
 # 크롤링 기능은 backup_crawling 폴더로 이동됨
 # from app.services.crawler_service import crawl_and_save_welfares
 
@@ -20,24 +21,9 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/welfare", tags=["welfare"])
 
 
-def _clean_welfare_items(welfares: List[models.Welfare]) -> List[schema.WelfareItem]:
-    """복지 정보 목록의 summary를 정제하여 WelfareItem 리스트로 변환"""
-    result = []
-    for welfare in welfares:
-        cleaned_summary = schema.clean_welfare_summary(welfare.summary, welfare.full_text)
-        welfare_dict = {
-            'id': welfare.id,
-            'title': welfare.title,
-            'summary': cleaned_summary,
-            'source_link': welfare.source_link,
-            'region': welfare.region,
-            'apply_start': welfare.apply_start,
-            'apply_end': welfare.apply_end,
-            'is_always': welfare.is_always,
-            'status': welfare.status,
-        }
-        result.append(schema.WelfareItem(**welfare_dict))
-    return result
+def _clean_welfare_items(welfares) -> List[schema.WelfareItem]:
+    """복지 정보 목록(모델 또는 카드 행)의 summary를 정제하여 WelfareItem 리스트로 변환"""
+    return [create_welfare_item(welfare) for welfare in welfares]
 
 
 def increment_welfare_view_count(db: Session, welfare_id: int, user_id: Optional[int] = None):
@@ -154,27 +140,7 @@ def get_bookmarks(
     bookmarks, total = get_user_bookmarks(db, current_user.id, skip=skip, limit=limit)
     
     # 북마크의 welfare summary 정제
-    cleaned_items = []
-    for bookmark in bookmarks:
-        if bookmark.welfare:
-            cleaned_summary = schema.clean_welfare_summary(bookmark.welfare.summary, bookmark.welfare.full_text)
-            welfare_item = schema.WelfareItem(
-                id=bookmark.welfare.id,
-                title=bookmark.welfare.title,
-                summary=cleaned_summary,
-                source_link=bookmark.welfare.source_link,
-                region=bookmark.welfare.region,
-                apply_start=bookmark.welfare.apply_start,
-                apply_end=bookmark.welfare.apply_end,
-                is_always=bookmark.welfare.is_always,
-                status=bookmark.welfare.status,
-            )
-            cleaned_items.append(schema.BookmarkItem(
-                id=bookmark.id,
-                welfare_id=bookmark.welfare_id,
-                welfare=welfare_item,
-                created_at=bookmark.created_at,
-            ))
+    cleaned_items = create_bookmark_items(bookmarks)
     
     return schema.BookmarkListResponse(
         items=cleaned_items,
@@ -14,6 +14,34 @@ class Settings(BaseSettings):
     UPSTAGE_API_URL: str = "https://api.upstage.ai/v1/chat/completions"
     UPSTAGE_EMBEDDING_API_URL: str = "https://api.upstage.ai/v1/embeddings"
     
+    # LLM HTTP Client Settings
+    LLM_HTTP_POOL_SIZE: int = 20  # LLM/임베딩 API 최대 동시 연결 수 (동기/비동기 클라이언트 각각)
+    LLM_HTTP_KEEPALIVE_CONNECTIONS: int = 10  # 재사용을 위해 열어 둘 유휴 연결 수
+    LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0  # 유휴 연결 유지 시간
+    LLM_HTTP_CONNECT_TIMEOUT_SECONDS: float = 5.0  # 연결 수립 대기 시간
+    LLM_CHAT_TIMEOUT_SECONDS: float = 30.0  # 챗봇 응답 요청 대기 시간 (스트리밍은 조각 사이 대기 시간)
+    LLM_EMBEDDING_TIMEOUT_SECONDS: float = 30.0  # 임베딩 요청 대기 시간
+    
+    # LLM Retry / Circuit Breaker Settings
+    LLM_RETRY_MAX_ATTEMPTS: int = 3  # 재시도 가능한 오류(429, 5xx, timeout) 시 최대 시도 횟수 (첫 시도 포함)
+    LLM_RETRY_BASE_DELAY_SECONDS: float = 0.5  # 첫 재시도 대기 시간 (이후 2배씩 증가, 지터 적용)
+    LLM_RETRY_MAX_DELAY_SECONDS: float = 4.0  # 재시도 대기 시간 상한 (Retry-After 헤더 값에도 적용)
+    LLM_BREAKER_WINDOW: int = 20  # 서킷 브레이커가 판단에 쓰는 최근 호출 수
+    LLM_BREAKER_MIN_CALLS: int = 5  # 브레이커를 열기 전 필요한 최소 호출 수
+    LLM_BREAKER_ERROR_RATE: float = 0.5  # 최근 호출 중 실패 비율이 이 값 이상이면 열림
+    LLM_BREAKER_SLOW_CALL_SECONDS: float = 10.0  # 이 시간 이상 걸린 호출은 느린 호출 (스트리밍은 첫 조각까지)
+    LLM_BREAKER_SLOW_CALL_RATE: float = 0.5  # 최근 호출 중 느린 호출 비율이 이 값 이상이면 열림
+    LLM_BREAKER_OPEN_SECONDS: float = 30.0  # 열린 뒤 시험 호출을 허용하기까지 대기 시간
+    LLM_FAILOVER_ENABLED: bool = True  # 챗봇 응답 생성 실패/브레이커 열림 시 다른 제공자(upstage ↔ gemini)로 전환
+    
+    # LLM Rate Limit Settings
+    LLM_RATE_LIMIT_PER_SECOND: float = 5.0  # 제공자별 초당 요청 수 (토큰 버킷 충전 속도, 0이면 제한 없음)
+    LLM_RATE_LIMIT_BURST: int = 10  # 순간 최대 요청 수 (토큰 버킷 크기)
+    LLM_RATE_LIMIT_MAX_QUEUE: int = 200  # 제공자별 대기열 최대 길이 (가득 차면 낮은 우선순위부터 거절)
+    LLM_QUEUE_MAX_WAIT_INTERACTIVE_SECONDS: float = 5.0  # 챗봇 요청 최대 대기 시간 (예상 대기가 더 길면 즉시 거절)
+    LLM_QUEUE_MAX_WAIT_MODERATION_SECONDS: float = 30.0  # 게시글/댓글 위기 감지, 가입 심사 요청 최대 대기 시간
+    LLM_QUEUE_MAX_WAIT_BATCH_SECONDS: float = 300.0  # 인덱싱/요약 등 배치 요청 최대 대기 시간
+    
     # JWT Settings
     SECRET_KEY: str = "your-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
@@ -39,6 +67,60 @@ class Settings(BaseSettings):
     EMBEDDING_QUERY_MODEL: str = "solar-embedding-1-large-query"  # Upstage 쿼리 임베딩 모델
     GEMINI_EMBEDDING_MODEL: str = "models/embedding-001"  # Gemini 임베딩 모델 (gemini-embedding-001)
     EMBEDDING_DIMENSION: int = 4096  # Upstage: 4096, Gemini: 768 (실제 모델에 따라 변경)
+    EMBEDDING_BATCH_SIZE: int = 100  # 임베딩 요청 1회당 최대 입력 수 (Upstage/Gemini 공통 상한)
+    EMBEDDING_BATCH_MAX_TOKENS: int = 200000  # 임베딩 요청 1회당 총 토큰 상한 (글자 수 기준 추정)
+    EMBEDDING_MAX_INPUT_TOKENS: int = 4000  # 입력 1개당 최대 토큰 (초과분은 잘라서 전송)
+    EMBEDDING_CACHE_ENABLED: bool = True  # 임베딩 캐시 사용 여부
+    EMBEDDING_CACHE_MEMORY_SIZE: int = 1024  # 메모리 LRU 최대 항목 수 (float32 저장, 4096차원 기준 항목당 약 16KB)
+    EMBEDDING_CACHE_DISK_MAX_ENTRIES: int = 100000  # 디스크 캐시 최대 행 수, 초과 시 오래된 항목부터 삭제 (4096차원 기준 약 1.6GB, 0이면 제한 없음)
+    EMBEDDING_CACHE_PATH: Optional[str] = None  # 디스크 캐시 경로 (None이면 VECTOR_DB_PATH/embedding_cache.sqlite)
+    EMBEDDING_STORAGE_DTYPE: str = "float32"  # DB 저장 타입: "float32" 또는 "float16" (용량 절반, 정밀도 약간 손실)
+    QUERY_EMBEDDING_CACHE_SIZE: int = 2048  # 검색 쿼리 임베딩 메모리 LRU 최대 항목 수 (0이면 사용 안 함)
+    QUERY_EMBEDDING_CACHE_TTL_SECONDS: int = 3600  # 검색 쿼리 임베딩 유지 시간 (동시에 들어온 같은 쿼리는 API 1회만 호출)
+    
+    # Search Settings
+    WELFARE_SEARCH_MODE: str = "hybrid"  # "hybrid"(키워드+벡터 순위 융합), "keyword", "vector"
+    HYBRID_CANDIDATE_POOL: int = 50  # 하이브리드 검색 시 소스(키워드/벡터)별 후보 수
+    HYBRID_MAX_CANDIDATE_POOL: int = 300  # 페이지가 깊어져도 소스별 후보 수는 이 값을 넘지 않음
+    HYBRID_RRF_K: int = 60  # Reciprocal Rank Fusion 상수 (클수록 하위 순위 영향 증가)
+    HYBRID_VECTOR_TIMEOUT_SECONDS: float = 5.0  # 벡터 검색 대기 시간 (초과 시 키워드 결과만 사용)
+    HYBRID_SEARCH_WORKERS: int = 4  # 벡터 검색(쿼리 임베딩 + FAISS) 실행 스레드 수
+    VECTOR_FILTER_CACHE_TTL_SECONDS: int = 300  # 벡터 검색 필터(지역/나이/돌봄 대상/분류)별 ID 집합 캐시 유지 시간
+    VECTOR_MIN_SCORE: Optional[float] = None  # 복지 검색 시 벡터 후보의 최소 코사인 유사도 (None이면 제한 없음)
+    CHAT_CONTEXT_MIN_SCORE: float = 0.3  # 챗봇 프롬프트에 넣을 벡터 후보의 최소 코사인 유사도 (낮으면 컨텍스트 생략)
+    SEMANTIC_CACHE_SIZE: int = 256  # 의미 기반 검색 결과 캐시에 보관할 최근 쿼리 수 (0이면 사용 안 함)
+    SEMANTIC_CACHE_THRESHOLD: float = 0.97  # 이전 쿼리 임베딩과 코사인 유사도가 이 값 이상이면 검색 결과 재사용
+    SEMANTIC_CACHE_TTL_SECONDS: int = 600  # 의미 캐시 항목 유지 시간 (인덱스가 바뀌면 즉시 무효화)
+    SEMANTIC_CACHE_VERIFY_RATE: float = 0.05  # 캐시 적중 중 실제 검색과 비교해 결과 차이를 기록할 비율
+    
+    # Vector Index Settings
+    VECTOR_INDEX_TYPE: str = "flat"  # "flat"(전수 비교, 정확), "hnsw", "ivf_flat", "ivf_pq" (근사 검색, 대규모 데이터용)
+    VECTOR_HNSW_M: int = 32  # HNSW 노드당 연결 수 (클수록 정확도·메모리 증가)
+    VECTOR_HNSW_EF_CONSTRUCTION: int = 200  # HNSW 구축 시 탐색 폭
+    VECTOR_HNSW_EF_SEARCH: int = 64  # HNSW 검색 기본 탐색 폭 (검색 호출마다 변경 가능)
+    VECTOR_IVF_NLIST: int = 1024  # IVF 클러스터 수 (학습 벡터가 적으면 자동으로 줄어듦)
+    VECTOR_IVF_NPROBE: int = 16  # IVF 검색 기본 탐색 클러스터 수 (검색 호출마다 변경 가능)
+    VECTOR_PQ_M: int = 64  # IVF-PQ 서브벡터 수 (임베딩 차원의 약수여야 함, 4096차원 → 벡터당 64바이트)
+    VECTOR_PQ_NBITS: int = 8  # IVF-PQ 서브벡터당 비트 수
+    VECTOR_INDEX_TRAIN_SIZE: int = 50000  # IVF 학습에 사용할 최대 벡터 수
+    VECTOR_HNSW_MAX_TOMBSTONE_RATIO: float = 0.2  # HNSW 삭제 표시 비율이 이 값을 넘으면 인덱스 재구성
+    VECTOR_INDEX_MMAP: bool = True  # 인덱스를 메모리 매핑으로 읽기 (워커 간 페이지 캐시 공유, 빠른 시작, 첫 수정 시 메모리로 복사)
+    VECTOR_SAVE_DEBOUNCE_SECONDS: float = 2.0  # 개별 갱신 후 인덱스 저장 대기 시간 (이 시간 안의 변경은 한 번에 저장)
+    VECTOR_SNAPSHOT_KEEP: int = 2  # 보관할 인덱스 스냅샷 수 (현재 + 이전)
+    VECTOR_LOCK_WAIT_WARN_MS: int = 200  # 벡터 인덱스 잠금 대기가 이 시간(ms)을 넘으면 경고 로그
+    VECTOR_REBUILD_RECALL_SAMPLE: int = 100  # 재구축 검증 시 자기 자신 검색(recall) 확인에 쓸 표본 수
+    VECTOR_REBUILD_RECALL_K: int = 10  # 재구축 검증 시 표본이 상위 몇 개 안에 있어야 하는지
+    VECTOR_REBUILD_MIN_RECALL: float = 0.9  # 재구축 검증 통과 기준 recall (미달 시 기존 인덱스 유지)
+    VECTOR_REBUILD_MIN_SIZE_RATIO: float = 0.5  # 새 인덱스 크기가 기존 대비 이 비율 미만이면 교체하지 않음
+    VECTOR_REDUCTION: str = "none"  # 인덱스 벡터 차원 축소: "none", "pca"(코퍼스로 학습), "truncate"(앞쪽 차원만 사용, Matryoshka 학습 모델용)
+    VECTOR_REDUCED_DIMENSION: int = 1024  # 차원 축소 후 차원 (변경 시 재구축 필요, benchmark_reduction으로 recall 확인)
+    
+    # Chunk Indexing Settings
+    VECTOR_CHUNKING_ENABLED: bool = False  # 긴 원문을 청크로 나눠 청크 단위로 임베딩/검색 (복지별 최고 점수 사용, 일치한 문단을 챗봇 프롬프트에 사용)
+    VECTOR_CHUNK_SIZE: int = 800  # 청크 최대 글자 수
+    VECTOR_CHUNK_OVERLAP: int = 150  # 이전 청크 끝 문장을 다음 청크 앞에 겹쳐 넣는 최대 글자 수
+    VECTOR_CHUNK_MAX_PER_WELFARE: int = 64  # 복지 정보 하나당 최대 청크 수 (초과분은 인덱싱하지 않음, 최대 1024)
+    VECTOR_CHUNK_OVERFETCH: int = 4  # 청크 검색 시 요청 결과 수 대비 더 가져올 배수 (같은 복지 정보의 청크 중복 대비)
     
     # Crisis Detection
     CRISIS_HOTLINE: str = "129"
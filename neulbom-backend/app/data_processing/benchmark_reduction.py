@@ -0,0 +1,189 @@
+"""
+벡터 차원 축소(PCA/앞쪽 차원 사용) 방식별 검색 품질 비교 스크립트
+- DB에 저장된 문서 임베딩으로 원래 차원 전수 비교(flat) 결과를 정답으로 사용
+- 방식/차원별로 임시 인덱스를 만들어 recall@k, 벡터당 인덱스 크기, 구축/검색 시간 출력
+- 쿼리는 저장된 문서 임베딩 중 무작위 표본 (API 호출 없음, 자기 자신은 정답/결과에서 제외)
+
+사용 예:
+    python app/data_processing/benchmark_reduction.py --dims 512 1024 --k 10
+"""
+
+import sys
+import json
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from app.models.connection import get_db
+from app.models import crud
+from app.ai_core.rag_engine import VectorStore, FAISS_AVAILABLE, VECTOR_INDEX_TYPES
+from app.core.config import settings
+import logging
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def load_embeddings(db):
+    """저장된 문서 임베딩 전체 (welfare ID 배열, float32 행렬)"""
+    ids, batches = [], []
+    for welfare_ids, vectors in crud.iter_welfare_embeddings(db, batch_size=settings.EMBEDDING_BATCH_SIZE):
+        ids.extend(welfare_ids)
+        batches.append(vectors)
+    if not batches:
+        return np.empty(0, dtype='int64'), np.empty((0, settings.EMBEDDING_DIMENSION), dtype='float32')
+    return np.asarray(ids, dtype='int64'), np.vstack(batches).astype('float32')
+
+
+def build_store(index_dir: str, welfare_ids: np.ndarray, vectors: np.ndarray, index_type: str,
+                reduction: str, reduced_dimension: int):
+    """임시 경로에 벡터 저장소 구축, (저장소, 구축 시간 초) 반환"""
+    started = time.perf_counter()
+    store = VectorStore(
+        dimension=vectors.shape[1],
+        index_path=str(Path(index_dir) / "faiss.index"),
+        index_type=index_type,
+        mmap=False,
+        load_existing=False,
+        reduction=reduction,
+        reduced_dimension=reduced_dimension
+    )
+    if not store.is_trained():
+        store.train(vectors[:settings.VECTOR_INDEX_TRAIN_SIZE])
+    batch_size = settings.EMBEDDING_BATCH_SIZE
+    for start in range(0, len(vectors), batch_size):
+        store.add_vectors(vectors[start:start + batch_size], welfare_ids[start:start + batch_size].tolist())
+    return store, time.perf_counter() - started
+
+
+def run_queries(store: VectorStore, query_ids: np.ndarray, queries: np.ndarray, k: int):
+    """쿼리별 상위 k개 welfare ID (쿼리 자신 제외), 평균 검색 시간(ms)"""
+    results = []
+    started = time.perf_counter()
+    for query_id, query in zip(query_ids, queries):
+        found = store.search(query, k=k + 1)
+        results.append([welfare_id for welfare_id in found if welfare_id != query_id][:k])
+    elapsed = time.perf_counter() - started
+    return results, elapsed / max(len(queries), 1) * 1000
+
+
+def recall_at_k(truth, found) -> float:
+    """정답 상위 k개 중 결과에 포함된 비율의 평균"""
+    hits = sum(len(set(expected) & set(actual)) for expected, actual in zip(truth, found))
+    total = sum(len(expected) for expected in truth)
+    return hits / total if total else 1.0
+
+
+def index_bytes_per_vector(store: VectorStore) -> float:
+    """직렬화한 인덱스 크기 / 벡터 수 (차원 축소 행렬 포함)"""
+    import faiss
+    size = len(faiss.serialize_index(store.index))
+    if store.projection is not None:
+        writer = faiss.VectorIOWriter()
+        faiss.write_VectorTransform(store.projection, writer)
+        size += writer.data.size()
+    return size / max(store.get_size(), 1)
+
+
+def main():
+    """방식/차원별 recall@k를 비교하여 출력합니다."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='벡터 차원 축소 방식별 recall@k 비교')
+    parser.add_argument('--methods', nargs='+', default=['pca', 'truncate'], choices=['pca', 'truncate'], help='비교할 차원 축소 방식')
+    parser.add_argument('--dims', nargs='+', type=int, default=[256, 512, 1024], help='비교할 축소 후 차원')
+    parser.add_argument('--index-type', default='flat', choices=VECTOR_INDEX_TYPES, help='축소 인덱스 구조 (정답은 항상 원래 차원 flat)')
+    parser.add_argument('--k', type=int, default=10, help='recall@k의 k')
+    parser.add_argument('--queries', type=int, default=200, help='쿼리로 사용할 문서 임베딩 수')
+    parser.add_argument('--seed', type=int, default=42, help='쿼리 표본 추출 시드')
+    parser.add_argument('--json', type=str, default=None, help='결과를 저장할 JSON 파일 경로')
+
+    args = parser.parse_args()
+
+    if not FAISS_AVAILABLE:
+        logger.error("FAISS가 설치되지 않아 벤치마크를 실행할 수 없습니다.")
+        return
+
+    db = next(get_db())
+    try:
+        welfare_ids, vectors = load_embeddings(db)
+    finally:
+        db.close()
+
+    if len(welfare_ids) <= args.k:
+        logger.error(f"저장된 임베딩이 너무 적습니다: {len(welfare_ids)}개 (k={args.k}보다 많아야 함)")
+        return
+    dimension = vectors.shape[1]
+    logger.info(f"임베딩 {len(welfare_ids)}개, {dimension}차원")
+
+    rng = np.random.default_rng(args.seed)
+    picked = rng.choice(len(welfare_ids), size=min(args.queries, len(welfare_ids)), replace=False)
+    query_ids, queries = welfare_ids[picked], vectors[picked]
+
+    rows = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        baseline, build_seconds = build_store(str(Path(work_dir) / "baseline"), welfare_ids, vectors, "flat", "none", dimension)
+        truth, latency_ms = run_queries(baseline, query_ids, queries, args.k)
+        rows.append({
+            "method": "none",
+            "dimension": dimension,
+            "index_type": "flat",
+            "recall": 1.0,
+            "bytes_per_vector": round(index_bytes_per_vector(baseline), 1),
+            "build_seconds": round(build_seconds, 3),
+            "search_ms": round(latency_ms, 3),
+        })
+
+        for method in args.methods:
+            for reduced_dimension in args.dims:
+                if not 0 < reduced_dimension < dimension:
+                    logger.warning(f"{method} {reduced_dimension}차원 건너뜀 (원래 차원 {dimension}보다 작아야 함)")
+                    continue
+                index_dir = str(Path(work_dir) / f"{method}_{reduced_dimension}")
+                store, build_seconds = build_store(index_dir, welfare_ids, vectors, args.index_type, method, reduced_dimension)
+                if store.reduction != method:
+                    # PCA 학습 벡터가 축소 차원보다 적으면 축소 없이 만들어짐
+                    logger.warning(f"{method} {reduced_dimension}차원 건너뜀 (학습 벡터 부족으로 축소가 적용되지 않음)")
+                    continue
+                found, latency_ms = run_queries(store, query_ids, queries, args.k)
+                rows.append({
+                    "method": method,
+                    "dimension": reduced_dimension,
+                    "index_type": args.index_type,
+                    "recall": round(recall_at_k(truth, found), 4),
+                    "bytes_per_vector": round(index_bytes_per_vector(store), 1),
+                    "build_seconds": round(build_seconds, 3),
+                    "search_ms": round(latency_ms, 3),
+                })
+
+    print(f"\nrecall@{args.k} (정답: {dimension}차원 flat, 쿼리 {len(query_ids)}개)")
+    print(f"{'method':<10}{'dim':>6}{'index':>10}{'recall':>9}{'bytes/vec':>12}{'build(s)':>10}{'search(ms)':>12}")
+    for row in rows:
+        print(
+            f"{row['method']:<10}{row['dimension']:>6}{row['index_type']:>10}{row['recall']:>9.4f}"
+            f"{row['bytes_per_vector']:>12.1f}{row['build_seconds']:>10.3f}{row['search_ms']:>12.3f}"
+        )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "k": args.k,
+                "queries": len(query_ids),
+                "corpus_size": len(welfare_ids),
+                "dimension": dimension,
+                "results": rows,
+            }, f, ensure_ascii=False, indent=2)
+        logger.info(f"결과 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+"""
+벡터 검색 벤치마크 스크립트 (네트워크/DB 없이 실행)
+- 가짜 임베딩으로 만든 코퍼스로 인덱스 구조(flat/hnsw/ivf_flat/ivf_pq)별 VectorStore 구축
+- 구축 시간, 인덱스 크기/메모리 증가량, 단일 스레드 지연 시간(p50/p95/p99),
+  스레드 수별 처리량(QPS), 전수 비교(flat) 대비 recall@k 측정
+- 결과를 JSON으로 저장하고, 이전 결과 파일과 비교하여 회귀 여부 출력
+
+코퍼스:
+- 기본(synthetic): 주제 중심 벡터 + 잡음으로 만든 군집형 임베딩, 쿼리는 문서 벡터에 잡음을 더해 생성
+- --fixture: 전처리된 복지 JSON(rag_welfare_data.json 형식)의 텍스트를
+  글자 bigram 해시로 임베딩 (같은 텍스트는 항상 같은 벡터, 비슷한 텍스트는 비슷한 벡터)
+
+사용 예:
+    python app/data_processing/benchmark_retrieval.py --size 20000 --threads 1 4 8 --json bench.json
+    python app/data_processing/benchmark_retrieval.py --compare bench_before.json --json bench_after.json
+"""
+
+import sys
+import json
+import hashlib
+import os
+import platform
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from app.ai_core.rag_engine import VectorStore, FAISS_AVAILABLE, VECTOR_INDEX_TYPES
+from app.data_processing.benchmark_reduction import recall_at_k
+from app.core.config import settings
+import logging
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# engine.py 테스트에 쓰던 예시 질문 (fixture 코퍼스의 쿼리에 포함)
+SAMPLE_QUERIES = [
+    "할머니 병원비 때문에 학교 다니기 힘들어",
+    "가족 돌봄 때문에 취업 준비가 어려워",
+    "학생인데 생활비가 부족해",
+    "장학금을 받고 싶어",
+    "의료비 지원이 필요해",
+    "주거비 지원이 필요해",
+]
+
+# 비교 시 회귀로 표시할 기준
+LATENCY_REGRESSION_RATIO = 1.2  # p95 지연 시간이 이 배수 이상 늘어나면
+RECALL_REGRESSION_DROP = 0.02  # recall이 이 값 이상 떨어지면
+
+
+def synthetic_corpus(size: int, dimension: int, query_count: int, topics: int, seed: int) -> Tuple[np.ndarray, np.ndarray]:
+    """주제 군집형 가짜 임베딩 (문서 행렬, 쿼리 행렬), 같은 시드면 항상 같은 값"""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(topics, dimension))
+    assignments = rng.integers(topics, size=size)
+    documents = centers[assignments] + 0.6 * rng.normal(size=(size, dimension))
+    picked = rng.integers(size, size=query_count)
+    queries = documents[picked] + 0.4 * rng.normal(size=(query_count, dimension))
+    return documents.astype('float32'), queries.astype('float32')
+
+
+def hashed_text_embedding(text: str, dimension: int) -> np.ndarray:
+    """글자 bigram 해시 임베딩 (API 없이 텍스트 유사도를 흉내내는 결정적 벡터)"""
+    vector = np.zeros(dimension, dtype='float32')
+    text = " ".join(text.split())
+    for i in range(max(len(text) - 1, 1)):
+        digest = hashlib.md5(text[i:i + 2].encode("utf-8")).digest()
+        slot = int.from_bytes(digest[:4], "little") % dimension
+        vector[slot] += 1.0 if digest[4] & 1 else -1.0
+    return vector
+
+
+def fixture_corpus(path: str, dimension: int, query_count: int, seed: int) -> Tuple[np.ndarray, np.ndarray]:
+    """전처리된 복지 JSON을 해시 임베딩으로 변환 (쿼리: 예시 질문 + 무작위 문서 제목)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        items = json.load(f)
+    texts = [
+        item.get('search_content') or ' '.join([item.get('title', ''), item.get('target', ''), item.get('organization', '')])
+        for item in items
+    ]
+    titles = [item.get('title', '') for item in items if item.get('title')]
+    rng = np.random.default_rng(seed)
+    query_texts = list(SAMPLE_QUERIES)
+    if titles and query_count > len(query_texts):
+        query_texts += [titles[i] for i in rng.integers(len(titles), size=query_count - len(query_texts))]
+    documents = np.vstack([hashed_text_embedding(text, dimension) for text in texts])
+    queries = np.vstack([hashed_text_embedding(text, dimension) for text in query_texts[:max(query_count, 1)]])
+    return documents, queries
+
+
+def rss_bytes() -> Optional[int]:
+    """현재 프로세스 상주 메모리 (Linux /proc 기준, 없으면 None)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def percentile_ms(samples: List[float], q: float) -> float:
+    """초 단위 표본의 백분위수 (ms)"""
+    return round(float(np.percentile(samples, q)) * 1000, 3)
+
+
+def search_kwargs(args) -> Dict:
+    """검색 호출마다 넘길 HNSW/IVF 탐색 파라미터"""
+    return {"ef_search": args.ef_search, "nprobe": args.nprobe}
+
+
+def build_store(index_dir: str, documents: np.ndarray, index_type: str) -> Tuple[VectorStore, float]:
+    """임시 경로에 인덱스 구축, (저장소, 구축 시간 초) 반환"""
+    started = time.perf_counter()
+    store = VectorStore(
+        dimension=documents.shape[1],
+        index_path=str(Path(index_dir) / "faiss.index"),
+        index_type=index_type,
+        mmap=False,
+        load_existing=False,
+        reduction="none"
+    )
+    if not store.is_trained():
+        store.train(documents[:settings.VECTOR_INDEX_TRAIN_SIZE])
+    # 문서 번호 + 1을 welfare ID로 사용
+    welfare_ids = np.arange(1, len(documents) + 1)
+    batch_size = 1000
+    for start in range(0, len(documents), batch_size):
+        store.add_vectors(documents[start:start + batch_size], welfare_ids[start:start + batch_size].tolist())
+    return store, time.perf_counter() - started
+
+
+def measure_latency(store: VectorStore, queries: np.ndarray, k: int, kwargs: Dict) -> Tuple[List[List[int]], List[float]]:
+    """단일 스레드로 쿼리를 하나씩 검색 (결과, 쿼리별 소요 시간 초)"""
+    results, latencies = [], []
+    for query in queries:
+        started = time.perf_counter()
+        results.append(store.search(query, k=k, **kwargs))
+        latencies.append(time.perf_counter() - started)
+    return results, latencies
+
+
+def measure_qps(store: VectorStore, queries: np.ndarray, k: int, kwargs: Dict, threads: int, rounds: int) -> float:
+    """threads개 스레드가 동시에 쿼리 전체를 rounds번 검색할 때의 초당 처리량"""
+    def worker(offset: int):
+        for r in range(rounds):
+            for i in range(len(queries)):
+                store.search(queries[(i + offset + r) % len(queries)], k=k, **kwargs)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(worker, range(threads)))
+    elapsed = time.perf_counter() - started
+    return round(threads * rounds * len(queries) / elapsed, 1) if elapsed > 0 else 0.0
+
+
+def benchmark_index(work_dir: str, index_type: str, documents: np.ndarray, queries: np.ndarray,
+                    truth: Optional[List[List[int]]], args) -> Tuple[Dict, List[List[int]]]:
+    """인덱스 구조 하나의 벤치마크 결과 (결과 행, 쿼리별 검색 결과)"""
+    import faiss
+
+    rss_before = rss_bytes()
+    store, build_seconds = build_store(str(Path(work_dir) / index_type), documents, index_type)
+    rss_after = rss_bytes()
+
+    kwargs = search_kwargs(args)
+    # 첫 검색의 초기화 비용이 지연 시간에 섞이지 않도록 한 번 미리 실행
+    store.search(queries[0], k=args.k, **kwargs)
+    results, latencies = measure_latency(store, queries, args.k, kwargs)
+
+    row = {
+        "index_type": index_type,
+        "layout": store.layout.get("factory"),
+        "size": store.get_size(),
+        "build_seconds": round(build_seconds, 3),
+        "index_bytes": len(faiss.serialize_index(store.index)),
+        "rss_delta_bytes": rss_after - rss_before if rss_before is not None and rss_after is not None else None,
+        "latency_ms": {
+            "mean": round(float(np.mean(latencies)) * 1000, 3),
+            "p50": percentile_ms(latencies, 50),
+            "p95": percentile_ms(latencies, 95),
+            "p99": percentile_ms(latencies, 99),
+        },
+        "qps": {str(threads): measure_qps(store, queries, args.k, kwargs, threads, args.rounds) for threads in args.threads},
+        "recall": round(recall_at_k(truth, results), 4) if truth is not None else 1.0,
+    }
+    return row, results
+
+
+def git_commit() -> Optional[str]:
+    """현재 커밋 해시 (git이 없으면 None)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=str(project_root), capture_output=True, text=True, timeout=5
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def compare_results(previous: Dict, current: Dict) -> List[str]:
+    """이전 결과 대비 인덱스 구조별 p95 지연 시간/recall 변화 (회귀면 앞에 '!' 표시)"""
+    lines = []
+    previous_rows = {row["index_type"]: row for row in previous.get("results", [])}
+    for row in current["results"]:
+        before = previous_rows.get(row["index_type"])
+        if before is None or "error" in row or "error" in before:
+            continue
+        p95_before, p95_after = before["latency_ms"]["p95"], row["latency_ms"]["p95"]
+        recall_before, recall_after = before["recall"], row["recall"]
+        regressed = (
+            (p95_before > 0 and p95_after / p95_before >= LATENCY_REGRESSION_RATIO)
+            or recall_before - recall_after >= RECALL_REGRESSION_DROP
+        )
+        lines.append(
+            f"{'!' if regressed else ' '} {row['index_type']:<9} p95 {p95_before:.3f} → {p95_after:.3f}ms, "
+            f"recall {recall_before:.4f} → {recall_after:.4f}"
+        )
+    return lines
+
+
+def main():
+    """인덱스 구조별 벡터 검색 벤치마크를 실행합니다."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='가짜 임베딩으로 인덱스 구조별 벡터 검색 성능/품질 측정')
+    parser.add_argument('--index-types', nargs='+', default=list(VECTOR_INDEX_TYPES), choices=VECTOR_INDEX_TYPES, help='측정할 인덱스 구조')
+    parser.add_argument('--fixture', type=str, default=None, help='전처리된 복지 JSON 경로 (없으면 합성 코퍼스)')
+    parser.add_argument('--size', type=int, default=20000, help='합성 코퍼스 문서 수')
+    parser.add_argument('--dimension', type=int, default=256, help='가짜 임베딩 차원 (ivf_pq는 VECTOR_PQ_M의 배수여야 함)')
+    parser.add_argument('--topics', type=int, default=200, help='합성 코퍼스 주제(군집) 수')
+    parser.add_argument('--queries', type=int, default=500, help='쿼리 수')
+    parser.add_argument('--k', type=int, default=10, help='recall@k의 k (검색 결과 수)')
+    parser.add_argument('--threads', nargs='+', type=int, default=[1, 4, 8], help='QPS를 측정할 동시 스레드 수')
+    parser.add_argument('--rounds', type=int, default=1, help='QPS 측정 시 스레드별 쿼리 전체 반복 횟수')
+    parser.add_argument('--ef-search', type=int, default=None, help='HNSW 탐색 폭 (기본: VECTOR_HNSW_EF_SEARCH)')
+    parser.add_argument('--nprobe', type=int, default=None, help='IVF 탐색 클러스터 수 (기본: VECTOR_IVF_NPROBE)')
+    parser.add_argument('--seed', type=int, default=42, help='코퍼스/쿼리 생성 시드')
+    parser.add_argument('--json', type=str, default=None, help='결과를 저장할 JSON 파일 경로')
+    parser.add_argument('--compare', type=str, default=None, help='비교할 이전 결과 JSON 파일 경로')
+
+    args = parser.parse_args()
+
+    if not FAISS_AVAILABLE:
+        logger.error("FAISS가 설치되지 않아 벤치마크를 실행할 수 없습니다.")
+        return
+    import faiss
+
+    if args.fixture:
+        documents, queries = fixture_corpus(args.fixture, args.dimension, args.queries, args.seed)
+        corpus = {"kind": "fixture", "path": args.fixture}
+    else:
+        documents, queries = synthetic_corpus(args.size, args.dimension, args.queries, args.topics, args.seed)
+        corpus = {"kind": "synthetic", "topics": args.topics}
+    corpus.update(size=len(documents), dimension=args.dimension, queries=len(queries), seed=args.seed)
+    logger.info(f"코퍼스 {len(documents)}개, {args.dimension}차원, 쿼리 {len(queries)}개")
+
+    # flat을 먼저 측정하여 다른 구조의 recall 정답으로 사용
+    index_types = sorted(set(args.index_types) | {"flat"}, key=VECTOR_INDEX_TYPES.index)
+    rows = []
+    truth = None
+    with tempfile.TemporaryDirectory() as work_dir:
+        for index_type in index_types:
+            logger.info(f"{index_type} 측정 중...")
+            try:
+                row, results = benchmark_index(work_dir, index_type, documents, queries, truth, args)
+            except Exception as e:
+                logger.error(f"{index_type} 측정 실패: {e}")
+                rows.append({"index_type": index_type, "error": str(e)})
+                continue
+            if index_type == "flat":
+                truth = results
+            if index_type in args.index_types:
+                rows.append(row)
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "faiss": getattr(faiss, "__version__", None),
+            "faiss_omp_threads": faiss.omp_get_max_threads(),
+            "cpu_count": os.cpu_count(),
+            "k": args.k,
+            "ef_search": args.ef_search or settings.VECTOR_HNSW_EF_SEARCH,
+            "nprobe": args.nprobe or settings.VECTOR_IVF_NPROBE,
+            "rounds": args.rounds,
+        },
+        "corpus": corpus,
+        "results": rows,
+    }
+
+    thread_counts = [str(threads) for threads in args.threads]
+    print(f"\n벡터 검색 벤치마크 (문서 {len(documents)}개, {args.dimension}차원, 쿼리 {len(queries)}개, recall@{args.k} 정답: flat)")
+    print(f"{'index':<10}{'build(s)':>10}{'MB':>9}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}{'recall':>9}"
+          + "".join(f"{'qps@' + threads:>11}" for threads in thread_counts))
+    for row in rows:
+        if "error" in row:
+            print(f"{row['index_type']:<10}  오류: {row['error']}")
+            continue
+        latency = row["latency_ms"]
+        print(
+            f"{row['index_type']:<10}{row['build_seconds']:>10.3f}{row['index_bytes'] / 1024 / 1024:>9.1f}"
+            f"{latency['p50']:>10.3f}{latency['p95']:>10.3f}{latency['p99']:>10.3f}{row['recall']:>9.4f}"
+            + "".join(f"{row['qps'][threads]:>11.1f}" for threads in thread_counts)
+        )
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+        print(f"\n이전 결과와 비교 ({previous.get('meta', {}).get('commit')} → {report['meta']['commit']}, '!'는 회귀)")
+        if previous.get("corpus") != report["corpus"]:
+            print("  주의: 코퍼스 조건(종류/크기/차원/쿼리/시드)이 달라 직접 비교가 정확하지 않습니다.")
+        for line in compare_results(previous, report):
+            print(line)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        logger.info(f"결과 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
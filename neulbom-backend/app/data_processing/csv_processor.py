@@ -257,7 +257,6 @@ def process_csv_row(row: pd.Series, df_columns: List[str] = None) -> Dict:
         'is_always': True,  # 기본값
         'status': 'active',
         'category': 'SERVICE',  # 실제 복지 서비스로 분류
-        'embedding': None,  # 나중에 생성
     }
 
 
@@ -330,6 +329,7 @@ def process_csv_to_db(csv_path: str, db: Session, batch_size: int = 100):
     saved_count = 0
     updated_count = 0
     error_count = 0
+    changed_ids = []  # 원본 텍스트가 바뀐 기존 항목 (임베딩 재생성 대상)
     
     for idx, row in df.iterrows():
         try:
@@ -345,6 +345,9 @@ def process_csv_to_db(csv_path: str, db: Session, batch_size: int = 100):
             
             if existing:
                 # 업데이트
+                new_full_text = welfare_data.get('full_text')
+                if new_full_text is not None and new_full_text != existing.full_text:
+                    changed_ids.append(existing.id)
                 for key, value in welfare_data.items():
                     if value is not None:
                         setattr(existing, key, value)
@@ -375,7 +378,8 @@ def process_csv_to_db(csv_path: str, db: Session, batch_size: int = 100):
         'total': len(df),
         'saved': saved_count,
         'updated': updated_count,
-        'errors': error_count
+        'errors': error_count,
+        'changed_ids': changed_ids
     }
 
 
@@ -12,7 +12,7 @@ sys.path.insert(0, str(project_root))
 
 from app.models.connection import get_db, init_db
 from app.data_processing.csv_processor import process_csv_to_db
-from app.ai_core.rag_engine import rebuild_vector_index, batch_store_embeddings
+from app.ai_core.rag_engine import rebuild_vector_index, sync_vector_index
 import logging
 
 logging.basicConfig(
@@ -31,6 +31,7 @@ def main():
     parser.add_argument('--batch-size', type=int, default=100, help='배치 크기')
     parser.add_argument('--skip-import', action='store_true', help='CSV 임포트 건너뛰기 (벡터 인덱스만 재구축)')
     parser.add_argument('--skip-embedding', action='store_true', help='벡터 임베딩 생성 건너뛰기')
+    parser.add_argument('--rebuild', action='store_true', help='변경분만 반영하지 않고 벡터 인덱스 전체 재구축')
     
     args = parser.parse_args()
     
@@ -46,6 +47,8 @@ def main():
     db = next(get_db())
     
     try:
+        changed_ids = []
+        
         # 1. CSV 파일 임포트
         if not args.skip_import:
             logger.info("=" * 60)
@@ -57,6 +60,7 @@ def main():
             logger.info(f"저장: {result['saved']}개")
             logger.info(f"업데이트: {result['updated']}개")
             logger.info(f"에러: {result['errors']}개")
+            changed_ids = result.get('changed_ids', [])
         else:
             logger.info("CSV 임포트를 건너뜁니다.")
         
@@ -65,9 +69,14 @@ def main():
             logger.info("\n" + "=" * 60)
             logger.info("2단계: 벡터 임베딩 생성 및 인덱스 구축")
             logger.info("=" * 60)
-            logger.info("이 작업은 시간이 걸릴 수 있습니다...")
-            rebuild_vector_index(db)
-            logger.info("\n벡터 인덱스 구축 완료!")
+            if args.rebuild or args.skip_import:
+                logger.info("이 작업은 시간이 걸릴 수 있습니다...")
+                rebuild_vector_index(db)
+                logger.info("\n벡터 인덱스 구축 완료!")
+            else:
+                # 새 항목 추가, 내용이 바뀐 항목 교체, 삭제된 항목 제거만 수행
+                sync_result = sync_vector_index(db, changed_welfare_ids=changed_ids)
+                logger.info(f"\n벡터 인덱스 동기화 완료! {sync_result}")
         else:
             logger.info("벡터 임베딩 생성을 건너뜁니다.")
         
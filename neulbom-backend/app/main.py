@@ -4,7 +4,18 @@ from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from app.models.connection import init_db, SessionLocal
 from app.api.endpoints import auth, chat, welfare, community, users
-from app.ai_core.rag_engine import load_welfares_to_vector_db
+from app.ai_core.rag_engine import (
+    load_welfares_to_vector_db,
+    get_embedding_cache_stats,
+    get_query_embedding_cache_stats,
+    get_semantic_cache_stats,
+    get_vector_store_stats,
+    flush_vector_store
+)
+from app.ai_core.http_client import close_http_clients, get_http_client_stats
+from app.ai_core.resilience import get_circuit_breaker_stats
+from app.ai_core.rate_limiter import get_rate_limiter_stats
+from app.services.chat_service import get_chat_stream_stats
 import logging
 import traceback
 
@@ -80,6 +91,19 @@ async def startup_event():
         logger.warning("일부 기능이 제한될 수 있습니다.")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """서버 종료 시 저장 대기 중인 벡터 인덱스 변경을 디스크에 기록하고 HTTP 연결 풀 정리"""
+    try:
+        flush_vector_store()
+    except Exception as e:
+        logger.error(f"벡터 인덱스 저장 실패: {e}", exc_info=True)
+    try:
+        await close_http_clients()
+    except Exception as e:
+        logger.error(f"HTTP 클라이언트 정리 실패: {e}", exc_info=True)
+
+
 # 라우터 등록
 app.include_router(auth.router)
 app.include_router(users.router)
@@ -102,7 +126,17 @@ def root():
 
 @app.get("/health")
 def health_check():
-    return {"status": "healthy"}
+    return {
+        "status": "healthy",
+        "embedding_cache": get_embedding_cache_stats(),
+        "query_embedding_cache": get_query_embedding_cache_stats(),
+        "semantic_cache": get_semantic_cache_stats(),
+        "vector_store": get_vector_store_stats(),
+        "chat_stream": get_chat_stream_stats(),
+        "llm_http": get_http_client_stats(),
+        "llm_circuit_breakers": get_circuit_breaker_stats(),
+        "llm_rate_limit": get_rate_limiter_stats()
+    }
 
 
 if __name__ == "__main__":
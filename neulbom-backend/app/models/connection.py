@@ -14,6 +14,10 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+# 복지 정보 전문 검색(FTS5) 인덱스 사용 가능 여부 (None: 아직 확인 전)
+_welfare_fts_available = None
+
+
 def get_db():
     """데이터베이스 세션 의존성"""
     db = SessionLocal()
@@ -32,6 +36,10 @@ def init_db():
     migrate_add_view_count_column()
     # 마이그레이션: posts 테이블의 모든 필수 컬럼 확인 및 추가
     migrate_posts_table_columns()
+    # 마이그레이션: welfares.embedding(JSON) → welfare_embeddings(바이너리)
+    migrate_welfare_embeddings_to_binary()
+    # 마이그레이션: 복지 정보 전문 검색(FTS5) 인덱스 생성
+    migrate_create_welfare_fts()
 
 
 def migrate_add_name_column():
@@ -163,3 +171,185 @@ def migrate_posts_table_columns():
             conn.rollback()
             raise
 
+
+
+def migrate_welfare_embeddings_to_binary(batch_size: int = 200):
+    """
+    welfares.embedding(JSON 배열) 컬럼의 임베딩을 welfare_embeddings 테이블(바이너리)로 옮기는 마이그레이션
+    - 이미 옮겨진 항목은 건너뜀
+    - 옮긴 뒤 JSON 컬럼은 비우고, 가능하면 컬럼 자체를 삭제
+    """
+    from sqlalchemy import inspect, text
+    import json
+    import logging
+    from app.utils.vector_utils import encode_vector
+    
+    logger = logging.getLogger(__name__)
+    
+    inspector = inspect(engine)
+    tables = inspector.get_table_names()
+    
+    if "welfares" not in tables or "welfare_embeddings" not in tables:
+        return
+    
+    columns = [col["name"] for col in inspector.get_columns("welfares")]
+    if "embedding" not in columns:
+        return
+    
+    dtype = settings.EMBEDDING_STORAGE_DTYPE
+    migrated = 0
+    skipped = 0
+    last_id = 0
+    
+    with engine.connect() as conn:
+        try:
+            while True:
+                rows = conn.execute(
+                    text(
+                        "SELECT id, embedding FROM welfares "
+                        "WHERE embedding IS NOT NULL AND id > :last_id ORDER BY id LIMIT :limit"
+                    ),
+                    {"last_id": last_id, "limit": batch_size}
+                ).fetchall()
+                if not rows:
+                    break
+                
+                records = []
+                for welfare_id, raw in rows:
+                    try:
+                        vector = json.loads(raw) if isinstance(raw, str) else raw
+                    except ValueError:
+                        vector = None
+                    if not vector:
+                        skipped += 1
+                        continue
+                    records.append({
+                        "welfare_id": welfare_id,
+                        "dimension": len(vector),
+                        "dtype": dtype,
+                        "vector": encode_vector(vector, dtype)
+                    })
+                
+                if records:
+                    conn.execute(
+                        text(
+                            "INSERT OR IGNORE INTO welfare_embeddings (welfare_id, dimension, dtype, vector) "
+                            "VALUES (:welfare_id, :dimension, :dtype, :vector)"
+                        ),
+                        records
+                    )
+                    migrated += len(records)
+                
+                last_id = rows[-1][0]
+                conn.execute(
+                    text("UPDATE welfares SET embedding = NULL WHERE id <= :last_id AND embedding IS NOT NULL"),
+                    {"last_id": last_id}
+                )
+                conn.commit()
+            
+            if migrated or skipped:
+                logger.info(f"✓ welfares.embedding 마이그레이션 완료: {migrated}개 이동, {skipped}개 건너뜀")
+        except Exception as e:
+            logger.error(f"welfares.embedding 마이그레이션 중 오류 발생: {e}")
+            conn.rollback()
+            return
+        
+        # 더 이상 사용하지 않는 JSON 컬럼 삭제 (SQLite 3.35 이상)
+        try:
+            conn.execute(text("ALTER TABLE welfares DROP COLUMN embedding"))
+            conn.commit()
+            logger.info("welfares 테이블에서 embedding 컬럼을 삭제했습니다. (디스크 공간 회수는 VACUUM 실행)")
+        except Exception as e:
+            logger.warning(f"⚠ embedding 컬럼 삭제 실패 (비워둔 상태로 유지): {e}")
+            conn.rollback()
+
+
+def is_welfare_fts_available() -> bool:
+    """welfares_fts(FTS5) 인덱스를 사용할 수 있는지 확인 (SQLite 전용, 결과 캐시)"""
+    global _welfare_fts_available
+    if _welfare_fts_available is None:
+        from sqlalchemy import text
+        
+        available = False
+        if engine.dialect.name == "sqlite":
+            try:
+                with engine.connect() as conn:
+                    available = conn.execute(
+                        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'welfares_fts'")
+                    ).first() is not None
+            except Exception:
+                available = False
+        _welfare_fts_available = available
+    return _welfare_fts_available
+
+
+def migrate_create_welfare_fts():
+    """
+    welfares 테이블의 전문 검색용 FTS5 가상 테이블(welfares_fts)과 동기화 트리거를 생성하는 마이그레이션
+    - trigram 토크나이저: 한국어 부분 문자열 검색 지원 (SQLite 3.34 이상)
+    - external content 테이블이라 본문은 welfares에만 저장되고 인덱스만 추가로 유지됨
+    - 처음 생성할 때 기존 데이터로 인덱스를 채움
+    - SQLite가 아니거나 FTS5/trigram을 지원하지 않으면 LIKE 검색을 그대로 사용
+    """
+    from sqlalchemy import inspect, text
+    import logging
+    
+    global _welfare_fts_available
+    logger = logging.getLogger(__name__)
+    
+    if engine.dialect.name != "sqlite":
+        _welfare_fts_available = False
+        return
+    
+    inspector = inspect(engine)
+    if "welfares" not in inspector.get_table_names():
+        return
+    
+    statements = [
+        """
+        CREATE TRIGGER IF NOT EXISTS welfares_fts_ai AFTER INSERT ON welfares BEGIN
+            INSERT INTO welfares_fts(rowid, title, summary, full_text)
+            VALUES (new.id, new.title, new.summary, new.full_text);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS welfares_fts_ad AFTER DELETE ON welfares BEGIN
+            INSERT INTO welfares_fts(welfares_fts, rowid, title, summary, full_text)
+            VALUES ('delete', old.id, old.title, old.summary, old.full_text);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS welfares_fts_au AFTER UPDATE OF title, summary, full_text ON welfares BEGIN
+            INSERT INTO welfares_fts(welfares_fts, rowid, title, summary, full_text)
+            VALUES ('delete', old.id, old.title, old.summary, old.full_text);
+            INSERT INTO welfares_fts(rowid, title, summary, full_text)
+            VALUES (new.id, new.title, new.summary, new.full_text);
+        END
+        """,
+    ]
+    
+    with engine.connect() as conn:
+        try:
+            exists = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'welfares_fts'")
+            ).first() is not None
+            
+            if not exists:
+                conn.execute(text(
+                    "CREATE VIRTUAL TABLE welfares_fts USING fts5("
+                    "title, summary, full_text, "
+                    "content='welfares', content_rowid='id', tokenize='trigram')"
+                ))
+            for statement in statements:
+                conn.execute(text(statement))
+            if not exists:
+                conn.execute(text("INSERT INTO welfares_fts(welfares_fts) VALUES ('rebuild')"))
+            conn.commit()
+            
+            _welfare_fts_available = True
+            if not exists:
+                logger.info("✓ welfares_fts 전문 검색 인덱스를 생성했습니다.")
+        except Exception as e:
+            logger.warning(f"⚠ welfares_fts 생성 실패 (LIKE 검색 사용): {e}")
+            conn.rollback()
+            _welfare_fts_available = False
@@ -1,16 +1,23 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import or_, and_
-from sqlalchemy.exc import IntegrityError
-from typing import Optional, List, Tuple, Set
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.engine import Row
+from typing import Optional, List, Tuple, Set, Dict, Iterator, Sequence
 from datetime import date, datetime
+import re
 import secrets
 import string
 import logging
 
+import numpy as np
+
+from app.core.config import settings
 from app.models import models
+from app.models.connection import is_welfare_fts_available
 from app.models import schema
 from app.services.auth_service import get_password_hash
 from app.utils.db_utils import safe_rollback, safe_commit
+from app.utils.vector_utils import encode_vector, decode_vector
 
 logger = logging.getLogger(__name__)
 
@@ -119,18 +126,57 @@ def approve_verification(db: Session, user_id: int) -> Optional[models.User]:
 
 
 # Welfare CRUD
-def search_welfares(
-    db: Session,
+# 목록 화면(카드)에 필요한 컬럼만 조회하기 위한 설정
+# full_text는 summary가 없을 때 카드 요약을 만드는 데만 쓰이므로 앞부분만 가져옴
+WELFARE_CARD_TEXT_PREVIEW_LENGTH = 1000
+# FTS5 trigram 토크나이저는 3글자 미만 키워드를 찾지 못하므로 LIKE 검색 사용
+WELFARE_FTS_MIN_KEYWORD_LENGTH = 3
+# bm25 컬럼 가중치 (title, summary, full_text 순)
+WELFARE_FTS_BM25_WEIGHTS = (10.0, 5.0, 1.0)
+# 자연어 질의에서 검색어로 쓰지 않는 말 (문서 대부분에 나오거나 질문 어미라 관련도 신호가 없음)
+WELFARE_SEARCH_STOPWORDS = frozenset([
+    "받을", "받는", "받고", "받으려면", "있어", "있나요", "있는", "있을까", "있을까요", "없어", "없나요",
+    "알려줘", "알려주세요", "어떻게", "어떤", "무엇", "뭐가", "어디", "언제", "누가",
+    "하나요", "해요", "하는", "하려면", "되나요", "되는", "또는", "관련", "대한",
+])
+
+
+def _welfare_card_columns() -> list:
+    """WelfareItem(카드)에 필요한 컬럼 목록"""
+    from sqlalchemy import func
+    
+    return [
+        models.Welfare.id,
+        models.Welfare.title,
+        models.Welfare.summary,
+        func.substr(models.Welfare.full_text, 1, WELFARE_CARD_TEXT_PREVIEW_LENGTH).label("full_text"),
+        models.Welfare.source_link,
+        models.Welfare.region,
+        models.Welfare.apply_start,
+        models.Welfare.apply_end,
+        models.Welfare.is_always,
+        models.Welfare.status,
+    ]
+
+
+def welfare_card_query(db: Session):
+    """
+    복지 정보 카드 조회용 쿼리 (프로젝션)
+    - 임베딩/원문 전체를 로드하지 않고 카드 컬럼만 튜플로 조회
+    - 결과 행은 welfare.id, welfare.title 처럼 속성으로 접근 가능
+    """
+    return db.query(*_welfare_card_columns())
+
+
+def apply_welfare_filters(
+    query,
     keyword: Optional[str] = None,
     region: Optional[str] = None,
     age: Optional[int] = None,
     care_target: Optional[str] = None,
-    skip: int = 0,
-    limit: int = 20
-) -> List[models.Welfare]:
-    """복지 정보 검색"""
-    query = db.query(models.Welfare)
-    
+    category: Optional[str] = None
+):
+    """복지 정보 검색 조건(키워드/지역/나이/돌봄 대상/분류)을 쿼리에 적용"""
     if keyword:
         query = query.filter(
             or_(
@@ -162,9 +208,212 @@ def search_welfares(
     if care_target:
         query = query.filter(models.Welfare.care_target.contains(care_target))
     
+    if category:
+        query = query.filter(models.Welfare.category == category)
+    
+    return query
+
+
+def _welfare_fts_match_query(keyword: Optional[str]) -> Optional[str]:
+    """
+    검색 키워드를 FTS5 MATCH 구문으로 변환 (키워드 전체를 하나의 구문으로 검색)
+    - FTS 인덱스가 없거나 trigram으로 찾을 수 없는 짧은 키워드면 None (LIKE 검색 사용)
+    """
+    if not keyword or len(keyword.strip()) < WELFARE_FTS_MIN_KEYWORD_LENGTH:
+        return None
+    if not is_welfare_fts_available():
+        return None
+    return '"' + keyword.strip().replace('"', '""') + '"'
+
+
+def _apply_welfare_fts_match(query, match_query: str):
+    """쿼리에 welfares_fts MATCH 조건과 bm25 정렬(관련도 높은 순)을 적용"""
+    from sqlalchemy import table, column, text
+    
+    welfares_fts = table("welfares_fts", column("rowid"))
+    weights = ", ".join(str(weight) for weight in WELFARE_FTS_BM25_WEIGHTS)
+    return query.join(
+        welfares_fts, welfares_fts.c.rowid == models.Welfare.id
+    ).filter(
+        text("welfares_fts MATCH :fts_query").bindparams(fts_query=match_query)
+    ).order_by(
+        text(f"bm25(welfares_fts, {weights})")
+    )
+
+
+def search_welfares(
+    db: Session,
+    keyword: Optional[str] = None,
+    region: Optional[str] = None,
+    age: Optional[int] = None,
+    care_target: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 20
+) -> List[Row]:
+    """
+    복지 정보 검색 (카드 컬럼만 조회)
+    - 키워드가 있으면 FTS5 전문 검색 인덱스 사용 (bm25 관련도 순)
+    - FTS를 쓸 수 없는 환경/짧은 키워드는 LIKE 검색으로 폴백
+    """
+    match_query = _welfare_fts_match_query(keyword)
+    if match_query:
+        query = apply_welfare_filters(
+            welfare_card_query(db),
+            region=region,
+            age=age,
+            care_target=care_target
+        )
+        try:
+            return _apply_welfare_fts_match(query, match_query).offset(skip).limit(limit).all()
+        except OperationalError as e:
+            safe_rollback(db)
+            logger.warning(f"FTS 검색 실패, LIKE 검색으로 폴백: keyword={keyword}, error={e}")
+    
+    query = apply_welfare_filters(
+        welfare_card_query(db),
+        keyword=keyword,
+        region=region,
+        age=age,
+        care_target=care_target
+    )
+    
     return query.offset(skip).limit(limit).all()
 
 
+def _split_search_terms(query: str, max_terms: int = 8) -> List[str]:
+    """
+    자연어 질의를 검색어 목록으로 분리 (문장부호 제거, 중복 제거)
+    - 1글자 토큰("수", "것")과 불용어("받을", "있어" 등)는 제외
+    """
+    terms = [
+        term for term in re.split(r"[^\w]+", query)
+        if len(term) >= 2 and term not in WELFARE_SEARCH_STOPWORDS
+    ]
+    return list(dict.fromkeys(terms))[:max_terms]
+
+
+def search_welfare_ids_lexical(
+    db: Session,
+    query: str,
+    region: Optional[str] = None,
+    age: Optional[int] = None,
+    care_target: Optional[str] = None,
+    limit: int = 50
+) -> List[Tuple[int, Optional[float]]]:
+    """
+    하이브리드 검색용 키워드 후보 조회 (검색어 중 하나라도 포함된 문서, 관련도 순)
+    - FTS 사용 가능 시: 3글자 이상 검색어를 OR로 묶어 bm25 점수 순 (점수는 클수록 관련도 높음)
+    - 짧은 검색어 또는 FTS를 쓸 수 없는 경우: LIKE OR 검색 결과를 뒤에 추가
+      (점수 None, 일치한 검색어 수 → 제목에 일치한 검색어 수 → ID 순)
+    - 반환: [(welfare_id, 점수), ...]
+    """
+    from sqlalchemy import table, column, text
+    
+    terms = _split_search_terms(query)
+    if not terms:
+        return []
+    
+    fts_terms = [term for term in terms if len(term) >= WELFARE_FTS_MIN_KEYWORD_LENGTH]
+    base_query = apply_welfare_filters(
+        db.query(models.Welfare.id),
+        region=region,
+        age=age,
+        care_target=care_target
+    )
+    
+    results: List[Tuple[int, Optional[float]]] = []
+    like_terms = terms
+    if fts_terms and is_welfare_fts_available():
+        welfares_fts = table("welfares_fts", column("rowid"))
+        weights = ", ".join(str(weight) for weight in WELFARE_FTS_BM25_WEIGHTS)
+        bm25 = text(f"bm25(welfares_fts, {weights})")
+        match_query = " OR ".join('"' + term.replace('"', '""') + '"' for term in fts_terms)
+        try:
+            rows = base_query.add_columns(bm25).join(
+                welfares_fts, welfares_fts.c.rowid == models.Welfare.id
+            ).filter(
+                text("welfares_fts MATCH :fts_query").bindparams(fts_query=match_query)
+            ).order_by(bm25).limit(limit).all()
+            # bm25는 관련도가 높을수록 작은(음수) 값이므로 부호를 바꿔 반환
+            results = [(welfare_id, -score) for welfare_id, score in rows]
+            # trigram으로 찾을 수 없는 짧은 검색어만 LIKE로 보충
+            like_terms = [term for term in terms if len(term) < WELFARE_FTS_MIN_KEYWORD_LENGTH]
+        except OperationalError as e:
+            safe_rollback(db)
+            logger.warning(f"FTS 후보 검색 실패, LIKE 검색으로 폴백: query={query[:50]}, error={e}")
+    
+    if like_terms and len(results) < limit:
+        from sqlalchemy import case
+        
+        conditions = []
+        matched_terms = []
+        title_terms = []
+        for term in like_terms:
+            term_condition = or_(
+                models.Welfare.title.contains(term),
+                models.Welfare.summary.contains(term),
+                models.Welfare.full_text.contains(term)
+            )
+            conditions.append(term_condition)
+            matched_terms.append(case((term_condition, 1), else_=0))
+            title_terms.append(case((models.Welfare.title.contains(term), 1), else_=0))
+        like_query = base_query.filter(or_(*conditions))
+        found = {welfare_id for welfare_id, _ in results}
+        if found:
+            like_query = like_query.filter(models.Welfare.id.notin_(found))
+        # 여러 검색어가 일치한 문서, 그중 제목에 일치한 문서를 먼저 (같으면 ID 순)
+        rows = like_query.order_by(
+            sum(matched_terms[1:], matched_terms[0]).desc(),
+            sum(title_terms[1:], title_terms[0]).desc(),
+            models.Welfare.id.asc()
+        ).limit(limit - len(results)).all()
+        results.extend((welfare_id, None) for (welfare_id,) in rows)
+    
+    return results
+
+
+def get_welfare_ids_by_filter(
+    db: Session,
+    region: Optional[str] = None,
+    age: Optional[int] = None,
+    care_target: Optional[str] = None,
+    category: Optional[str] = None
+) -> Set[int]:
+    """필터 조건에 맞는 전체 welfare ID 집합 (벡터 검색 ID selector용)"""
+    query = apply_welfare_filters(
+        db.query(models.Welfare.id),
+        region=region,
+        age=age,
+        care_target=care_target,
+        category=category
+    )
+    return {welfare_id for (welfare_id,) in query.all()}
+
+
+def get_welfare_cards_by_ids(
+    db: Session,
+    welfare_ids: List[int],
+    region: Optional[str] = None,
+    age: Optional[int] = None,
+    care_target: Optional[str] = None
+) -> List[Row]:
+    """
+    ID 목록의 복지 정보 카드 조회
+    - 입력 ID 순서 유지 (검색 순위 보존), 필터에 맞지 않는 항목은 제외
+    """
+    if not welfare_ids:
+        return []
+    
+    query = apply_welfare_filters(
+        welfare_card_query(db).filter(models.Welfare.id.in_(welfare_ids)),
+        region=region,
+        age=age,
+        care_target=care_target
+    )
+    cards = {card.id: card for card in query.all()}
+    return [cards[welfare_id] for welfare_id in welfare_ids if welfare_id in cards]
+
+
 def get_welfare_by_id(db: Session, welfare_id: int) -> Optional[models.Welfare]:
     """복지 정보 ID로 조회"""
     return db.query(models.Welfare).filter(models.Welfare.id == welfare_id).first()
@@ -203,11 +452,11 @@ def get_active_welfares(
     db: Session,
     skip: int = 0,
     limit: int = 20
-) -> List[models.Welfare]:
-    """현재 신청 가능한 복지 정보만 조회"""
+) -> List[Row]:
+    """현재 신청 가능한 복지 정보만 조회 (카드 컬럼만 조회)"""
     today = date.today()
     
-    query = db.query(models.Welfare).filter(
+    query = welfare_card_query(db).filter(
         models.Welfare.status == 'active'
     ).filter(
         or_(
@@ -220,6 +469,274 @@ def get_active_welfares(
     return query.order_by(models.Welfare.apply_end.asc()).offset(skip).limit(limit).all()
 
 
+# WelfareEmbedding CRUD
+def get_welfare_embeddings(db: Session, welfare_ids: List[int]) -> Dict[int, np.ndarray]:
+    """복지 정보 ID 목록의 임베딩 조회 (없는 ID는 결과에서 제외)"""
+    if not welfare_ids:
+        return {}
+    
+    rows = db.query(
+        models.WelfareEmbedding.welfare_id,
+        models.WelfareEmbedding.dtype,
+        models.WelfareEmbedding.vector
+    ).filter(
+        models.WelfareEmbedding.welfare_id.in_(welfare_ids)
+    ).all()
+    
+    return {welfare_id: decode_vector(vector, dtype) for welfare_id, dtype, vector in rows}
+
+
+def iter_welfare_embeddings(
+    db: Session,
+    batch_size: int = 500
+) -> Iterator[Tuple[List[int], np.ndarray]]:
+    """
+    저장된 모든 임베딩을 ID 순으로 나누어 조회 (벡터 인덱스 구축용)
+    - 반환: (welfare ID 리스트, float32 행렬) 배치 이터레이터
+    """
+    last_id = 0
+    while True:
+        rows = db.query(
+            models.WelfareEmbedding.welfare_id,
+            models.WelfareEmbedding.dtype,
+            models.WelfareEmbedding.vector
+        ).filter(
+            models.WelfareEmbedding.welfare_id > last_id
+        ).order_by(
+            models.WelfareEmbedding.welfare_id.asc()
+        ).limit(batch_size).all()
+        
+        if not rows:
+            return
+        
+        last_id = rows[-1][0]
+        yield [row[0] for row in rows], np.vstack([decode_vector(vector, dtype) for _, dtype, vector in rows])
+
+
+def get_embedded_welfare_ids(db: Session) -> Set[int]:
+    """임베딩이 저장된 welfare ID 집합"""
+    return {welfare_id for (welfare_id,) in db.query(models.WelfareEmbedding.welfare_id).all()}
+
+
+def get_welfare_texts(db: Session, welfare_ids: List[int]) -> List[Tuple[int, Optional[str]]]:
+    """복지 정보 ID 목록의 (ID, 원본 텍스트) 조회 (존재하는 ID만)"""
+    if not welfare_ids:
+        return []
+    return db.query(
+        models.Welfare.id,
+        models.Welfare.full_text
+    ).filter(
+        models.Welfare.id.in_(welfare_ids)
+    ).order_by(models.Welfare.id.asc()).all()
+
+
+def delete_welfare_embeddings(db: Session, welfare_ids: List[int]) -> int:
+    """복지 정보 임베딩 삭제, 삭제된 개수 반환"""
+    if not welfare_ids:
+        return 0
+    
+    try:
+        deleted = db.query(models.WelfareEmbedding).filter(
+            models.WelfareEmbedding.welfare_id.in_(welfare_ids)
+        ).delete(synchronize_session=False)
+        safe_commit(db)
+    except Exception as e:
+        safe_rollback(db)
+        logger.error(f"임베딩 삭제 실패: {len(welfare_ids)}개, error={e}", exc_info=True)
+        raise
+    
+    return deleted
+
+
+def get_welfares_without_embedding(
+    db: Session,
+    limit: Optional[int] = None
+) -> List[Tuple[int, str]]:
+    """임베딩이 아직 없는 복지 정보의 (ID, 원본 텍스트) 조회"""
+    query = db.query(
+        models.Welfare.id,
+        models.Welfare.full_text
+    ).outerjoin(
+        models.WelfareEmbedding
+    ).filter(
+        models.WelfareEmbedding.welfare_id.is_(None),
+        models.Welfare.full_text.isnot(None)
+    ).order_by(models.Welfare.id.asc())
+    
+    if limit is not None:
+        query = query.limit(limit)
+    
+    return [(welfare_id, full_text) for welfare_id, full_text in query.all() if full_text]
+
+
+def save_welfare_embeddings(
+    db: Session,
+    embeddings: Dict[int, Sequence[float]],
+    dtype: Optional[str] = None
+) -> int:
+    """
+    복지 정보 임베딩 저장 (이미 있으면 덮어씀)
+    - dtype: 저장 타입 (None이면 설정값 EMBEDDING_STORAGE_DTYPE)
+    - 반환: 저장한 개수
+    """
+    if not embeddings:
+        return 0
+    
+    dtype = dtype or settings.EMBEDDING_STORAGE_DTYPE
+    existing = {
+        record.welfare_id: record
+        for record in db.query(models.WelfareEmbedding).filter(
+            models.WelfareEmbedding.welfare_id.in_(list(embeddings.keys()))
+        ).all()
+    }
+    
+    try:
+        for welfare_id, vector in embeddings.items():
+            record = existing.get(welfare_id)
+            if record is None:
+                record = models.WelfareEmbedding(welfare_id=welfare_id)
+                db.add(record)
+            record.dimension = len(vector)
+            record.dtype = dtype
+            record.vector = encode_vector(vector, dtype)
+        safe_commit(db)
+    except Exception as e:
+        safe_rollback(db)
+        logger.error(f"임베딩 저장 실패: {len(embeddings)}개, error={e}", exc_info=True)
+        raise
+    
+    return len(embeddings)
+
+
+# WelfareChunk CRUD
+def save_welfare_chunks(
+    db: Session,
+    chunks: Dict[int, List[Tuple[str, Sequence[float]]]],
+    dtype: Optional[str] = None
+) -> int:
+    """
+    복지 정보별 청크 (텍스트, 임베딩) 목록 저장 (해당 복지 정보의 기존 청크는 모두 교체)
+    - dtype: 저장 타입 (None이면 설정값 EMBEDDING_STORAGE_DTYPE)
+    - 반환: 저장한 청크 수
+    """
+    if not chunks:
+        return 0
+    
+    dtype = dtype or settings.EMBEDDING_STORAGE_DTYPE
+    saved = 0
+    try:
+        db.query(models.WelfareChunk).filter(
+            models.WelfareChunk.welfare_id.in_(list(chunks.keys()))
+        ).delete(synchronize_session=False)
+        for welfare_id, items in chunks.items():
+            for chunk_index, (text, vector) in enumerate(items):
+                db.add(models.WelfareChunk(
+                    welfare_id=welfare_id,
+                    chunk_index=chunk_index,
+                    text=text,
+                    dimension=len(vector),
+                    dtype=dtype,
+                    vector=encode_vector(vector, dtype)
+                ))
+                saved += 1
+        safe_commit(db)
+    except Exception as e:
+        safe_rollback(db)
+        logger.error(f"청크 저장 실패: {len(chunks)}개 복지 정보, error={e}", exc_info=True)
+        raise
+    
+    return saved
+
+
+def get_welfare_chunk_keys(db: Session) -> List[Tuple[int, int]]:
+    """저장된 모든 청크의 (welfare ID, 청크 순서) 목록 (벡터는 읽지 않음)"""
+    return [
+        (welfare_id, chunk_index)
+        for welfare_id, chunk_index in db.query(
+            models.WelfareChunk.welfare_id,
+            models.WelfareChunk.chunk_index
+        ).all()
+    ]
+
+
+def get_welfare_chunk_embeddings(db: Session, welfare_ids: List[int]) -> Dict[Tuple[int, int], np.ndarray]:
+    """복지 정보 ID 목록의 청크 임베딩 조회: {(welfare ID, 청크 순서): 벡터}"""
+    if not welfare_ids:
+        return {}
+    
+    rows = db.query(
+        models.WelfareChunk.welfare_id,
+        models.WelfareChunk.chunk_index,
+        models.WelfareChunk.dtype,
+        models.WelfareChunk.vector
+    ).filter(
+        models.WelfareChunk.welfare_id.in_(welfare_ids)
+    ).all()
+    
+    return {
+        (welfare_id, chunk_index): decode_vector(vector, dtype)
+        for welfare_id, chunk_index, dtype, vector in rows
+    }
+
+
+def get_welfare_chunk_texts(db: Session, keys: List[Tuple[int, int]]) -> Dict[Tuple[int, int], str]:
+    """(welfare ID, 청크 순서) 목록의 청크 원문 조회 (없는 키는 결과에서 제외)"""
+    if not keys:
+        return {}
+    
+    wanted = set(keys)
+    rows = db.query(
+        models.WelfareChunk.welfare_id,
+        models.WelfareChunk.chunk_index,
+        models.WelfareChunk.text
+    ).filter(
+        models.WelfareChunk.welfare_id.in_({welfare_id for welfare_id, _ in wanted})
+    ).all()
+    
+    return {
+        (welfare_id, chunk_index): text
+        for welfare_id, chunk_index, text in rows
+        if (welfare_id, chunk_index) in wanted
+    }
+
+
+def delete_welfare_chunks(db: Session, welfare_ids: List[int]) -> int:
+    """복지 정보 청크 삭제, 삭제된 청크 수 반환"""
+    if not welfare_ids:
+        return 0
+    
+    try:
+        deleted = db.query(models.WelfareChunk).filter(
+            models.WelfareChunk.welfare_id.in_(welfare_ids)
+        ).delete(synchronize_session=False)
+        safe_commit(db)
+    except Exception as e:
+        safe_rollback(db)
+        logger.error(f"청크 삭제 실패: {len(welfare_ids)}개, error={e}", exc_info=True)
+        raise
+    
+    return deleted
+
+
+def get_welfares_without_chunks(
+    db: Session,
+    limit: Optional[int] = None
+) -> List[Tuple[int, str]]:
+    """청크가 아직 없는 복지 정보의 (ID, 원본 텍스트) 조회"""
+    query = db.query(
+        models.Welfare.id,
+        models.Welfare.full_text
+    ).filter(
+        ~models.Welfare.chunks.any(),
+        models.Welfare.full_text.isnot(None)
+    ).order_by(models.Welfare.id.asc())
+    
+    if limit is not None:
+        query = query.limit(limit)
+    
+    return [(welfare_id, full_text) for welfare_id, full_text in query.all() if full_text]
+
+
 # Bookmark CRUD
 def create_bookmark(db: Session, user_id: int, welfare_id: int) -> Tuple[models.Bookmark, bool]:
     """
@@ -252,14 +769,13 @@ def get_user_bookmarks(
     user_id: int,
     skip: int = 0,
     limit: int = 20
-) -> tuple[List[models.Bookmark], int]:
+) -> tuple[List[Row], int]:
     """
-    사용자의 북마크 목록 조회 (welfare 관계 포함)
+    사용자의 북마크 목록 조회 (복지 정보 카드 컬럼 포함)
     - 삭제된 복지 정보는 필터링
     - DB 레벨에서 정렬 및 페이지네이션 처리
-    - 반환: (북마크 리스트, 총 개수)
+    - 반환: ((bookmark_id, bookmarked_at, 카드 컬럼...) 행 리스트, 총 개수)
     """
-    from sqlalchemy.orm import joinedload
     from sqlalchemy import func
     
     # 총 개수 조회 (삭제되지 않은 복지 정보만)
@@ -270,8 +786,12 @@ def get_user_bookmarks(
     ).scalar() or 0
     
     # 북마크 조회 (삭제되지 않은 복지 정보만, 최신순 정렬)
-    bookmarks = db.query(models.Bookmark).options(
-        joinedload(models.Bookmark.welfare)
+    bookmarks = db.query(
+        models.Bookmark.id.label("bookmark_id"),
+        models.Bookmark.created_at.label("bookmarked_at"),
+        *_welfare_card_columns()
+    ).select_from(
+        models.Bookmark
     ).join(
         models.Welfare
     ).filter(
@@ -917,10 +1437,10 @@ def get_user_recent_welfare_views(
 def get_popular_welfares(
     db: Session,
     limit: int = 10
-) -> List[models.Welfare]:
+) -> List[Row]:
     """
-    인기 복지 정보 조회 (조회수 기준)
+    인기 복지 정보 조회 (조회수 기준, 카드 컬럼만 조회)
     """
-    return db.query(models.Welfare).order_by(
+    return welfare_card_query(db).order_by(
         models.Welfare.view_count.desc()
     ).limit(limit).all()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, Text, DateTime, ForeignKey, JSON, Date, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Boolean, Text, DateTime, ForeignKey, Date, LargeBinary, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.models.connection import Base
@@ -71,9 +71,6 @@ class Welfare(Base):
     # 데이터 분류 (RAG 품질 향상용)
     category = Column(String, nullable=True, index=True)  # 'SERVICE'(실제 복지), 'NEWS'(뉴스/단순정보), 'UNCERTAIN'(미분류)
     
-    # RAG 관련
-    embedding = Column(JSON, nullable=True)  # 벡터 임베딩 (JSON 배열)
-    
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
@@ -83,6 +80,42 @@ class Welfare(Base):
     # 관계
     bookmarks = relationship("Bookmark", back_populates="welfare", cascade="all, delete-orphan")
     view_logs = relationship("WelfareViewLog", back_populates="welfare", cascade="all, delete-orphan")
+    # RAG 관련: 벡터 임베딩은 별도 테이블에 바이너리로 저장 (목록 조회 시 로드되지 않음)
+    embedding_record = relationship("WelfareEmbedding", back_populates="welfare", uselist=False, cascade="all, delete-orphan")
+    chunks = relationship("WelfareChunk", back_populates="welfare", cascade="all, delete-orphan", order_by="WelfareChunk.chunk_index")
+
+
+class WelfareEmbedding(Base):
+    """복지 정보 벡터 임베딩 모델 (float32/float16 바이너리)"""
+    __tablename__ = "welfare_embeddings"
+    
+    welfare_id = Column(Integer, ForeignKey("welfares.id", ondelete="CASCADE"), primary_key=True)
+    dimension = Column(Integer, nullable=False)
+    dtype = Column(String, nullable=False, default="float32")  # 'float32' 또는 'float16'
+    vector = Column(LargeBinary, nullable=False)  # encode_vector로 직렬화한 벡터
+    
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    # 관계
+    welfare = relationship("Welfare", back_populates="embedding_record")
+
+
+class WelfareChunk(Base):
+    """복지 정보 원문 청크와 청크 임베딩 (긴 원문의 청크 단위 벡터 검색용)"""
+    __tablename__ = "welfare_chunks"
+    
+    welfare_id = Column(Integer, ForeignKey("welfares.id", ondelete="CASCADE"), primary_key=True)
+    chunk_index = Column(Integer, primary_key=True)  # 원문 안에서의 순서 (0부터)
+    text = Column(Text, nullable=False)  # 청크 원문 (챗봇 프롬프트에 관련 문단으로 사용)
+    dimension = Column(Integer, nullable=False)
+    dtype = Column(String, nullable=False, default="float32")  # 'float32' 또는 'float16'
+    vector = Column(LargeBinary, nullable=False)  # encode_vector로 직렬화한 벡터
+    
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    # 관계
+    welfare = relationship("Welfare", back_populates="chunks")
 
 
 class Bookmark(Base):
@@ -3,15 +3,24 @@
 - 대화 내역 저장
 - 위기 감지 결과에 따른 분기 처리
 - RAG 엔진을 통한 복지 정보 검색 및 답변 생성
+- 스트리밍 응답 (첫 토큰까지 걸린 시간 통계)
+- 비동기 응답/스트리밍 (LLM 호출을 await)
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, AsyncIterator, Optional, Tuple
+from collections import deque
+import asyncio
+import threading
+import time
 from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
 from app.models import schema
 from app.ai_core.llm_client import llm_client
 from app.ai_core.prompts import CHATBOT_SYSTEM_PROMPT, CBT_PROMPT
-from app.ai_core.safety_guard import detect_crisis, analyze_crisis_level, get_crisis_info
-from app.ai_core.rag_engine import search_context
+from app.ai_core.safety_guard import detect_crisis, analyze_crisis_level, aanalyze_crisis_level, get_crisis_info
+from app.ai_core.rag_engine import hybrid_search
+from app.models.crud import get_welfare_cards_by_ids
+from app.core.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
@@ -40,30 +49,22 @@ def get_chat_response(
     if history is None:
         history = []
     
-    # 하이브리드 위기 감지 (1차: 키워드, 2차: LLM 감정 분석)
+    # 하이브리드 위기 감지 (1차: 키워드, 2차: LLM 대화 턴 분석)
     crisis_analysis = analyze_crisis_level(message, use_llm=use_llm_detection)
     is_crisis = crisis_analysis.get("is_crisis", False)
     crisis_level = crisis_analysis.get("level", "low")
     detection_method = crisis_analysis.get("detection_method")
     
-    if is_crisis:
-        # 위기 수준에 따른 차별화된 응답
-        if crisis_level == "high":
-            from app.core.config import settings
-            reply = f"지금 정말 힘든 상황이시군요. 혼자 견디기 어려운 상황이라면 즉시 전문가의 도움이 필요해요. 보건복지콜센터({settings.CRISIS_HOTLINE})로 연락하시거나, 주변에 도움을 요청하는 것도 용기 있는 행동이에요. 당신은 혼자가 아니에요."
-            crisis_info = crisis_analysis.get("info")
-        elif crisis_level == "medium":
-            reply = "지금 많이 힘드시는 것 같아요. 이런 감정을 느끼는 것은 당연해요. 혼자 견디기 어려운 상황이라면 전문가의 도움이 필요할 수 있어요. 주변에 도움을 요청하는 것도 용기 있는 행동이에요."
-            crisis_info = crisis_analysis.get("info")
-        else:
-            # 낮은 수준의 위기 감지 시: 전문가 안내 + CBT 기법 적용
-            reply = generate_empathic_response(message, history, db=db)
-            # 낮은 수준이지만 위기로 감지된 경우에도 정보 제공
-            crisis_info = crisis_analysis.get("info")
-    else:
-        # 일반 대화 응답 (CBT 기법 포함)
-        reply = generate_empathic_response(message, history, db=db)
-        crisis_info = None
+    # 높은/중간 수준 위기는 LLM 없이 정해진 안내 응답
+    reply = _crisis_reply(crisis_analysis)
+    if reply is None:
+        # 일반 대화 또는 낮은 수준의 위기: 공감형 응답 (CBT 기법 포함)
+        # 위기 감지 단계의 LLM 분석 결과를 재사용 (감정 분석을 다시 호출하지 않음)
+        reply = generate_empathic_response(
+            message, history, db=db, turn_analysis=crisis_analysis.get("turn_analysis")
+        )
+    # 낮은 수준이지만 위기로 감지된 경우에도 정보 제공
+    crisis_info = crisis_analysis.get("info") if is_crisis else None
     
     # TODO: 대화 내역 DB 저장
     # if db and user_id:
@@ -76,15 +77,410 @@ def get_chat_response(
     )
 
 
-def generate_empathic_response(message: str, history: List[Dict], db: Optional[Session] = None) -> str:
+async def aget_chat_response(
+    message: str,
+    history: Optional[List[Dict]] = None,
+    user_id: Optional[int] = None,
+    db: Optional[Session] = None,
+    use_llm_detection: bool = True
+) -> schema.ChatResponse:
+    """
+    get_chat_response의 비동기 버전
+    - LLM 호출(위기 감지 대화 턴 분석, 응답 생성)을 await하여 응답 대기 중 워커 스레드를 점유하지 않음
+    - RAG 검색 등 DB/FAISS 동기 작업만 스레드 풀에서 실행
+    """
+    if history is None:
+        history = []
+    
+    crisis_analysis = await aanalyze_crisis_level(message, use_llm=use_llm_detection)
+    is_crisis = crisis_analysis.get("is_crisis", False)
+    
+    reply = _crisis_reply(crisis_analysis)
+    if reply is None:
+        reply = await agenerate_empathic_response(
+            message, history, db=db, turn_analysis=crisis_analysis.get("turn_analysis")
+        )
+    crisis_info = crisis_analysis.get("info") if is_crisis else None
+    
+    return schema.ChatResponse(
+        reply=reply,
+        is_crisis=is_crisis,
+        crisis_info=crisis_info
+    )
+
+
+# 스트리밍 응답 통계: 최근 첫 토큰까지 걸린 시간(초)과 누적 수
+_STREAM_TTFT_WINDOW = 1000
+_stream_ttfts: "deque[float]" = deque(maxlen=_STREAM_TTFT_WINDOW)
+_stream_stats = {"started": 0, "completed": 0, "disconnected": 0, "crisis_replies": 0}
+_stream_stats_lock = threading.Lock()
+
+
+class ChatReplyStream:
+    """
+    스트리밍 챗봇 응답
+    - 위기 감지 결과(is_crisis, crisis_info)는 생성 시점에 이미 확정
+    - async for로 순회하면 응답 조각을 반환하고, 끝나면 reply에 전체 응답, ttft에 첫 조각까지 걸린 시간(초)
+    """
+
+    def __init__(
+        self,
+        chunks: AsyncIterator[str],
+        is_crisis: bool,
+        crisis_info: Optional[dict],
+        started: float,
+        fallback=None
+    ):
+        """
+        chunks: 응답 조각 비동기 이터레이터
+        started: 요청 시작 시각 (time.perf_counter 기준, TTFT 계산용)
+        fallback: 응답이 비어 있을 때 대신 보낼 문장을 만드는 함수
+        """
+        self.is_crisis = is_crisis
+        self.crisis_info = crisis_info
+        self.reply = ""
+        self.ttft: Optional[float] = None
+        self.completed = False
+        self._chunks = chunks
+        self._started = started
+        self._fallback = fallback
+        # "늘봄:" 접두사를 제거할 수 있도록 앞부분은 접두사 길이만큼 모아서 보냄 (보낸 뒤에는 None)
+        self._pending: Optional[str] = ""
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        self._begin()
+        try:
+            async for chunk in self._chunks:
+                chunk = self._feed(chunk)
+                if chunk:
+                    yield chunk
+            for chunk in self._finish():
+                yield chunk
+        except (GeneratorExit, asyncio.CancelledError):
+            # 클라이언트 연결 종료 (남은 조각은 생성하지 않음)
+            self._disconnected()
+            raise
+        finally:
+            # LLM 스트리밍 연결 정리
+            aclose = getattr(self._chunks, "aclose", None)
+            if aclose:
+                await aclose()
+
+    def _begin(self):
+        """순회 시작 기록"""
+        with _stream_stats_lock:
+            _stream_stats["started"] += 1
+
+    def _feed(self, chunk: str) -> Optional[str]:
+        """LLM 조각 처리, 보낼 조각 반환 (접두사 확인을 위해 모으는 중이면 None)"""
+        if not chunk:
+            return None
+        if self._pending is not None:
+            self._pending += chunk
+            if len(self._pending.lstrip()) < len("늘봄:"):
+                return None
+            chunk, self._pending = _strip_reply_prefix(self._pending), None
+            if not chunk:
+                # 접두사만 온 경우 다음 조각부터 다시 모음 (앞 공백 제거)
+                self._pending = ""
+                return None
+        return self._emit(chunk)
+
+    def _finish(self) -> List[str]:
+        """LLM 응답이 끝난 뒤 남은 조각 (모으던 앞부분, 비어 있으면 fallback) 반환 및 완료 기록"""
+        tail = []
+        if self._pending and self._pending.strip():
+            tail.append(self._emit(_strip_reply_prefix(self._pending)))
+        self._pending = None
+        if not self.reply.strip() and self._fallback:
+            logger.warning("스트리밍 응답이 비어 있음 - fallback 사용")
+            tail.append(self._emit(self._fallback()))
+        self.reply = self.reply.strip()
+        self.completed = True
+        with _stream_stats_lock:
+            _stream_stats["completed"] += 1
+        return tail
+
+    def _disconnected(self):
+        """클라이언트 연결 종료 기록"""
+        with _stream_stats_lock:
+            _stream_stats["disconnected"] += 1
+        logger.info(f"스트리밍 응답 중 연결 종료: {len(self.reply)}자 전송")
+
+    def _emit(self, chunk: str) -> str:
+        """조각 전송 기록 (첫 조각이면 TTFT 측정)"""
+        if self.ttft is None:
+            self.ttft = time.perf_counter() - self._started
+            with _stream_stats_lock:
+                _stream_ttfts.append(self.ttft)
+        self.reply += chunk
+        return chunk
+
+
+async def astream_chat_response(
+    message: str,
+    history: Optional[List[Dict]] = None,
+    db: Optional[Session] = None,
+    use_llm_detection: bool = True,
+    started: Optional[float] = None
+) -> ChatReplyStream:
+    """
+    get_chat_response의 스트리밍 버전 (async for로 순회)
+    - 위기 감지와 RAG 검색/프롬프트 준비는 호출 시점에 끝내고 (토큰 전송 전), LLM 응답만 순회하며 생성
+    - 위기 감지와 LLM 응답 조각은 await, RAG 검색/프롬프트 준비만 스레드 풀에서 실행
+    - 높은/중간 수준 위기는 고정 안내 응답을 한 조각으로 반환
+    - started: 요청 시작 시각 (None이면 이 함수 호출 시각, TTFT 기준)
+    """
+    if started is None:
+        started = time.perf_counter()
+    if history is None:
+        history = []
+    
+    crisis_analysis = await aanalyze_crisis_level(message, use_llm=use_llm_detection)
+    is_crisis = crisis_analysis.get("is_crisis", False)
+    crisis_info = crisis_analysis.get("info") if is_crisis else None
+    
+    reply = _crisis_reply(crisis_analysis)
+    if reply is not None:
+        with _stream_stats_lock:
+            _stream_stats["crisis_replies"] += 1
+        return ChatReplyStream(_single_chunk(reply), is_crisis, crisis_info, started)
+    
+    turn = await _abuild_chat_turn(message, history, db=db, turn_analysis=crisis_analysis.get("turn_analysis"))
+    chunks = llm_client.astream_chat_response(
+        message=message,
+        history=turn["history"],
+        system_prompt=turn["system_prompt"]
+    )
+    return ChatReplyStream(
+        chunks,
+        is_crisis,
+        crisis_info,
+        started,
+        fallback=lambda: _generate_diverse_fallback(
+            message, turn["has_negative_emotion"], turn["has_positive_emotion"], turn["history"]
+        )
+    )
+
+
+async def _single_chunk(text: str) -> AsyncIterator[str]:
+    """고정 응답을 한 조각으로 반환하는 비동기 이터레이터"""
+    yield text
+
+
+def get_chat_stream_stats() -> Dict:
+    """스트리밍 응답 수와 최근 응답의 첫 토큰까지 걸린 시간(TTFT, ms) 분포"""
+    with _stream_stats_lock:
+        stats = dict(_stream_stats)
+        ttfts = sorted(_stream_ttfts)
+    if ttfts:
+        def percentile(q: float) -> float:
+            return round(ttfts[min(len(ttfts) - 1, int(q * len(ttfts)))] * 1000, 1)
+        stats["ttft_ms"] = {
+            "samples": len(ttfts),
+            "avg": round(sum(ttfts) / len(ttfts) * 1000, 1),
+            "p50": percentile(0.5),
+            "p95": percentile(0.95),
+            "p99": percentile(0.99),
+        }
+    else:
+        stats["ttft_ms"] = None
+    return stats
+
+
+def _crisis_reply(crisis_analysis: Dict) -> Optional[str]:
+    """위기 수준에 따른 고정 안내 응답 (높음/중간), LLM 응답을 생성해야 하면 None"""
+    if not crisis_analysis.get("is_crisis", False):
+        return None
+    crisis_level = crisis_analysis.get("level", "low")
+    if crisis_level == "high":
+        return f"지금 정말 힘든 상황이시군요. 혼자 견디기 어려운 상황이라면 즉시 전문가의 도움이 필요해요. 보건복지콜센터({settings.CRISIS_HOTLINE})로 연락하시거나, 주변에 도움을 요청하는 것도 용기 있는 행동이에요. 당신은 혼자가 아니에요."
+    if crisis_level == "medium":
+        return "지금 많이 힘드시는 것 같아요. 이런 감정을 느끼는 것은 당연해요. 혼자 견디기 어려운 상황이라면 전문가의 도움이 필요할 수 있어요. 주변에 도움을 요청하는 것도 용기 있는 행동이에요."
+    # 낮은 수준의 위기 감지 시: 전문가 안내 + CBT 기법 적용
+    return None
+
+
+def generate_empathic_response(
+    message: str,
+    history: List[Dict],
+    db: Optional[Session] = None,
+    turn_analysis: Optional[Dict] = None
+) -> str:
     """
     공감형 응답 생성
     - LLM API 통합
     - 긍정 심리학 기반 CBT 유도 프롬프트 적용
     - 부정적 감정 감지 시 명시적 CBT 기법 적용
     - 복지 정보 관련 질문 시 RAG 엔진을 통해 관련 정보 검색
+    - turn_analysis: 위기 감지 단계의 대화 턴 분석 결과 (있으면 감정 분석을 다시 호출하지 않음)
     """
+    turn = _build_chat_turn(message, history, db=db, turn_analysis=turn_analysis)
+    has_negative_emotion = turn["has_negative_emotion"]
+    has_positive_emotion = turn["has_positive_emotion"]
+    sentiment_score = turn["sentiment_score"]
+    formatted_history = turn["history"]
+    system_prompt = turn["system_prompt"]
     
+    try:
+        # 부정적 감정이 강하게 감지된 경우 CBT 기법 명시적 적용
+        # sentiment_score가 None이어도(감정 분석 실패) 부정적 키워드가 있으면 CBT 적용 시도
+        if has_negative_emotion and (sentiment_score is None or sentiment_score < 0.4):
+            # 히스토리를 고려하여 자연스럽게 응답 생성
+            reply = llm_client.generate_chat_response(
+                message=message,
+                history=formatted_history,
+                system_prompt=system_prompt
+            )
+        elif has_positive_emotion:
+            # 긍정적 감정일 때는 감사 일기 기록 유도
+            reply = llm_client.generate_chat_response(
+                message=message,
+                history=formatted_history,
+                system_prompt=system_prompt
+            )
+        else:
+            # 일반 대화 - 히스토리를 활용하여 자연스러운 대화
+            reply = llm_client.generate_chat_response(
+                message=message,
+                history=formatted_history,
+                system_prompt=system_prompt
+            )
+        
+        return _finalize_reply(reply, message, turn)
+            
+    except Exception as e:
+        logger.error(f"LLM 응답 생성 실패: {e}", exc_info=True)
+        return _generate_diverse_fallback(message, has_negative_emotion, has_positive_emotion, formatted_history)
+
+
+async def agenerate_empathic_response(
+    message: str,
+    history: List[Dict],
+    db: Optional[Session] = None,
+    turn_analysis: Optional[Dict] = None
+) -> str:
+    """generate_empathic_response의 비동기 버전 (LLM 호출을 await)"""
+    turn = await _abuild_chat_turn(message, history, db=db, turn_analysis=turn_analysis)
+    
+    try:
+        reply = await llm_client.agenerate_chat_response(
+            message=message,
+            history=turn["history"],
+            system_prompt=turn["system_prompt"]
+        )
+        return _finalize_reply(reply, message, turn)
+    except Exception as e:
+        logger.error(f"LLM 응답 생성 실패: {e}", exc_info=True)
+        return _generate_diverse_fallback(message, turn["has_negative_emotion"], turn["has_positive_emotion"], turn["history"])
+
+
+def _finalize_reply(reply: str, message: str, turn: Dict) -> str:
+    """LLM 응답 검증 및 정제 (부적절하면 fallback 응답)"""
+    has_negative_emotion = turn["has_negative_emotion"]
+    has_positive_emotion = turn["has_positive_emotion"]
+    formatted_history = turn["history"]
+    
+    # 응답 검증 및 정제
+    if reply and reply.strip() and "안녕하세요. 늘봄입니다." not in reply:
+        # 응답이 너무 짧거나 의미 없는 경우 재시도 (fallback보다 LLM 재시도가 나을 수 있으나 비용 문제로 fallback)
+        if len(reply.strip()) < 5:  # 기준 완화
+            logger.warning(f"응답이 너무 짧음: {reply}")
+            # 짧은 응답도 의미가 있을 수 있으므로 일단 반환하되, 너무 이상하면 fallback
+            if not reply.strip():
+                 reply = _generate_diverse_fallback(message, has_negative_emotion, has_positive_emotion, formatted_history)
+        
+        # 응답 정제 (불필요한 접두사 제거)
+        reply = _strip_reply_prefix(reply)
+        
+        logger.info(f"LLM 응답 생성 성공: {len(reply)}자, 응답 시작: {reply[:50]}...")
+        return reply
+    else:
+        logger.warning(f"LLM 응답이 부적절함: {reply} - fallback 사용")
+        return _generate_diverse_fallback(message, has_negative_emotion, has_positive_emotion, formatted_history)
+
+
+def _build_chat_turn(
+    message: str,
+    history: List[Dict],
+    db: Optional[Session] = None,
+    turn_analysis: Optional[Dict] = None
+) -> Dict:
+    """
+    LLM 호출 전 준비 (일반/스트리밍 응답 공용)
+    - 감정 키워드 감지 및 LLM 대화 턴 분석 (위기 감지 단계의 분석 결과가 있으면 재사용)
+    - 복지 정보 관련 질문이면 RAG 검색 결과를 시스템 프롬프트에 추가
+    - 반환: {"has_negative_emotion", "has_positive_emotion", "sentiment_score", "history", "system_prompt"}
+    """
+    has_negative_emotion, has_positive_emotion = _detect_emotions(message)
+    
+    # 위기 감지에서 LLM 분석을 하지 않았고 부정적 감정이 감지된 경우에만 분석
+    if turn_analysis is None and has_negative_emotion:
+        try:
+            turn_analysis = llm_client.analyze_turn(message)
+        except Exception as e:
+            logger.debug(f"감정 분석 실패: {e}")
+    sentiment_score, welfare_intent = _turn_signals(turn_analysis)
+    
+    formatted_history, system_prompt = _build_chat_prompt(message, history, db=db, welfare_intent=welfare_intent)
+    return {
+        "has_negative_emotion": has_negative_emotion,
+        "has_positive_emotion": has_positive_emotion,
+        "sentiment_score": sentiment_score,
+        "history": formatted_history,
+        "system_prompt": system_prompt,
+    }
+
+
+async def _abuild_chat_turn(
+    message: str,
+    history: List[Dict],
+    db: Optional[Session] = None,
+    turn_analysis: Optional[Dict] = None
+) -> Dict:
+    """
+    _build_chat_turn의 비동기 버전
+    - 분석 결과가 있으면 바로 RAG 검색/프롬프트 준비(스레드 풀, DB/FAISS 동기 호출)
+    - 없으면 LLM 대화 턴 분석(await)과 RAG 검색/프롬프트 준비를 동시에 진행 (복지 질문 여부는 키워드로만 판단)
+    """
+    has_negative_emotion, has_positive_emotion = _detect_emotions(message)
+    
+    if turn_analysis is not None or not has_negative_emotion:
+        sentiment_score, welfare_intent = _turn_signals(turn_analysis)
+        formatted_history, system_prompt = await run_in_threadpool(
+            _build_chat_prompt, message, history, db, welfare_intent
+        )
+    else:
+        async def analyze() -> Optional[Dict]:
+            try:
+                return await llm_client.aanalyze_turn(message)
+            except Exception as e:
+                logger.debug(f"감정 분석 실패: {e}")
+                return None
+        
+        turn_analysis, (formatted_history, system_prompt) = await asyncio.gather(
+            analyze(),
+            run_in_threadpool(_build_chat_prompt, message, history, db)
+        )
+        sentiment_score, _ = _turn_signals(turn_analysis)
+    return {
+        "has_negative_emotion": has_negative_emotion,
+        "has_positive_emotion": has_positive_emotion,
+        "sentiment_score": sentiment_score,
+        "history": formatted_history,
+        "system_prompt": system_prompt,
+    }
+
+
+def _turn_signals(turn_analysis: Optional[Dict]) -> Tuple[Optional[float], Optional[bool]]:
+    """대화 턴 분석 결과에서 (감정 점수, 복지 정보 질문 여부) 추출 (분석 결과가 없으면 None)"""
+    if not turn_analysis:
+        return None, None
+    return turn_analysis.get("score", 0.5), turn_analysis.get("welfare_intent")
+
+
+def _detect_emotions(message: str) -> Tuple[bool, bool]:
+    """감정 키워드 감지, 반환: (부정적 감정 여부, 긍정적 감정 여부)"""
     # 부정적 감정 키워드 감지
     negative_keywords = ["힘들", "어려", "스트레스", "우울", "불안", "두려", "외로", 
                          "슬프", "절망", "포기", "짜증", "화나", "답답", "지치"]
@@ -93,39 +489,45 @@ def generate_empathic_response(message: str, history: List[Dict], db: Optional[S
     # 긍정적 감정 키워드 감지
     positive_keywords = ["고마", "감사", "좋", "행복", "기쁘", "즐거", "만족"]
     has_positive_emotion = any(keyword in message for keyword in positive_keywords)
-    
-    # LLM 감정 분석 시도 (부정적 감정이 감지된 경우)
-    sentiment_score = None
-    if has_negative_emotion:
-        try:
-            sentiment_result = llm_client.analyze_sentiment(message)
-            sentiment_score = sentiment_result.get("score", 0.5)
-        except Exception as e:
-            logger.debug(f"감정 분석 실패: {e}")
-            pass
-    
-    # 복지 정보 관련 질문인지 확인 (키워드 기반 간단한 감지)
+    return has_negative_emotion, has_positive_emotion
+
+
+def _build_chat_prompt(
+    message: str,
+    history: List[Dict],
+    db: Optional[Session] = None,
+    welfare_intent: Optional[bool] = None
+) -> Tuple[List[Dict], str]:
+    """
+    히스토리 포맷팅과 시스템 프롬프트 구성 (복지 질문이면 RAG 검색 결과 포함)
+    - welfare_intent: LLM 대화 턴 분석의 복지 정보 질문 여부 (True면 키워드가 없어도 검색)
+    - 반환: (포맷된 히스토리, 시스템 프롬프트)
+    """
+    # 복지 정보 관련 질문인지 확인 (키워드 기반 간단한 감지 + LLM 분석 결과)
     welfare_keywords = ["복지", "지원", "혜택", "수당", "급여", "장학금", "주거", "의료", "보육", "양육", "출산", "청년", "노인", "장애인"]
-    is_welfare_query = any(keyword in message for keyword in welfare_keywords)
+    is_welfare_query = any(keyword in message for keyword in welfare_keywords) or welfare_intent is True
     
     # RAG 엔진을 통해 관련 복지 정보 검색 (복지 관련 질문인 경우)
     welfare_context = None
     if is_welfare_query and db:
         try:
-            welfare_ids = search_context(query=message, limit=5)
-            if welfare_ids:
-                from app.models import models
-                welfares = db.query(models.Welfare).filter(
-                    models.Welfare.id.in_(welfare_ids)
-                ).all()
+            # 하이브리드 검색 (키워드 + 벡터 순위 융합)
+            # 유사도가 낮은 벡터 후보는 제외하여 관련 없는 복지 정보를 프롬프트에 넣지 않음
+            results = hybrid_search(db, message, limit=3, min_vector_score=settings.CHAT_CONTEXT_MIN_SCORE)
+            if results:
+                welfares = get_welfare_cards_by_ids(db, [result["welfare_id"] for result in results])
+                # 청크 검색 시 질문과 가장 비슷했던 원문 문단
+                passages = {result["welfare_id"]: result.get("passage") for result in results}
                 if welfares:
-                    # 상위 3개만 컨텍스트로 사용
+                    # 상위 3개를 컨텍스트로 사용
                     context_texts = []
-                    for welfare in welfares[:3]:
+                    for welfare in welfares:
                         context_text = f"제목: {welfare.title}\n"
                         if welfare.summary:
                             context_text += f"요약: {welfare.summary}\n"
-                        elif welfare.full_text:
+                        if passages.get(welfare.id):
+                            context_text += f"관련 내용: {passages[welfare.id]}\n"
+                        elif not welfare.summary and welfare.full_text:
                             context_text += f"내용: {welfare.full_text[:200]}...\n"
                         context_texts.append(context_text)
                     welfare_context = "\n\n".join(context_texts)
@@ -157,55 +559,15 @@ def generate_empathic_response(message: str, history: List[Dict], db: Optional[S
 
 위 정보를 바탕으로 사용자의 질문에 정확하고 도움이 되는 답변을 제공해주세요."""
     
-    try:
-        # 부정적 감정이 강하게 감지된 경우 CBT 기법 명시적 적용
-        # sentiment_score가 None이어도(감정 분석 실패) 부정적 키워드가 있으면 CBT 적용 시도
-        if has_negative_emotion and (sentiment_score is None or sentiment_score < 0.4):
-            # 히스토리를 고려하여 자연스럽게 응답 생성
-            reply = llm_client.generate_chat_response(
-                message=message,
-                history=formatted_history,
-                system_prompt=system_prompt
-            )
-        elif has_positive_emotion:
-            # 긍정적 감정일 때는 감사 일기 기록 유도
-            reply = llm_client.generate_chat_response(
-                message=message,
-                history=formatted_history,
-                system_prompt=system_prompt
-            )
-        else:
-            # 일반 대화 - 히스토리를 활용하여 자연스러운 대화
-            reply = llm_client.generate_chat_response(
-                message=message,
-                history=formatted_history,
-                system_prompt=system_prompt
-            )
-        
-        # 응답 검증 및 정제
-        if reply and reply.strip() and "안녕하세요. 늘봄입니다." not in reply:
-            # 응답이 너무 짧거나 의미 없는 경우 재시도 (fallback보다 LLM 재시도가 나을 수 있으나 비용 문제로 fallback)
-            if len(reply.strip()) < 5:  # 기준 완화
-                logger.warning(f"응답이 너무 짧음: {reply}")
-                # 짧은 응답도 의미가 있을 수 있으므로 일단 반환하되, 너무 이상하면 fallback
-                if not reply.strip():
-                     reply = _generate_diverse_fallback(message, has_negative_emotion, has_positive_emotion, formatted_history)
-            
-            # 응답 정제 (불필요한 접두사 제거)
-            reply = reply.strip()
-            # "늘봄:" 같은 접두사 제거
-            if reply.startswith("늘봄:"):
-                reply = reply[3:].strip()
-            
-            logger.info(f"LLM 응답 생성 성공: {len(reply)}자, 응답 시작: {reply[:50]}...")
-            return reply
-        else:
-            logger.warning(f"LLM 응답이 부적절함: {reply} - fallback 사용")
-            return _generate_diverse_fallback(message, has_negative_emotion, has_positive_emotion, formatted_history)
-            
-    except Exception as e:
-        logger.error(f"LLM 응답 생성 실패: {e}", exc_info=True)
-        return _generate_diverse_fallback(message, has_negative_emotion, has_positive_emotion, formatted_history)
+    return formatted_history, system_prompt
+
+
+def _strip_reply_prefix(reply: str) -> str:
+    """응답 앞뒤 공백과 "늘봄:" 같은 접두사 제거"""
+    reply = reply.strip()
+    if reply.startswith("늘봄:"):
+        reply = reply[3:].strip()
+    return reply
 
 
 def _generate_diverse_fallback(message: str, has_negative: bool, has_positive: bool, history: List[Dict]) -> str:
@@ -11,6 +11,7 @@ import logging
 from app.models import models, schema
 from app.models.crud import create_post, get_posts, get_post_by_id
 from app.ai_core.safety_guard import detect_crisis, analyze_crisis_level
+from app.ai_core.rate_limiter import llm_priority, PRIORITY_MODERATION
 from app.utils.db_utils import safe_rollback
 
 logger = logging.getLogger(__name__)
@@ -35,7 +36,8 @@ def create_post_with_ai_check(
     try:
         # AI 위기 감지 (실패해도 게시글 작성은 계속 진행)
         try:
-            crisis_analysis = analyze_crisis_level(post_data.content)
+            with llm_priority(PRIORITY_MODERATION):
+                crisis_analysis = analyze_crisis_level(post_data.content)
             is_crisis = crisis_analysis.get("is_crisis", False)
             
             # 고위험 게시글은 차단
@@ -8,6 +8,7 @@ import re
 from typing import Dict, Optional, Any
 from sqlalchemy.orm import Session
 from app.ai_core.llm_client import llm_client
+from app.ai_core.rate_limiter import llm_priority, PRIORITY_MODERATION
 from app.ai_core.prompts import VERIFICATION_PROMPT
 from app.utils.db_utils import safe_rollback, safe_commit
 
@@ -39,13 +40,14 @@ def verify_with_ai(verification_text: str) -> Dict[str, Any]:
         # 프롬프트 생성
         prompt = VERIFICATION_PROMPT.format(text=verification_text)
         
-        # LLM 호출 (시스템 프롬프트 없이 직접 프롬프트 사용)
-        response = llm_client.generate_chat_response(
-            message=prompt,
-            history=[],
-            system_prompt="당신은 커뮤니티 가입 심사를 담당하는 AI입니다. 제출된 글을 분석하여 승인 또는 거절을 결정합니다.",
-            provider=None  # 기본 provider 사용
-        )
+        # LLM 호출 (시스템 프롬프트 없이 직접 프롬프트 사용, 챗봇 요청보다 낮은 우선순위)
+        with llm_priority(PRIORITY_MODERATION):
+            response = llm_client.generate_chat_response(
+                message=prompt,
+                history=[],
+                system_prompt="당신은 커뮤니티 가입 심사를 담당하는 AI입니다. 제출된 글을 분석하여 승인 또는 거절을 결정합니다.",
+                provider=None  # 기본 provider 사용
+            )
         
         logger.info(f"AI 심사 응답: {response}")
         
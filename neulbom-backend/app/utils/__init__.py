@@ -3,6 +3,9 @@
 - 데이터베이스 유틸리티
 - 입력 검증
 - 응답 생성 헬퍼
+- 벡터 직렬화
+- 읽기/쓰기 잠금
+- 중복 호출 합치기
 """
 
 from app.utils.db_utils import (
@@ -21,8 +24,16 @@ from app.utils.response_helpers import (
     create_post_response,
     create_posts_response,
     create_comment_response,
-    create_comments_response
+    create_comments_response,
+    create_welfare_item,
+    create_bookmark_items
 )
+from app.utils.vector_utils import (
+    encode_vector,
+    decode_vector
+)
+from app.utils.rwlock import ReadWriteLock
+from app.utils.singleflight import SingleFlight
 
 __all__ = [
     # DB Utils
@@ -40,6 +51,14 @@ __all__ = [
     "create_posts_response",
     "create_comment_response",
     "create_comments_response",
+    "create_welfare_item",
+    "create_bookmark_items",
+    # Vector Utils
+    "encode_vector",
+    "decode_vector",
+    # Locks
+    "ReadWriteLock",
+    "SingleFlight",
 ]
 
 
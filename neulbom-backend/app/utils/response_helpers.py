@@ -88,3 +88,46 @@ def create_comments_response(comments: List[models.Comment]) -> List[schema.Comm
     """
     return [create_comment_response(comment) for comment in comments]
 
+
+def create_welfare_item(welfare) -> schema.WelfareItem:
+    """
+    복지 정보(모델 또는 카드 행)를 WelfareItem으로 변환 (summary 정제 포함)
+    
+    Args:
+        welfare: Welfare 모델 인스턴스 또는 crud의 카드 조회 결과 행
+        
+    Returns:
+        WelfareItem 스키마
+    """
+    return schema.WelfareItem(
+        id=welfare.id,
+        title=welfare.title,
+        summary=schema.clean_welfare_summary(welfare.summary, welfare.full_text),
+        source_link=welfare.source_link,
+        region=welfare.region,
+        apply_start=welfare.apply_start,
+        apply_end=welfare.apply_end,
+        is_always=welfare.is_always,
+        status=welfare.status,
+    )
+
+
+def create_bookmark_items(bookmarks) -> List[schema.BookmarkItem]:
+    """
+    북마크 카드 행(crud.get_user_bookmarks 결과)을 BookmarkItem 리스트로 변환
+    
+    Args:
+        bookmarks: (bookmark_id, bookmarked_at, 복지 정보 카드 컬럼) 행 리스트
+        
+    Returns:
+        BookmarkItem 스키마 리스트
+    """
+    return [
+        schema.BookmarkItem(
+            id=bookmark.bookmark_id,
+            welfare_id=bookmark.id,
+            welfare=create_welfare_item(bookmark),
+            created_at=bookmark.bookmarked_at,
+        )
+        for bookmark in bookmarks
+    ]
@@ -0,0 +1,100 @@
+"""
+읽기/쓰기 잠금 유틸리티
+- 여러 스레드가 동시에 읽고, 쓰기는 혼자 수행
+- 쓰기 대기 중이면 새 읽기를 막아 쓰기가 굶지 않도록 함 (쓰기 우선)
+- 잠금 대기/보유 시간 통계 수집
+"""
+
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class ReadWriteLock:
+    """쓰기 우선 읽기/쓰기 잠금 (재진입 불가)"""
+
+    def __init__(self, name: str = "rwlock", warn_wait_seconds: Optional[float] = None):
+        """
+        name: 로그/통계에 표시할 이름
+        warn_wait_seconds: 대기 시간이 이 값을 넘으면 경고 로그 (None이면 기록하지 않음)
+        """
+        self.name = name
+        self.warn_wait_seconds = warn_wait_seconds
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+        self._stats = {
+            "read_acquires": 0,
+            "write_acquires": 0,
+            "read_wait_seconds": 0.0,
+            "write_wait_seconds": 0.0,
+            "max_read_wait_seconds": 0.0,
+            "max_write_wait_seconds": 0.0,
+            "write_hold_seconds": 0.0,
+            "max_write_hold_seconds": 0.0,
+        }
+
+    @contextmanager
+    def read_lock(self) -> Iterator[None]:
+        """읽기 잠금 (다른 읽기와 동시 보유 가능)"""
+        started = time.perf_counter()
+        with self._cond:
+            while self._writer or self._waiting_writers:
+                self._cond.wait()
+            self._readers += 1
+            self._record_wait("read", time.perf_counter() - started)
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write_lock(self) -> Iterator[None]:
+        """쓰기 잠금 (읽기/쓰기 모두 배타)"""
+        started = time.perf_counter()
+        with self._cond:
+            self._waiting_writers += 1
+            try:
+                while self._writer or self._readers:
+                    self._cond.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = True
+            self._record_wait("write", time.perf_counter() - started)
+        acquired = time.perf_counter()
+        try:
+            yield
+        finally:
+            held = time.perf_counter() - acquired
+            with self._cond:
+                self._writer = False
+                self._stats["write_hold_seconds"] += held
+                self._stats["max_write_hold_seconds"] = max(self._stats["max_write_hold_seconds"], held)
+                self._cond.notify_all()
+
+    def _record_wait(self, kind: str, waited: float):
+        """대기 시간 기록 (호출 측에서 _cond 보유)"""
+        self._stats[f"{kind}_acquires"] += 1
+        self._stats[f"{kind}_wait_seconds"] += waited
+        self._stats[f"max_{kind}_wait_seconds"] = max(self._stats[f"max_{kind}_wait_seconds"], waited)
+        if self.warn_wait_seconds is not None and waited > self.warn_wait_seconds:
+            logger.warning(f"{self.name} {kind} 잠금 대기 {waited * 1000:.1f}ms")
+
+    def get_stats(self) -> Dict:
+        """잠금 획득 수, 대기/보유 시간 통계 (평균은 ms 단위)"""
+        with self._cond:
+            stats = dict(self._stats)
+            stats["active_readers"] = self._readers
+            stats["waiting_writers"] = self._waiting_writers
+        for kind in ("read", "write"):
+            count = stats[f"{kind}_acquires"]
+            stats[f"avg_{kind}_wait_ms"] = round(stats[f"{kind}_wait_seconds"] / count * 1000, 3) if count else 0.0
+        return stats
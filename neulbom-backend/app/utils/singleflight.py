@@ -0,0 +1,68 @@
+"""
+중복 호출 합치기 (single-flight)
+- 같은 키로 동시에 들어온 호출 중 첫 호출만 실제로 실행
+- 나머지 호출은 그 결과(또는 예외)를 기다렸다가 그대로 받음
+"""
+
+from typing import Any, Callable, Dict, Hashable, Optional
+import threading
+
+
+class _Call:
+    """진행 중인 호출 하나 (완료 이벤트, 결과, 예외, 합쳐진 대기자 수)"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """키별 중복 호출 합치기"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._stats = {"calls": 0, "coalesced": 0}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        key에 대해 진행 중인 호출이 있으면 그 결과를 기다려 반환, 없으면 fn()을 실행
+        - fn이 예외를 던지면 기다리던 호출에도 같은 예외를 전달
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self._stats["coalesced"] += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self._stats["calls"] += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def get_stats(self) -> Dict:
+        """실제 실행 수, 합쳐진 호출 수, 현재 진행 중인 키 수"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["in_flight"] = len(self._calls)
+        return stats
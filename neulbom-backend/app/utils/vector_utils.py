@@ -0,0 +1,49 @@
+"""
+벡터 직렬화 유틸리티
+- 임베딩을 DB에 저장하기 위한 바이너리 인코딩/디코딩
+"""
+
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+SUPPORTED_VECTOR_DTYPES = ("float32", "float16")
+
+
+def encode_vector(
+    vector: Union[Sequence[float], np.ndarray],
+    dtype: str = "float32"
+) -> bytes:
+    """
+    임베딩을 바이너리(blob)로 변환
+
+    Args:
+        vector: 1차원 벡터
+        dtype: 저장 타입 ("float32" 또는 "float16")
+
+    Returns:
+        리틀엔디언 바이트 배열
+    """
+    if dtype not in SUPPORTED_VECTOR_DTYPES:
+        raise ValueError(f"지원하지 않는 벡터 타입입니다: {dtype}")
+    return np.asarray(vector, dtype=np.dtype(dtype).newbyteorder("<")).tobytes()
+
+
+def decode_vector(blob: bytes, dtype: str = "float32", dimension: Optional[int] = None) -> np.ndarray:
+    """
+    바이너리(blob)를 float32 벡터로 복원
+
+    Args:
+        blob: encode_vector로 저장한 바이트
+        dtype: 저장 당시 타입
+        dimension: 기대 차원 (지정 시 검증)
+
+    Returns:
+        float32 numpy 배열
+    """
+    if dtype not in SUPPORTED_VECTOR_DTYPES:
+        raise ValueError(f"지원하지 않는 벡터 타입입니다: {dtype}")
+    vector = np.frombuffer(blob, dtype=np.dtype(dtype).newbyteorder("<")).astype(np.float32)
+    if dimension is not None and vector.shape[0] != dimension:
+        raise ValueError(f"벡터 차원이 맞지 않습니다. 예상: {dimension}, 실제: {vector.shape[0]}")
+    return vector